@@ -1,22 +1,29 @@
-import yaml
+from array import array
 from pathlib import Path
 from collections import Counter
-from typing import List, Dict, Any
+from itertools import repeat
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 import os, re
 
 from src.ZipParser import IGNORED_DIRS, IGNORED_EXTS, IGNORED_FILES
-
-CONFIG_DIR = Path(__file__).parent / "config"
-LANG_FILE = CONFIG_DIR / "languages.yml"
-MARKUP_FILE = CONFIG_DIR / "markup_languages.yml"
-CATEGORIES_FILE = CONFIG_DIR / "categories.yml"
-
-
-def load_yaml(path: Path) -> dict:
-    """Helper function for safely loading yaml."""
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+from src.pattern_automaton import first_id
+from src.rule_bundle import (
+    CONFIG_DIR,
+    LANG_FILE,
+    MARKUP_FILE,
+    CATEGORIES_FILE,
+    CategoryRules,
+    build_language_map,
+    expand_category_sources,
+    get_rule_bundle,
+    load_yaml,
+)
+
+# Name-based test heuristics of _classify_test_like as one pattern (on the
+# lowercased file name): "test"/"tests" as a word, which also covers test_*,
+# *_test.<ext>, .test. and test-*, plus .spec. / .fixture.
+_TEST_NAME_RE = re.compile(r"(?:^|[^a-z0-9])tests?(?:[^a-z0-9]|$)|\.(?:spec|fixture)\.")
 
 
 """
@@ -29,8 +36,9 @@ to determine how files should be categorized based on their path, file extension
 It is the primary class responsible for categorizing files and computing project-level file metrics.
 
 Core functionality:
-- YAML Loading: Loads mappings of programming and markup languages, as well as file category definitions.
+- Rules: Uses the process-wide compiled rule bundle (src/rule_bundle.py), so the YAML is parsed once, not per instance.
 - Classification (`classify_file`): Determines the category of a file by checking its path, extension, or language.
+- Batch classification (`classify_many`): Same rules for many paths, returned as compact category codes.
 - Metrics Computation (`compute_metrics`): Classifies a list of files and computes counts and percentages per category.
 """
 
@@ -40,13 +48,14 @@ class FileCategorizer:
     categories.yml, languages.yml, and markup_languages.yml.
     """
 
-    def __init__(self):
-        # Loading YAML configs
-        categories_all = load_yaml(CATEGORIES_FILE)
-        self.languages_yaml = load_yaml(LANG_FILE)["languages"]
-        self.markup_yaml = load_yaml(MARKUP_FILE)["markup_languages"]
-        self.categories_yaml = categories_all["categories"]
-        self.no_ext_rules = categories_all.get("no_extension_rules", {})
+    def __init__(self, rules: Optional[CategoryRules] = None):
+        # Compiled YAML rules, shared by every instance unless given explicitly
+        rules = rules or get_rule_bundle().categories
+        self.rules = rules
+        self.languages_yaml = rules.languages
+        self.markup_yaml = rules.markup_languages
+        self.categories_yaml = rules.raw_categories
+        self.no_ext_rules = rules.no_extension_rules
 
         # IGNORED directories/extensions/files loaded via shared ZipParser config.
         # Keep attributes for backwards compatibility (e.g. ProjectMetadataExtractor).
@@ -54,29 +63,23 @@ class FileCategorizer:
         self.ignored_exts = IGNORED_EXTS
         self.ignored_filenames = {f.lower() for f in IGNORED_FILES}
 
-        # Building extension -> Language maps
-        self.language_map = self._build_language_map(self.languages_yaml)
-        self.markup_map = self._build_language_map(self.markup_yaml)
+        # Extension -> Language maps
+        self.language_map = rules.language_map
+        self.markup_map = rules.markup_map
 
-        # Extending 'language_source' into real lists
-        self.categories = self._expand_category_sources(self.categories_yaml)
+        # Categories with 'language_source' expanded into real lists
+        self.categories = rules.categories
 
         # Pre-built fast lookup tables — avoids per-call list rebuilds and loops
-        self._ext_to_category: Dict[str, str] = {}
-        self._lang_to_category: Dict[str, str] = {}
-        self._category_path_patterns: List[tuple] = []  # [(category, [patterns])]
-        self._build_fast_lookups()
-
-    
-    def _build_fast_lookups(self):
-        """Pre-compute extension and language -> category maps for O(1) classify_file lookups."""
-        for category, conf in self.categories.items():
-            for ext in conf.get("extensions", []):
-                self._ext_to_category.setdefault(ext.lower(), category)
-            for lang in conf.get("languages", []):
-                self._lang_to_category.setdefault(lang, category)
-            if "path_patterns" in conf:
-                self._category_path_patterns.append((category, conf["path_patterns"]))
+        self._ext_to_category = rules.ext_to_category
+        self._lang_to_category = rules.lang_to_category
+        self._category_path_patterns = rules.path_patterns  # ((category, (patterns,)),)
+        self._path_automaton = rules.path_automaton
+        self._path_pattern_categories = rules.path_pattern_categories
+
+        # Category codes used by classify_many: code i means category_names[i]
+        self.category_names = rules.category_names
+        self._category_codes = {name: i for i, name in enumerate(self.category_names)}
 
     # ------------------------------------------------------------------
     # Ignore helpers
@@ -97,35 +100,21 @@ class FileCategorizer:
 
     def _build_language_map(self, lang_dict: Dict[str, dict]) -> Dict[str, str]:
         """Converts language -> extensions dict into extension -> language."""
-        mapping: Dict[str, str] = {}
-        for lang, conf in lang_dict.items():
-            for ext in conf.get("extensions", []):
-                mapping[ext.lower()] = lang
-        return mapping
+        return build_language_map(lang_dict)
 
     def _expand_category_sources(self, categories: Dict[str, dict]) -> Dict[str, dict]:
         """Resolves any 'language_source' references (e.g. 'languages', 'markup_languages', 'all')."""
-        expanded: Dict[str, dict] = {}
-        for cat, conf in categories.items():
-            conf = conf.copy()
-            src = conf.get("language_source")
-
-            if src == "languages":
-                conf["languages"] = list(self.languages_yaml.keys())
-            elif src == "markup_languages":
-                conf["languages"] = list(self.markup_yaml.keys())
-            elif src == "all":
-                conf["languages"] = list(self.languages_yaml.keys()) + list(
-                    self.markup_yaml.keys()
-                )
-
-            expanded[cat] = conf
-        return expanded
+        return expand_category_sources(categories, self.languages_yaml, self.markup_yaml)
 
     def _match_path_patterns(self, path: str, patterns: List[str]) -> bool:
         path_l = path.lower()
         return any(p.lower() in path_l for p in patterns)
 
+    def _match_path_category(self, path: str) -> Optional[str]:
+        """First category (in YAML order) with a path pattern occurring in `path`."""
+        pattern_id = first_id(self._path_automaton.scan(path.lower()))
+        return self._path_pattern_categories[pattern_id] if pattern_id >= 0 else None
+
     def _should_ignore(self, path: str) -> bool:
         """Checks if path contains any of the ignored directories or ignored extensions/filenames."""
         lower = path.replace("\\", "/").lower()
@@ -202,11 +191,93 @@ class FileCategorizer:
             return self._lang_to_category[lang]
 
         # Slow path: path pattern matching (only reached if ext/lang didn't match)
-        for category, patterns in self._category_path_patterns:
-            if self._match_path_patterns(path, patterns):
-                return category
+        return self._match_path_category(path) or "other"
 
-        return "other"
+    def classify_many(
+        self,
+        paths: Sequence[str],
+        languages: Optional[Sequence[Optional[str]]] = None,
+    ) -> "array[int]":
+        """
+        Classify many paths at once, with the same results as classify_file.
+
+        Returns one code per path as a compact array; code i is the category
+        self.category_names[i]. `languages`, if given, runs parallel to `paths`.
+
+        Decisions that depend only on the directory (ignored dirs, test dirs)
+        or only on the file name and language (ignored names, test name
+        heuristics, extension/language category) are made once per distinct
+        directory or (name, language) pair and reused across the batch.
+        """
+        codes = array("B" if len(self.category_names) <= 256 else "H")
+        category_codes = self._category_codes
+        ignored_code = category_codes["ignored"]
+        test_code = category_codes["test"]
+
+        dir_decisions: Dict[str, Tuple[bool, bool]] = {}
+        name_decisions: Dict[Tuple[str, str], Tuple[Optional[int], Optional[int]]] = {}
+
+        lang_iter = repeat(None) if languages is None else languages
+        for path, language in zip(paths, lang_iter, strict=languages is not None):
+            lang = (language or "").strip()
+            slash = path.rfind("/")
+            name = path[slash + 1:]
+            if not name or "\\" in path:
+                # Unusual shapes keep the exact single-file semantics
+                codes.append(category_codes[self.classify_file({"path": path, "language": lang})])
+                continue
+
+            dir_part = path[:slash + 1]
+            ignored_dir, test_dir = dir_decisions.get(dir_part) or dir_decisions.setdefault(
+                dir_part, self._directory_decision(dir_part)
+            )
+            if ignored_dir:
+                codes.append(ignored_code)
+                continue
+
+            key = (name, lang)
+            decided, by_name = name_decisions.get(key) or name_decisions.setdefault(
+                key, self._name_decision(name, lang)
+            )
+            if decided is not None:
+                codes.append(decided)
+            elif test_dir:
+                codes.append(test_code)
+            elif by_name is not None:
+                codes.append(by_name)
+            else:
+                # Slow path: full-path pattern matching
+                codes.append(category_codes[self._match_path_category(path) or "other"])
+
+        return codes
+
+    def _directory_decision(self, dir_part: str) -> Tuple[bool, bool]:
+        """(is ignored, is a test directory) for a directory prefix ending in '/'."""
+        lower = dir_part.lower()
+        ignored = not self.ignored_dirs.isdisjoint(lower.split("/"))
+        test_dir = "/tests/" in lower or "/test/" in lower or "__tests__" in lower
+        return ignored, test_dir
+
+    def _name_decision(self, name: str, lang: str) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Per-(file name, language) part of classify_file, as two codes:
+          - a final result that outranks test directories (ignored / no extension)
+          - the result when not in a test directory (None: needs path patterns)
+        """
+        codes = self._category_codes
+        if self._should_ignore(name):
+            return codes["ignored"], None
+        dot = name.rfind(".")
+        ext = name[dot + 1:].lower() if dot != -1 else ""
+        if not ext:
+            return codes[self._classify_no_extension(name)], None
+        if _TEST_NAME_RE.search(name.lower()):
+            return None, codes["test"]
+        if ext in self._ext_to_category:
+            return None, codes[self._ext_to_category[ext]]
+        if lang and lang in self._lang_to_category:
+            return None, codes[self._lang_to_category[lang]]
+        return None, None
 
     def _classify_test_like(self, path: str, lang: str, ext: str) -> str:
         """
@@ -260,8 +331,12 @@ class FileCategorizer:
 
     def compute_metrics(self, files: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
         """Classifies the files and computes the count/percent metrics."""
-        categories = [self.classify_file(f) for f in files]
-        counts = Counter(categories)
+        codes = self.classify_many(
+            [f.get("path", "") for f in files],
+            [f.get("language") for f in files],
+        )
+        names = self.category_names
+        counts = Counter({names[code]: n for code, n in Counter(codes).items()})
         total = sum(counts.values()) or 1
 
         percentages = {
@@ -1,4 +1,7 @@
 import math
+from datetime import datetime, timezone
+from typing import Optional
+
 from src.models.Project import Project
 import json
 
@@ -8,6 +11,15 @@ class ProjectRanker:
     value from a recruiter's perspective.
     """
     DISPLAY_BENCHMARK_MAX = 75.0
+    # Recency points decay linearly to zero over 3 years
+    MAX_RECENCY = 10.0
+    RECENCY_DECAY_DAYS = 109.5  # 10 points / (3 * 365 / 10)
+
+    # Project fields calculate_base_score() reads
+    BASE_SCORE_FIELDS = (
+        "testing_discipline_score", "documentation_habits_score", "modularity_score", "language_depth_score",
+        "total_loc", "collaboration_status", "test_file_ratio", "comment_ratio",
+    )
 
     def __init__(self, project: Project):
         self.project = project
@@ -22,10 +34,25 @@ class ProjectRanker:
         - Collaboration status.
         - Recency of contributions.
 
+        The recency part changes with time, so the rest is also kept as the
+        project's base_score; rankings add recency when they are read (see
+        ProjectManager.get_ranked).
+
         Returns:
             A final score for the project. The score is normalized to a
             reasonable range, but is not strictly capped. Higher is better.
         """
+        base = self.calculate_base_score()
+        score = base + self.recency_score(self.project.last_modified)
+
+        self.project.base_score = base
+        self.project.resume_score = score
+        print(f"ProjectRanker: Final calculated score = {score:.2f}")
+
+        return score
+
+    def calculate_base_score(self) -> float:
+        """The score without its recency part; only depends on BASE_SCORE_FIELDS."""
         score = 0.0
         project = self.project
 
@@ -48,16 +75,7 @@ class ProjectRanker:
         if project.collaboration_status == "collaborative":
             score += 10
 
-        # 4. Recency (Max: 10 points)
-        # More recent projects are more relevant.
-        if project.last_modified:
-            from datetime import datetime, timezone
-            days_since_modified = (datetime.now(timezone.utc) - project.last_modified.replace(tzinfo=timezone.utc)).days
-            # Score decays over 3 years.
-            recency_score = max(0, 10 - (days_since_modified / 109.5)) # 10 points / (3 * 365 / 10)
-            score += recency_score
-
-        # 5. Best Practices (Max: 10 points)
+        # 4. Best Practices (Max: 10 points)
         # Good ratios for tests and comments are a plus.
         # Ideal test ratio: 15-30%. Score is highest in this range.
         if 0.15 <= project.test_file_ratio <= 0.30:
@@ -66,11 +84,21 @@ class ProjectRanker:
         if 0.10 <= project.comment_ratio <= 0.20:
             score += 5
 
-        self.project.resume_score = score
-        print(f"ProjectRanker: Final calculated score = {score:.2f}")
-
         return score
 
+    @classmethod
+    def recency_score(cls, last_modified: Optional[datetime], now: Optional[datetime] = None) -> float:
+        """
+        Recency points (Max: 10) for a project last modified at `last_modified`.
+        More recent projects are more relevant. Naive times are taken as UTC.
+        """
+        if not last_modified:
+            return 0.0
+        now = now or datetime.now(timezone.utc)
+        days_since_modified = (now.replace(tzinfo=now.tzinfo or timezone.utc) - last_modified.replace(tzinfo=timezone.utc)).days
+        # Capped, so a ranking can bound how much recency adds to a base score
+        return min(cls.MAX_RECENCY, max(0.0, cls.MAX_RECENCY - days_since_modified / cls.RECENCY_DECAY_DAYS))
+
     def format_display_ratio(self, benchmark_max: float | None = None) -> str:
         """
         Returns the score as a ratio string for UI copy, e.g. "58.1/75".
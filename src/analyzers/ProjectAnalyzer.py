@@ -22,7 +22,9 @@ from src.analyzers.language_detector import detect_language_per_file, analyze_la
 from src.analyzers.contribution_analyzer import ContributionAnalyzer, ContributionStats
 from utils.RepoFinder import RepoFinder
 from src.managers.ProjectManager import ProjectManager
+from src.managers.AuthorManager import AuthorManager
 from src.managers.FileHashManager import FileHashManager
+from src.managers.ImportBatchManager import ImportBatchManager
 from src.models.Project import Project
 from src.models.Report import Report
 from src.models.ReportProject import ReportProject, PortfolioDetails
@@ -56,7 +58,10 @@ class ProjectAnalyzer:
         self.file_categorizer = FileCategorizer()
         self.repo_finder = RepoFinder()
         self.project_manager = ProjectManager()
+        self.author_manager = AuthorManager()
+        self._import_seen_authors()
         self.file_hash_manager = FileHashManager()
+        self.import_batch_manager = ImportBatchManager()
         self.contribution_analyzer = ContributionAnalyzer()
 
         self.cached_extract_dir: Optional[Path] = None
@@ -139,27 +144,11 @@ class ProjectAnalyzer:
                 file_path = Path(root) / name
                 file_hash = compute_file_hash(file_path)
                 if file_hash:
-                    entries.append((file_hash, str(file_path), project.name))
+                    entries.append((file_hash, str(file_path)))
 
-        result = self.file_hash_manager.register_hashes_batch(entries)
-        return result
+        return self.file_hash_manager.register_project_hashes(project.name, entries)
 
 
-    def _ensure_scores_are_calculated(self) -> List[Project]:
-        """
-        Checks for projects with a zero score, runs skill analysis on them silently,
-        and returns a complete list of all projects with their updated scores.
-        """
-        all_projects = self._get_projects()
-        projects_needing_score = [p for p in all_projects if p.resume_score == 0]
-
-        if projects_needing_score:
-            self.analyze_skills(projects=projects_needing_score, silent=True)
-            self.cached_projects = []
-            all_projects = self._get_projects()
-
-        return all_projects
-
     def _select_project(self, prompt: str) -> Optional[Project]:
         """
         A generic helper to display a numbered list of projects and have the user select one.
@@ -254,6 +243,8 @@ class ProjectAnalyzer:
         """Extracts the ZIP to a temp directory if not already done."""
         if self.cached_extract_dir is None:
             self.cached_extract_dir = Path(extract_zip(str(self.zip_path)))
+            # Kept while the batch's projects may still be re-analyzed, see services/retention_service.py
+            self.import_batch_manager.record(self.import_batch_id, str(self.cached_extract_dir))
         return self.cached_extract_dir
 
     def initialize_projects(self) -> List[Project]:
@@ -269,54 +260,61 @@ class ProjectAnalyzer:
             print("No projects found to build.")
             return []
         print(f"Found {len(projects_from_builder)} project(s). Saving initial records...")
+        # Files of projects deleted since this analyzer was created must count as new again
+        self.file_hash_manager.refresh()
         changed_names: set = set()
-        for proj_new in projects_from_builder:
-            if summary := self._get_zip_project_summary(proj_new.name):
-                if summary.get("total_files") is not None:
-                    proj_new.num_files = int(summary["total_files"])
-                if summary.get("total_size_kb") is not None:
-                    proj_new.size_kb = int(summary["total_size_kb"])
-                if summary.get("start_date"):
-                    proj_new.date_created = datetime.strptime(summary["start_date"], "%Y-%m-%d")
-                if summary.get("end_date"):
-                    proj_new.last_modified = datetime.strptime(summary["end_date"], "%Y-%m-%d")
-
-            proj_existing = self.project_manager.get_by_name(proj_new.name)
-            proj_new.import_batch_id = self.import_batch_id
-
-            if proj_existing:
-                proj_existing.import_batch_id = self.import_batch_id
-                changed = self._has_project_changed(proj_new)
-                if changed:
-                    proj_existing.file_path, proj_existing.root_folder = proj_new.file_path, proj_new.root_folder
-                    if proj_new.num_files:
-                        proj_existing.num_files = proj_new.num_files
-                    if proj_new.size_kb:
-                        proj_existing.size_kb = proj_new.size_kb
-                    if proj_new.date_created and not proj_existing.date_created:
-                        proj_existing.date_created = proj_new.date_created
-                    if proj_new.last_modified:
-                        proj_existing.last_modified = proj_new.last_modified
-                    proj_existing.last_accessed = datetime.now()
-                    self.project_manager.set(proj_existing)
-                    self._register_project_files(proj_existing)
-                    changed_names.add(proj_existing.name)
-                    print(f"  - Updated existing project: {proj_existing.name}")
-                else:
-                    proj_existing.last_accessed = datetime.now()
-                    proj_existing.file_path = proj_new.file_path
-                    proj_existing.root_folder = proj_new.root_folder
-                    self.project_manager.set(proj_existing)
-                    print(f"  - No changes detected, refreshed batch for: {proj_existing.name}")
-                created_projects.append(proj_existing)
-            else:
-                proj_new.last_accessed = datetime.now()
+        new_projects: List[Project] = []
+        with self.project_manager.unit_of_work():
+            for proj_new in projects_from_builder:
+                if summary := self._get_zip_project_summary(proj_new.name):
+                    if summary.get("total_files") is not None:
+                        proj_new.num_files = int(summary["total_files"])
+                    if summary.get("total_size_kb") is not None:
+                        proj_new.size_kb = int(summary["total_size_kb"])
+                    if summary.get("start_date"):
+                        proj_new.date_created = datetime.strptime(summary["start_date"], "%Y-%m-%d")
+                    if summary.get("end_date"):
+                        proj_new.last_modified = datetime.strptime(summary["end_date"], "%Y-%m-%d")
+
+                proj_existing = self.project_manager.get_by_name(proj_new.name)
                 proj_new.import_batch_id = self.import_batch_id
-                self.project_manager.set(proj_new)
-                self._register_project_files(proj_new)
-                changed_names.add(proj_new.name)
-                print(f"  - Created new project record: {proj_new.name} with ID {proj_new.id}")
-                created_projects.append(proj_new)
+
+                if proj_existing:
+                    proj_existing.import_batch_id = self.import_batch_id
+                    changed = self._has_project_changed(proj_new)
+                    if changed:
+                        proj_existing.file_path, proj_existing.root_folder = proj_new.file_path, proj_new.root_folder
+                        if proj_new.num_files:
+                            proj_existing.num_files = proj_new.num_files
+                        if proj_new.size_kb:
+                            proj_existing.size_kb = proj_new.size_kb
+                        if proj_new.date_created and not proj_existing.date_created:
+                            proj_existing.date_created = proj_new.date_created
+                        if proj_new.last_modified:
+                            proj_existing.last_modified = proj_new.last_modified
+                        proj_existing.last_accessed = datetime.now()
+                        self.project_manager.set(proj_existing)
+                        self._register_project_files(proj_existing)
+                        changed_names.add(proj_existing.name)
+                        print(f"  - Updated existing project: {proj_existing.name}")
+                    else:
+                        proj_existing.last_accessed = datetime.now()
+                        proj_existing.file_path = proj_new.file_path
+                        proj_existing.root_folder = proj_new.root_folder
+                        self.project_manager.set(proj_existing)
+                        print(f"  - No changes detected, refreshed batch for: {proj_existing.name}")
+                    created_projects.append(proj_existing)
+                else:
+                    proj_new.last_accessed = datetime.now()
+                    proj_new.import_batch_id = self.import_batch_id
+                    self.project_manager.set(proj_new)
+                    self._register_project_files(proj_new)
+                    changed_names.add(proj_new.name)
+                    new_projects.append(proj_new)
+                    created_projects.append(proj_new)
+        # IDs of new records are assigned when the unit of work is flushed
+        for proj_new in new_projects:
+            print(f"  - Created new project record: {proj_new.name} with ID {proj_new.id}")
         self.cached_projects = created_projects
         self.changed_project_names = changed_names
         return created_projects
@@ -358,25 +356,12 @@ class ProjectAnalyzer:
             print("\nOperation cancelled by user.")
             return None
 
-    def _update_seen_authors(self, author_map: Dict[str, str]) -> None:
-        """Merge new email→name pairs into the seen_authors config dict."""
-        existing: Dict[str, str] = self._config_manager.get("seen_authors") or {}
-        updated = {**author_map, **existing}  # existing names win on conflict
-        if updated != existing:
-            self._config_manager.set("seen_authors", updated)
-
-    def rebuild_seen_authors(self) -> None:
-        """Rescan all projects' git histories and rebuild seen_authors from scratch."""
-        all_authors: Dict[str, str] = {}
-        for project in self._get_projects():
-            repo_path = Path(project.file_path)
-            if (repo_path / ".git").exists():
-                with self.suppress_output():
-                    author_map = self.contribution_analyzer.get_name_map(
-                        str(repo_path), config_manager=self._config_manager
-                    )
-                all_authors.update(author_map)
-        self._config_manager.set("seen_authors", all_authors)
+    def _import_seen_authors(self) -> None:
+        """Move a seen_authors dict left in config by older versions into the authors table."""
+        legacy = self._config_manager.get("seen_authors")
+        if isinstance(legacy, dict):
+            self.author_manager.add_authors(legacy)
+            self._config_manager.delete("seen_authors")
 
     def _auto_detect_user_emails(self, author_map: Dict[str, str]) -> List[str]:
         """
@@ -503,116 +488,117 @@ class ProjectAnalyzer:
         if not target_projects:
             return pending_duplicates, pending_identity
 
-        for project in target_projects:
-            repo_path = Path(project.file_path)
-            if not (repo_path / ".git").exists():
-                continue
+        with self.project_manager.unit_of_work():
+            for project in target_projects:
+                repo_path = Path(project.file_path)
+                if not (repo_path / ".git").exists():
+                    continue
 
-            print(f"\n--- Analyzing contributions for: {project.name} ---")
+                print(f"\n--- Analyzing contributions for: {project.name} ---")
 
-            with self.suppress_output():
-                all_author_stats = self.contribution_analyzer.analyze(str(repo_path), config_manager=self._config_manager)
-                author_map = self.contribution_analyzer.get_name_map(str(repo_path), config_manager=self._config_manager)
+                with self.suppress_output():
+                    all_author_stats = self.contribution_analyzer.analyze(str(repo_path), config_manager=self._config_manager)
+                    author_map = self.contribution_analyzer.get_name_map(str(repo_path), config_manager=self._config_manager)
 
-            self._update_seen_authors(author_map)
+                self.author_manager.record_project_authors(project.id, author_map)
 
-            duplicate_groups = self.contribution_analyzer.detect_duplicate_contributors(author_map)
-            if duplicate_groups:
-                pending_duplicates.append({
-                    "project_id": project.id,
-                    "project_name": project.name,
-                    "repo_path": str(repo_path),
-                    "duplicate_groups": [group.to_dict() for group in duplicate_groups],
-                })
-                print(f" Duplicate contributor identities detected for '{project.name}'.")
+                duplicate_groups = self.contribution_analyzer.detect_duplicate_contributors(author_map)
+                if duplicate_groups:
+                    pending_duplicates.append({
+                        "project_id": project.id,
+                        "project_name": project.name,
+                        "repo_path": str(repo_path),
+                        "duplicate_groups": [group.to_dict() for group in duplicate_groups],
+                    })
+                    print(f" Duplicate contributor identities detected for '{project.name}'.")
 
-                if not interactive:
-                    project.last_accessed = datetime.now()
-                    self.project_manager.set(project)
-                    continue  # identity check happens after duplicates are resolved
+                    if not interactive:
+                        project.last_accessed = datetime.now()
+                        self.project_manager.set(project)
+                        continue  # identity check happens after duplicates are resolved
 
-            project.author_count = len(author_map)
-            project.collaboration_status = "collaborative" if project.author_count > 1 else "individual"
+                project.author_count = len(author_map)
+                project.collaboration_status = "collaborative" if project.author_count > 1 else "individual"
 
-            contributor_identified = True
-            if interactive:
-                selected_emails = self._get_or_select_usernames(author_map) or []
-            else:
-                configured_usernames = self._config_manager.get("usernames")
-                if isinstance(configured_usernames, list) and configured_usernames:
-                    # Use only the subset that appears in this project
-                    matching = [e for e in configured_usernames if e in author_map]
-                    if matching:
-                        selected_emails = matching
-                    else:
-                        # Known identities don't appear in this project — ask
-                        contributor_identified = False
-                        selected_emails = list(author_map.keys())
+                contributor_identified = True
+                if interactive:
+                    selected_emails = self._get_or_select_usernames(author_map) or []
                 else:
-                    # No identity configured yet — try auto-detect first
-                    matched = self._auto_detect_user_emails(author_map)
-                    if matched:
-                        selected_emails = matched
-                        self._config_manager.set("usernames", matched)
-                        print(f"  - Auto-detected contributor(s) from config: {matched}")
+                    configured_usernames = self._config_manager.get("usernames")
+                    if isinstance(configured_usernames, list) and configured_usernames:
+                        # Use only the subset that appears in this project
+                        matching = [e for e in configured_usernames if e in author_map]
+                        if matching:
+                            selected_emails = matching
+                        else:
+                            # Known identities don't appear in this project — ask
+                            contributor_identified = False
+                            selected_emails = list(author_map.keys())
                     else:
-                        contributor_identified = False
-                        selected_emails = list(author_map.keys())
-                        print("  - Could not identify user in git history; identity selection required.")
-
-                if not contributor_identified:
-                    pending_identity.append({
-                        "project_id": project.id,
-                        "project_name": project.name,
-                        "candidates": [
-                            {"email": e, "name": n} for e, n in sorted(author_map.items(), key=lambda x: x[1].lower())
-                        ],
-                    })
-
-            project.authors = sorted([author_map[e] for e in selected_emails if e in author_map])
-            project.contributor_roles = {}
-
-            if all_author_stats:
-                roles_obj = self.role_inference_analyzer.analyze(all_author_stats)
-                project.contributor_roles = {
-                    user: {
-                        "primary_role": r.primary_role.value,
-                        "confidence": float(r.confidence),
-                        "secondary_roles": [sr.value for sr in (r.secondary_roles or [])],
-                        "evidence": r.evidence or {},
+                        # No identity configured yet — try auto-detect first
+                        matched = self._auto_detect_user_emails(author_map)
+                        if matched:
+                            selected_emails = matched
+                            self._config_manager.set("usernames", matched)
+                            print(f"  - Auto-detected contributor(s) from config: {matched}")
+                        else:
+                            contributor_identified = False
+                            selected_emails = list(author_map.keys())
+                            print("  - Could not identify user in git history; identity selection required.")
+
+                    if not contributor_identified:
+                        pending_identity.append({
+                            "project_id": project.id,
+                            "project_name": project.name,
+                            "candidates": [
+                                {"email": e, "name": n} for e, n in sorted(author_map.items(), key=lambda x: x[1].lower())
+                            ],
+                        })
+
+                project.authors = sorted([author_map[e] for e in selected_emails if e in author_map])
+                project.contributor_roles = {}
+
+                if all_author_stats:
+                    roles_obj = self.role_inference_analyzer.analyze(all_author_stats)
+                    project.contributor_roles = {
+                        user: {
+                            "primary_role": r.primary_role.value,
+                            "confidence": float(r.confidence),
+                            "secondary_roles": [sr.value for sr in (r.secondary_roles or [])],
+                            "evidence": r.evidence or {},
+                        }
+                        for user, r in roles_obj.items()
                     }
-                    for user, r in roles_obj.items()
-                }
 
-                project.author_contributions = [
-                    {"author": author, **stats.to_dict()}
-                    for author, stats in all_author_stats.items()]
+                    project.author_contributions = [
+                        {"author": author, **stats.to_dict()}
+                        for author, stats in all_author_stats.items()]
 
-                if contributor_identified:
-                    selected_stats = self._aggregate_stats(all_author_stats, selected_emails)
-                    total_stats = self._aggregate_stats(all_author_stats)
-                    project.individual_contributions = self.contribution_analyzer.calculate_share(selected_stats, total_stats)
+                    if contributor_identified:
+                        selected_stats = self._aggregate_stats(all_author_stats, selected_emails)
+                        total_stats = self._aggregate_stats(all_author_stats)
+                        project.individual_contributions = self.contribution_analyzer.calculate_share(selected_stats, total_stats)
+                    else:
+                        project.individual_contributions = {}
                 else:
-                    project.individual_contributions = {}
-            else:
-                print("  - No detailed contribution stats available; using author list for collaboration status.")
+                    print("  - No detailed contribution stats available; using author list for collaboration status.")
 
-            all_daily = self._parse_daily_commits_from_git(repo_path)
-            project.author_daily_contributions = self._build_selected_author_daily_contributions(all_daily, selected_emails)
+                all_daily = self._parse_daily_commits_from_git(repo_path)
+                project.author_daily_contributions = self._build_selected_author_daily_contributions(all_daily, selected_emails)
 
-            project.last_accessed = datetime.now()
-            self.project_manager.set(project)
+                project.last_accessed = datetime.now()
+                self.project_manager.set(project)
 
-            print(f"  - Total Contributors: {project.author_count}")
-            print(f"  - Collaboration Status: {project.collaboration_status}")
+                print(f"  - Total Contributors: {project.author_count}")
+                print(f"  - Collaboration Status: {project.collaboration_status}")
 
-            if project.contributor_roles:
-                print(" - Inferred Roles:")
-                for user, info in project.contributor_roles.items():
-                    pretty = self._pretty_role(info.get("primary_role", "none"))
-                    confidence_pct = int(float(info.get("confidence", 0.0)) * 100)
-                    print(f"    - {user} → User Role: {pretty} ({confidence_pct}%)")
-            print(f"  - Saved data for '{project.name}'.")
+                if project.contributor_roles:
+                    print(" - Inferred Roles:")
+                    for user, info in project.contributor_roles.items():
+                        pretty = self._pretty_role(info.get("primary_role", "none"))
+                        confidence_pct = int(float(info.get("confidence", 0.0)) * 100)
+                        print(f"    - {user} → User Role: {pretty} ({confidence_pct}%)")
+                print(f"  - Saved data for '{project.name}'.")
 
         return pending_duplicates, pending_identity
 
@@ -657,11 +643,11 @@ class ProjectAnalyzer:
                 config_manager=self._config_manager,
             )
 
-        # Swap merged emails → canonical in usernames and seen_authors
+        # Swap merged emails → canonical in usernames and the authors table
         for resolution in resolutions:
             canonical = resolution.get("canonical", "")
-            merged = set(resolution.get("merge", []))
-            stale = merged - {canonical}
+            merged = resolution.get("merge", [])
+            stale = set(merged) - {canonical}
             if not stale:
                 continue
 
@@ -672,11 +658,7 @@ class ProjectAnalyzer:
             if new_usernames != usernames:
                 self._config_manager.set("usernames", new_usernames)
 
-            seen: Dict[str, str] = self._config_manager.get("seen_authors") or {}
-            for old_email in stale:
-                if old_email in seen:
-                    seen[canonical] = seen.pop(old_email)
-            self._config_manager.set("seen_authors", seen)
+            self.author_manager.merge(canonical, merged)
 
         pending_duplicates, pending_identity = self.analyze_git_and_contributions(projects=[project], interactive=False)
 
@@ -699,72 +681,78 @@ class ProjectAnalyzer:
     def analyze_metadata(self, projects: Optional[List[Project]] = None) -> None:
         """Extracts and saves metadata for all projects or a specific list of them."""
         print("\n--- Metadata & File Statistics ---")
-        for project in (projects or self._get_projects()):
-            print(f"\nAnalyzing metadata for: {project.name}")
-            root_folder = self._find_folder_by_name_recursive(project.name)
-            if not root_folder:
-                print(f"  - Skipping: could not find matching folder in ZIP.")
-                continue
+        with self.project_manager.unit_of_work():
+            for project in (projects or self._get_projects()):
+                print(f"\nAnalyzing metadata for: {project.name}")
+                root_folder = self._find_folder_by_name_recursive(project.name)
+                if not root_folder:
+                    print(f"  - Skipping: could not find matching folder in ZIP.")
+                    continue
 
-            with self.suppress_output():
-                extractor = ProjectMetadataExtractor(root_folder)
-                metadata_full = extractor.extract_metadata(repo_path=project.file_path) or {}
-
-            project_meta = metadata_full.get("project_metadata", {})
-            if num_files := project_meta.get("total_files"):
-                project.num_files = int(num_files)
-            if size_kb := project_meta.get("total_size_kb"):
-                project.size_kb = int(size_kb)
-            if start_date := project_meta.get("start_date"):
-                project.start_date = start_date
-                project.date_created = datetime.strptime(start_date, "%Y-%m-%d")
-            if end_date := project_meta.get("end_date"):
-                project.end_date = end_date
-                project.last_modified = datetime.strptime(end_date, "%Y-%m-%d")
-
-            project.last_accessed = datetime.now()
-            self.project_manager.set(project)
-            print(f"  - Saved metadata for '{project.name}'.")
+                with self.suppress_output():
+                    extractor = ProjectMetadataExtractor(root_folder)
+                    metadata_full = extractor.extract_metadata(repo_path=project.file_path) or {}
+
+                project_meta = metadata_full.get("project_metadata", {})
+                if num_files := project_meta.get("total_files"):
+                    project.num_files = int(num_files)
+                if size_kb := project_meta.get("total_size_kb"):
+                    project.size_kb = int(size_kb)
+                if start_date := project_meta.get("start_date"):
+                    project.start_date = start_date
+                    project.date_created = datetime.strptime(start_date, "%Y-%m-%d")
+                if end_date := project_meta.get("end_date"):
+                    project.end_date = end_date
+                    project.last_modified = datetime.strptime(end_date, "%Y-%m-%d")
+
+                project.last_accessed = datetime.now()
+                self.project_manager.set(project)
+                print(f"  - Saved metadata for '{project.name}'.")
 
     def analyze_categories(self, projects: Optional[List[Project]] = None) -> None:
         """Analyzes and saves file categories. Can run on all projects or a specific list."""
         print("\n--- File Categories Analysis ---")
-        for project in (projects or self._get_projects()):
-            print(f"\nAnalyzing categories for: {project.name}")
-            root_folder = self._find_folder_by_name_recursive(project.name)
-            if not root_folder:
-                print(f"  - Skipping: could not find matching folder in ZIP.")
-                continue
+        with self.project_manager.unit_of_work():
+            for project in (projects or self._get_projects()):
+                print(f"\nAnalyzing categories for: {project.name}")
+                root_folder = self._find_folder_by_name_recursive(project.name)
+                if not root_folder:
+                    print(f"  - Skipping: could not find matching folder in ZIP.")
+                    continue
 
-            files = ProjectMetadataExtractor(root_folder).collect_all_files()
-            file_dicts = [{"path": f.full_path, "language": getattr(f, "language", "Unknown")} for f in files]
+                files = ProjectMetadataExtractor(root_folder).collect_all_files()
+                file_dicts = [
+                    {"path": f.full_path, "language": detect_language_per_file(Path(f.full_path))}
+                    for f in files
+                ]
 
-            metrics = self.file_categorizer.compute_metrics(file_dicts)
-            project.categories = metrics.get("counts", {})
+                metrics = self.file_categorizer.compute_metrics(file_dicts)
+                project.categories = metrics.get("counts", {})
 
-            self.project_manager.set(project)
-            print(json.dumps(project.categories, indent=2))
+                self.project_manager.set(project)
+                print(json.dumps(project.categories, indent=2))
 
     def analyze_languages(self, projects: Optional[List[Project]] = None) -> None:
         """Detects language share. Can run on all projects or a specific list."""
         print("\n--- Language Detection ---")
-        for project in (projects or self._get_projects()):
-            print(f"\nProject: {project.name}")
-            project_root = Path(project.file_path)
-            if not project_root.exists():
-                print(f"  - Skipping: Path not found.")
-                continue
+        with self.project_manager.unit_of_work():
+            for project in (projects or self._get_projects()):
+                print(f"\nProject: {project.name}")
+                project_root = Path(project.file_path)
+                if not project_root.exists():
+                    print(f"  - Skipping: Path not found.")
+                    continue
 
-            language_share = analyze_language_share(project_root)
-            project.languages = list(language_share.keys())
-            project.language_share = language_share
-            self.project_manager.set(project)
+                language_share = analyze_language_share(project_root)
+                project.languages = list(language_share.keys())
+                project.language_share = language_share
+                self.project_manager.set(project)
 
-            if not language_share:
-                print("  - No languages detected.")
-                continue
-            for lang, share in language_share.items():
-                print(f"  - {lang}: {share:.1f}%")
+                if not language_share:
+                    print("  - No languages detected.")
+                    continue
+                for lang, share in language_share.items():
+                    print(f"  - {lang}: {share:.1f}%")
 
     def analyze_skills(self, projects: Optional[List[Project]] = None, silent: bool = False) -> None:
         """Runs skill analysis and calculates resume score for projects."""
@@ -773,78 +761,79 @@ class ProjectAnalyzer:
 
         projects_to_run = projects if projects is not None else self._get_projects()
 
-        for project in projects_to_run:
-            if not silent:
-                print(f"\nAnalyzing skills for: {project.name}...")
-
-            if not Path(project.file_path).exists():
+        with self.project_manager.unit_of_work():
+            for project in projects_to_run:
                 if not silent:
-                    print(f"  - Warning: Path not found. Skipping.")
-                continue
+                    print(f"\nAnalyzing skills for: {project.name}...")
 
-            # --- moved outside silent block ---
-            result = SkillAnalyzer(Path(project.file_path)).analyze()
-
-            # skills
-            skills_raw = result.get("skills", [])
-            filtered_skills = []
-            for item in skills_raw:
-                name, conf = (
-                    (item.get("skill"), item.get("confidence"))
-                    if isinstance(item, dict)
-                    else (getattr(item, 'skill', None), getattr(item, 'confidence', 0.0))
-                )
-                if name and conf >= MIN_DISPLAY_CONFIDENCE:
-                    filtered_skills.append(name.strip())
-            project.skills_used = sorted(list(set(filtered_skills)))
-            project.skills_selected = project.skills_used
-
-            # tech_profile
-            tech = result.get("tech_profile", {}) or {}
-            project.frameworks = tech.get("frameworks", [])
-            project.dependencies_list = tech.get("dependencies_list", [])
-            project.dependency_files_list = tech.get("dependency_files_list", [])
-            project.build_tools = tech.get("build_tools", [])
-            project.has_dockerfile = tech.get("has_dockerfile", False)
-            project.has_database = tech.get("has_database", False)
-            project.has_frontend = tech.get("has_frontend", False)
-            project.has_backend = tech.get("has_backend", False)
-            project.has_test_files = tech.get("has_test_files", False)
-            project.has_readme = tech.get("has_readme", False)
-            project.readme_keywords = tech.get("readme_keywords", [])
-
-            # dimensions
-            dimensions = result.get("dimensions", {}) or {}
-            if td := dimensions.get("testing_discipline"):
-                project.testing_discipline_score = td.get("score", 0.0)
-                project.testing_discipline_level = td.get("level", "")
-            if doc := dimensions.get("documentation_habits"):
-                project.documentation_habits_score = doc.get("score", 0.0)
-                project.documentation_habits_level = doc.get("level", "")
-            if mod := dimensions.get("modularity"):
-                project.modularity_score = mod.get("score", 0.0)
-                project.modularity_level = mod.get("level", "")
-            if ld := dimensions.get("language_depth"):
-                project.language_depth_score = ld.get("score", 0.0)
-                project.language_depth_level = ld.get("level", "")
-
-            # stats
-            overall = result.get("stats", {}).get("overall", {}) or {}
-            project.total_loc = overall.get("total_lines_of_code", 0)
-            project.comment_ratio = overall.get("comment_ratio", 0.0)
-            project.test_file_ratio = overall.get("test_file_ratio", 0.0)
-            project.avg_functions_per_file = overall.get("avg_functions_per_file", 0.0)
-            project.max_function_length = overall.get("max_function_length", 0)
-
-            # resume score
-            ranker = ProjectRanker(project)
-            ranker.calculate_resume_score()
-
-            # --- persistence always happens ---
-            self.project_manager.set(project)
+                if not Path(project.file_path).exists():
+                    if not silent:
+                        print(f"  - Warning: Path not found. Skipping.")
+                    continue
+
+                # --- moved outside silent block ---
+                result = SkillAnalyzer(Path(project.file_path)).analyze()
+
+                # skills
+                skills_raw = result.get("skills", [])
+                filtered_skills = []
+                for item in skills_raw:
+                    name, conf = (
+                        (item.get("skill"), item.get("confidence"))
+                        if isinstance(item, dict)
+                        else (getattr(item, 'skill', None), getattr(item, 'confidence', 0.0))
+                    )
+                    if name and conf >= MIN_DISPLAY_CONFIDENCE:
+                        filtered_skills.append(name.strip())
+                project.skills_used = sorted(list(set(filtered_skills)))
+                project.skills_selected = project.skills_used
+
+                # tech_profile
+                tech = result.get("tech_profile", {}) or {}
+                project.frameworks = tech.get("frameworks", [])
+                project.dependencies_list = tech.get("dependencies_list", [])
+                project.dependency_files_list = tech.get("dependency_files_list", [])
+                project.build_tools = tech.get("build_tools", [])
+                project.has_dockerfile = tech.get("has_dockerfile", False)
+                project.has_database = tech.get("has_database", False)
+                project.has_frontend = tech.get("has_frontend", False)
+                project.has_backend = tech.get("has_backend", False)
+                project.has_test_files = tech.get("has_test_files", False)
+                project.has_readme = tech.get("has_readme", False)
+                project.readme_keywords = tech.get("readme_keywords", [])
+
+                # dimensions
+                dimensions = result.get("dimensions", {}) or {}
+                if td := dimensions.get("testing_discipline"):
+                    project.testing_discipline_score = td.get("score", 0.0)
+                    project.testing_discipline_level = td.get("level", "")
+                if doc := dimensions.get("documentation_habits"):
+                    project.documentation_habits_score = doc.get("score", 0.0)
+                    project.documentation_habits_level = doc.get("level", "")
+                if mod := dimensions.get("modularity"):
+                    project.modularity_score = mod.get("score", 0.0)
+                    project.modularity_level = mod.get("level", "")
+                if ld := dimensions.get("language_depth"):
+                    project.language_depth_score = ld.get("score", 0.0)
+                    project.language_depth_level = ld.get("level", "")
+
+                # stats
+                overall = result.get("stats", {}).get("overall", {}) or {}
+                project.total_loc = overall.get("total_lines_of_code", 0)
+                project.comment_ratio = overall.get("comment_ratio", 0.0)
+                project.test_file_ratio = overall.get("test_file_ratio", 0.0)
+                project.avg_functions_per_file = overall.get("avg_functions_per_file", 0.0)
+                project.max_function_length = overall.get("max_function_length", 0)
+
+                # resume score
+                ranker = ProjectRanker(project)
+                ranker.calculate_resume_score()
+
+                # --- persistence always happens ---
+                self.project_manager.set(project)
 
-            if not silent:
-                print(f"  - Successfully enriched '{project.name}'. Resume Score: {project.resume_score:.2f}")
+                if not silent:
+                    print(f"  - Successfully enriched '{project.name}'. Resume Score: {project.resume_score:.2f}")
 
 
 
@@ -941,8 +930,9 @@ class ProjectAnalyzer:
         - generates bullets/summary/portfolio entry/details
         - does NOT call any CLI editor
         """
-        for project in projects:
-            self._generate_insights_for_project_noninteractive(project)
+        with self.project_manager.unit_of_work():
+            for project in projects:
+                self._generate_insights_for_project_noninteractive(project)
 
 
     def _generate_insights_for_project_noninteractive(self, project: Project):
@@ -992,7 +982,7 @@ class ProjectAnalyzer:
         self.project_manager.set(project)
 
     def generate_resume_insights(self) -> None:
-        """Presents a menu to generate resume insights, ensuring scores are calculated first."""
+        """Presents a menu to generate resume insights for the scored projects."""
         sorted_projects = self.get_projects_sorted_by_score()
 
         while True:
@@ -1337,11 +1327,14 @@ class ProjectAnalyzer:
         print(f"\n{'=' * 30}\n      Analysis Results\n{'=' * 30}")
         self.display_ranked_projects()
 
-    def get_projects_sorted_by_score(self) -> List[Project]:
-        """Return all projects with ensured resume scores, sorted descending, excluding zero-score projects."""
-        projects = self._ensure_scores_are_calculated()
-        scored = [p for p in projects if p.resume_score > 0]
-        return sorted(scored, key=lambda p: p.resume_score, reverse=True)
+    def get_projects_sorted_by_score(self, limit: Optional[int] = None) -> List[Project]:
+        """
+        Return scored projects sorted by their current resume score, descending.
+
+        Only reads: projects whose skills were not analysed yet have no score and
+        are left out (see ProjectManager.get_ranked).
+        """
+        return self.project_manager.get_ranked(limit=limit)
 
     def display_ranked_projects(self,sorted_projects=None) -> None:
         """Display all scored projects sorted by resume score."""
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Callable, Tuple, Set, Optional
+from typing import Any, Dict, Iterable, List, Tuple, Set, Optional
 
 import os
 
 from src.FileCategorizer import FileCategorizer
 
 from .skill_models import Evidence, SkillProfileItem, KNOWN_FRAMEWORKS
-from .skill_patterns import DEP_TO_SKILL, SNIPPET_PATTERNS, KNOWN_CONFIG_HINTS
+from .skill_patterns import SNIPPET_PATTERNS
+from .config_hints import CONFIG_HINT_MATCHER
+from .dependency_manifests import parse_manifest, resolve_skills
 from .skill_proficiency import ProficiencyEstimator
 from .code_metrics_analyzer import CodeMetricsAnalyzer, CodeFileAnalysis
+from .metrics_table import MetricsTable, UNKNOWN_LANGUAGE
+from .python_stats import empty_python_stats
 
 
 # Heuristic mapping: which snippet-based skills make sense for which languages.
@@ -186,7 +190,7 @@ class SkillAnalyzer:
 
     def _iter_pattern_pairs(self, raw_patterns: Iterable[Any]) -> Iterable[Tuple[Any, str]]:
         """
-        Normalize whatever structure DEP_TO_SKILL / SNIPPET_PATTERNS use into
+        Normalize whatever structure SNIPPET_PATTERNS uses into
         (pattern, skill) pairs.
         """
         for item in raw_patterns:
@@ -208,57 +212,6 @@ class SkillAnalyzer:
 
             yield pattern, skill
 
-    def _iter_config_hints(
-        self, raw_hints: Iterable[Any]
-    ) -> Iterable[Tuple[Callable[[str], bool], str, str]]:
-        """
-        Normalize KNOWN_CONFIG_HINTS into (checker, skill, source_kind) tuples.
-
-        Supports:
-          - Tuples: (pattern, skill) or (pattern, skill, source_kind)
-          - Dicts: {"pattern": ..., "skill": ..., "source_kind": "..."}
-          - Objects with .matches(name), .skill, .source_kind
-        """
-        for item in raw_hints:
-            pattern = None
-            skill = None
-            source_kind = "config_hint"
-
-            if isinstance(item, tuple):
-                if len(item) >= 2:
-                    pattern, skill = item[0], item[1]
-                if len(item) >= 3:
-                    source_kind = item[2]
-            elif isinstance(item, dict):
-                pattern = item.get("pattern")
-                skill = item.get("skill")
-                source_kind = item.get("source_kind", source_kind)
-            else:
-                # object with .matches, .skill, .source_kind
-                if hasattr(item, "matches") and hasattr(item, "skill"):
-                    def checker(name: str, h=item) -> bool:
-                        return h.matches(name)
-
-                    skill = getattr(item, "skill")
-                    source_kind = getattr(item, "source_kind", source_kind)
-                    yield checker, skill, source_kind
-                    continue
-
-            if pattern is None or skill is None:
-                continue
-
-            # Build checker from pattern
-            if hasattr(pattern, "search"):
-                def checker(name: str, p=pattern) -> bool:
-                    return bool(p.search(name))
-            else:
-                pat_str = str(pattern).lower()
-
-                def checker(name: str, s=pat_str) -> bool:
-                    return s in name.lower()
-
-            yield checker, skill, source_kind
-
     # ------------------------------------------------------------------
     # Public entry point
     # ------------------------------------------------------------------
@@ -277,12 +230,14 @@ class SkillAnalyzer:
             }
         """
         file_analyses = self.metrics_analyzer.analyze()
-        stats = self._build_stats(file_analyses)
+        # Built once; the stats and language evidence are reductions over it
+        table = MetricsTable.from_analyses(file_analyses)
+        stats = self._build_stats(file_analyses, table)
 
         self._extract_snippet_skills(file_analyses)
 
         evidence: List[Evidence] = []
-        evidence.extend(self._language_evidence(file_analyses))
+        evidence.extend(self._language_evidence(table))
         evidence.extend(self._dependency_evidence())
         evidence.extend(self._config_evidence())
         evidence.extend(self._snippet_evidence(file_analyses))
@@ -439,11 +394,14 @@ class SkillAnalyzer:
     # Stats used by ProficiencyEstimator / dimensions
     # ------------------------------------------------------------------
 
-    def _build_stats(self, file_analyses: List[CodeFileAnalysis]) -> Dict[str, Any]:
+    def _build_stats(
+        self, file_analyses: List[CodeFileAnalysis], table: MetricsTable
+    ) -> Dict[str, Any]:
         """
         Produce a stats dict from code metrics.
+        `table` is MetricsTable.from_analyses(file_analyses).
         """
-        summary = self.metrics_analyzer.summarize(file_analyses)
+        summary = self.metrics_analyzer.summarize(table)
         overall = summary.get("overall", {})
         per_lang = summary.get("per_language", {})
 
@@ -467,7 +425,17 @@ class SkillAnalyzer:
                 "functions": py_data.get("functions", 0),
                 "comment_ratio": py_data.get("comment_ratio", 0.0),
                 "avg_functions_per_file": py_data.get("avg_functions_per_file", 0.0),
+                "test_files": py_data.get("test_file_count", 0),
+                "lines": table.language_totals("total_lines")[py_key],
+                **empty_python_stats(),
             }
+            # AST counters gathered during the metrics pass (python_stats.py)
+            py_stats = stats["python"]
+            for fa in file_analyses:
+                if fa.language != py_key:
+                    continue
+                for key, value in fa.python_stats.items():
+                    py_stats[key] = py_stats.get(key, 0) + value
 
         # Could add similar language-specific blocks for JS/TS, C++, etc. later
         return stats
@@ -476,22 +444,16 @@ class SkillAnalyzer:
     # Evidence extraction
     # ------------------------------------------------------------------
 
-    def _language_evidence(
-        self, file_analyses: Iterable[CodeFileAnalysis]
-    ) -> List[Evidence]:
+    def _language_evidence(self, table: MetricsTable) -> List[Evidence]:
         """
         Evidence derived from file extensions / detected languages.
         Uses LOC-weighted scoring for better proficiency estimates.
         """
         evidence: List[Evidence] = []
 
-        # First pass: gather LOC per language
-        loc_per_lang: Dict[str, int] = {}
-        for fa in file_analyses:
-            lang = fa.language
-            if not lang:
-                continue
-            loc_per_lang[lang] = loc_per_lang.get(lang, 0) + fa.total_lines
+        # First pass: gather LOC per language (files without one don't count)
+        loc_per_lang = table.language_totals("total_lines")
+        loc_per_lang.pop(UNKNOWN_LANGUAGE, None)
 
         if not loc_per_lang:
             return evidence
@@ -526,38 +488,21 @@ class SkillAnalyzer:
             if path.name not in DEPENDENCY_FILES and file_ext not in DEPENDENCY_EXTENSIONS:
                 continue   # ignore random docs
 
-            try:
-                text = path.read_text(encoding="utf-8", errors="ignore")
-            except OSError:
+            names = parse_manifest(path)
+            if not names:
                 continue
 
-            for item in DEP_TO_SKILL:
-                pattern, skill = item[0], item[1]
-                allowed_files = item[2] if len(item) > 2 else None
-                # Skip this pattern if it doesn't apply to the current file type.
-                # allowed_files entries starting with "*." are extension patterns (e.g. "*.csproj").
-                if allowed_files is not None:
-                    name_match = path.name in allowed_files
-                    ext_match = any(
-                        f.startswith("*.") and file_ext == f[2:]
-                        for f in allowed_files
-                    )
-                    if not name_match and not ext_match:
-                        continue
-                if hasattr(pattern, "search"):
-                    match = pattern.search(text)
-                else:
-                    match = pattern in text
-                if match:
-                    evidence.append(
-                        Evidence(
-                            skill=skill,
-                            source="dependency",
-                            raw=getattr(pattern, "pattern", str(pattern)),
-                            file_path=str(path.relative_to(self.root_dir)),
-                            weight=0.7,
-                        )
+            rel_path = str(path.relative_to(self.root_dir))
+            for skill, dep_name in sorted(resolve_skills(path, names).items()):
+                evidence.append(
+                    Evidence(
+                        skill=skill,
+                        source="dependency",
+                        raw=dep_name,
+                        file_path=rel_path,
+                        weight=0.7,
                     )
+                )
 
         return evidence
 
@@ -573,17 +518,16 @@ class SkillAnalyzer:
 
             rel_name = path.name
 
-            for checker, skill, source_kind in self._iter_config_hints(KNOWN_CONFIG_HINTS):
-                if checker(rel_name):
-                    evidence.append(
-                        Evidence(
-                            skill=skill,
-                            source=source_kind,
-                            raw=rel_name,
-                            file_path=str(path.relative_to(self.root_dir)),
-                            weight=0.8,
-                        )
+            for skill, source_kind in CONFIG_HINT_MATCHER.match(rel_name):
+                evidence.append(
+                    Evidence(
+                        skill=skill,
+                        source=source_kind,
+                        raw=rel_name,
+                        file_path=str(path.relative_to(self.root_dir)),
+                        weight=0.8,
                     )
+                )
 
         return evidence
 
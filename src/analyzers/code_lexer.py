@@ -0,0 +1,409 @@
+"""
+code_lexer.py
+
+A small, table-driven lexer used by CodeMetricsAnalyzer to classify lines as
+code / comment / blank and to find function boundaries in a single pass.
+
+The lexical rules for each language (comment markers, string delimiters,
+block style and the function-start pattern) live in config/languages.yml
+under each language's `syntax` key, optionally inheriting from one of the
+shared `syntax_profiles`. Rules are compiled once per language and cached.
+
+Workflow overview:
+1. All comments and string literals in a file are found with one precompiled
+   regex (longest opener first) and replaced in a single `re.split` pass:
+   comments become a comment marker, string contents are dropped. Line
+   structure is preserved, and lines that start inside a multi-line comment or
+   string are tagged.
+2. The masked lines are walked once: a line with anything left on it is code,
+   a line with a comment marker is a comment (a line can be both), anything
+   else is blank. Function boundaries are tracked in the same walk according
+   to the language's block style, except for the indent style, which jumps
+   straight from each def line to the dedent that ends it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, List, Optional, Pattern, Tuple
+
+import re
+
+from .language_detector import LANGUAGES, LANGUAGES_YAML
+
+BLOCK_STYLES = ("brace", "indent", "sequential")
+
+# Used when a language has no `function_pattern` key at all (an explicit
+# null disables function detection instead).
+GENERIC_FUNCTION_PATTERN = r"^\w+\s*\([^)]*\)\s*\{"
+
+# Rules for files whose language is unknown or has no `syntax` entry. This
+# mirrors the old language-agnostic heuristic: both '#' and '//' comment.
+DEFAULT_SYNTAX: Dict[str, Any] = {
+    "line_comment": ["#", "//"],
+    "block_comment": [["/*", "*/"]],
+    "strings": ['"', "'"],
+    "multiline_strings": [],
+    "block_style": "brace",
+    "function_pattern": GENERIC_FUNCTION_PATTERN,
+}
+
+# Markers written into the masked text. Both count as whitespace for
+# str.strip(), so they never make a line look like code.
+_COMMENT = "\x1f"
+_CONTINUED = "\x1e"  # line starts inside a multi-line comment or string
+_STRING = '""'
+
+
+@dataclass(frozen=True)
+class LexicalRules:
+    """Compiled lexical rules for one language."""
+
+    line_comments: Tuple[str, ...] = ()
+    block_comments: Tuple[Tuple[str, str], ...] = ()
+    strings: Tuple[str, ...] = ()
+    multiline_strings: FrozenSet[str] = frozenset()
+    block_style: str = "brace"
+    function_pattern: Optional[Pattern[str]] = None
+    function_keyword: Optional[str] = None
+
+    @classmethod
+    def from_config(cls, spec: Dict[str, Any]) -> "LexicalRules":
+        block_style = spec.get("block_style") or "brace"
+        if block_style not in BLOCK_STYLES:
+            raise ValueError(f"Unknown block_style: {block_style!r}")
+
+        pattern = spec.get("function_pattern", GENERIC_FUNCTION_PATTERN)
+        strings = tuple(spec.get("strings") or ())
+        return cls(
+            line_comments=tuple(spec.get("line_comment") or ()),
+            block_comments=tuple(
+                (str(open_), str(close)) for open_, close in spec.get("block_comment") or ()
+            ),
+            strings=strings,
+            multiline_strings=frozenset(
+                s for s in spec.get("multiline_strings") or () if s in strings
+            ),
+            block_style=block_style,
+            function_pattern=re.compile(pattern) if pattern else None,
+            function_keyword=spec.get("function_keyword"),
+        )
+
+
+@dataclass
+class LexResult:
+    """Line counts and function lengths for one scanned file."""
+
+    total_lines: int = 0
+    code_lines: int = 0
+    comment_lines: int = 0
+    blank_lines: int = 0
+    function_lengths: List[int] = field(default_factory=list)
+
+
+class CodeLexer:
+    """
+    Scans source text according to a LexicalRules table.
+
+    Comment markers inside strings and code inside comments are not
+    miscounted, and block comments / multi-line strings are followed across
+    lines. A line containing both code and a comment counts towards both.
+    """
+
+    def __init__(self, rules: LexicalRules) -> None:
+        self.rules = rules
+
+        # (opener, body, kind) so alternatives can be ordered longest-opener
+        # first: '"""' must win over '"', '--[[' over '--', '#=' over '#'.
+        alternatives: List[Tuple[str, str, str]] = []
+        for token in rules.line_comments:
+            alternatives.append((token, r"[^\n]*", "c"))
+        for open_, close in rules.block_comments:
+            body = _unrolled_body(close, escapes=False, multiline=True)
+            alternatives.append((open_, body, "c"))
+        for delim in rules.strings:
+            body = _unrolled_body(
+                delim, escapes=True, multiline=delim in rules.multiline_strings
+            )
+            alternatives.append((delim, body, "s"))
+        alternatives.sort(key=lambda alt: -len(alt[0]))
+
+        # The kind of a literal is told apart by its first character, so a
+        # comment and a string opener must not share one.
+        self._markers: Dict[str, str] = {}
+        for opener, _, kind in alternatives:
+            marker = _COMMENT if kind == "c" else _STRING
+            if self._markers.setdefault(opener[0], marker) != marker:
+                raise ValueError(f"Comment and string openers share {opener[0]!r}")
+
+        # A single group around branches that each start with a bare literal
+        # lets re.split do the whole pass in C: the engine skips straight to
+        # candidate opener characters instead of trying every branch at every
+        # offset, and no Python callback runs per match.
+        self._literal_re: Optional[Pattern[str]] = None
+        if alternatives:
+            self._literal_re = re.compile(
+                "("
+                + "|".join(re.escape(opener) + body for opener, body, _ in alternatives)
+                + ")"
+            )
+
+        # Indent style only: candidate def lines, and per-indent dedent regexes
+        keyword = rules.function_keyword
+        self._def_finder = re.compile(re.escape(keyword) if keyword else "^", re.M)
+        self._dedents: Dict[int, Pattern[str]] = {}
+
+    def scan(self, text: str) -> LexResult:
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        if self._literal_re is not None:
+            # Code and literals alternate: [code, literal, code, ...]
+            pieces = self._literal_re.split(text)
+            if len(pieces) > 1:
+                markers = self._markers
+                pieces[1::2] = [
+                    markers[literal[0]] if "\n" not in literal else self._mask_multiline(literal)
+                    for literal in pieces[1::2]
+                ]
+                text = "".join(pieces)
+
+        lines = text.split("\n") if text else []
+        if text.endswith("\n"):
+            lines.pop()
+
+        result = LexResult(total_lines=len(lines))
+        style = self.rules.block_style
+        if self.rules.function_pattern is None:
+            self._count_lines(lines, result)
+        elif style == "indent":
+            self._count_lines(lines, result)
+            self._scan_indent(text, result)
+        elif style == "brace":
+            self._scan_brace(lines, result)
+        else:
+            self._scan_sequential(lines, result)
+
+        if _COMMENT in text:
+            if self.rules.block_comments:
+                result.comment_lines = sum(1 for line in lines if _COMMENT in line)
+            else:
+                # Line comments run to the end of the line: one marker per line
+                result.comment_lines = text.count(_COMMENT)
+        return result
+
+    def _mask_multiline(self, literal: str) -> str:
+        """Mask a comment / string spanning lines, keeping its line breaks."""
+        marker = self._markers[literal[0]]
+        masked = [marker]
+        for part in literal.split("\n")[1:]:
+            # Blank lines inside a literal stay blank.
+            masked.append(_CONTINUED + marker if part.strip() else _CONTINUED)
+        return "\n".join(masked)
+
+    # Each pass below fills in code/blank counts and function lengths for the
+    # masked lines, where comments and string contents are already gone.
+
+    def _count_lines(self, lines: List[str], result: LexResult) -> None:
+        code = blank = 0
+        for line in lines:
+            if line.strip():
+                code += 1
+            elif _COMMENT not in line:
+                blank += 1
+        result.code_lines = code
+        result.blank_lines = blank
+
+    def _scan_indent(self, text: str, result: LexResult) -> None:
+        """
+        A function ends at the last code line before a statement at or left
+        of its def.
+
+        Works on offsets into the masked text instead of walking every line:
+        def lines are found through the function keyword, and the statement
+        that ends each one through a regex for lines indented no deeper.
+        """
+        func_match = self.rules.function_pattern.match
+        lengths = result.function_lengths
+        seen = -1
+
+        for hit in self._def_finder.finditer(text):
+            start = text.rfind("\n", 0, hit.start()) + 1
+            if start == seen:
+                continue  # keyword found twice on one line
+            seen = start
+            eol = text.find("\n", start)
+            line = text[start:eol] if eol != -1 else text[start:]
+            code = line.lstrip()
+            if not code or line[0] == _CONTINUED or func_match(code) is None:
+                continue
+            last = self._block_last_code(text, start, len(line) - len(code))
+            lengths.append(text.count("\n", start, last) + 1)
+
+    def _block_last_code(self, text: str, start: int, indent: int) -> int:
+        """Offset of the last code character of the block whose header starts at `start`."""
+        dedent = self._dedents.get(indent)
+        if dedent is None:
+            # \S also skips lines holding only comment / continuation markers
+            dedent = self._dedents[indent] = re.compile(r"\n[ \t]{0,%d}(?=\S)" % indent)
+
+        for match in dedent.finditer(text, start):
+            # A line continues the statement before it if it closes a bracket
+            # or the previous code line leaves one open (or ends in '\').
+            if text[match.end()] in ")]}":
+                continue
+            last = _last_non_space(text, start, match.start())
+            if text[last] not in "([{,\\":
+                return last
+        return _last_non_space(text, start, len(text))
+
+    def _scan_brace(self, lines: List[str], result: LexResult) -> None:
+        """A function ends where its braces balance (or at ';' if it never opens one)."""
+        func_match = self.rules.function_pattern.match
+        lengths = result.function_lengths
+        code = blank = depth = 0
+        frames: List[List[Any]] = []  # [start line, base depth, opened]
+
+        for lineno, line in enumerate(lines):
+            stripped = line.strip()
+            if not stripped:
+                if _COMMENT not in line:
+                    blank += 1
+                continue
+            code += 1
+
+            base_depth = depth
+            peak = depth
+            if "{" in line or "}" in line:
+                opens = line.count("{")
+                closes = line.count("}")
+                if not closes:
+                    peak = depth + opens
+                elif opens:
+                    running = depth
+                    for char in line:
+                        if char == "{":
+                            running += 1
+                            if running > peak:
+                                peak = running
+                        elif char == "}":
+                            running -= 1
+                depth += opens - closes
+
+            if line[0] != _CONTINUED and func_match(stripped) is not None:
+                # A previous signature that never opened a body ends here.
+                while frames and not frames[-1][2]:
+                    start = frames.pop()[0]
+                    lengths.append(max(lineno - start, 1))
+                frames.append([lineno, base_depth, False])
+
+            if not frames:
+                continue
+            for frame in frames:
+                if not frame[2] and peak > frame[1]:
+                    frame[2] = True
+            ends_statement = stripped[-1] == ";"
+            while frames:
+                start, base, opened = frames[-1]
+                if opened:
+                    closed = depth <= base
+                else:
+                    closed = depth < base or ends_statement
+                if not closed:
+                    break
+                frames.pop()
+                lengths.append(lineno - start + 1)
+
+        while frames:
+            lengths.append(len(lines) - frames.pop()[0])
+        result.code_lines = code
+        result.blank_lines = blank
+
+    def _scan_sequential(self, lines: List[str], result: LexResult) -> None:
+        """A function runs until the next function start (or end of file)."""
+        func_match = self.rules.function_pattern.match
+        lengths = result.function_lengths
+        code = blank = 0
+        start: Optional[int] = None
+
+        for lineno, line in enumerate(lines):
+            stripped = line.strip()
+            if not stripped:
+                if _COMMENT not in line:
+                    blank += 1
+                continue
+            code += 1
+            if line[0] != _CONTINUED and func_match(stripped) is not None:
+                if start is not None:
+                    lengths.append(lineno - start)
+                start = lineno
+
+        if start is not None:
+            lengths.append(len(lines) - start)
+        result.code_lines = code
+        result.blank_lines = blank
+
+
+def _last_non_space(text: str, floor: int, end: int) -> int:
+    """Offset of the last non-whitespace character before `end` (not below `floor`)."""
+    pos = end - 1
+    while pos > floor and text[pos].isspace():
+        pos -= 1
+    return pos
+
+
+def _unrolled_body(close: str, escapes: bool, multiline: bool) -> str:
+    """
+    Regex for everything after an opener up to and including `close`.
+
+    Written as an unrolled loop (``[^c]*(?:c(?!rest)[^c]*)*``) instead of a
+    lazy ``.*?`` so the regex engine consumes runs of ordinary characters in
+    one step. An unterminated literal runs to the end of the line (or of the
+    file, for multi-line literals).
+    """
+    first, rest = re.escape(close[0]), re.escape(close[1:])
+    stop = first + (r"\\" if escapes else "") + ("" if multiline else r"\n")
+    plain = f"[^{stop}]*"
+    special = [f"{first}(?!{rest})"] if rest else []
+    if escapes:
+        special.append(r"\\[\s\S]" if multiline else r"\\.")
+    body = plain
+    if special:
+        body += f"(?:(?:{'|'.join(special)}){plain})*"
+    end = r"\Z" if multiline else r"(?=\n)|\Z"
+    return f"{body}(?:{re.escape(close)}|{end})"
+
+
+def _resolve_syntax(syntax: Any, profiles: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a language's `syntax` entry over its profile (if any)."""
+    if syntax is None:
+        return dict(DEFAULT_SYNTAX)
+    if isinstance(syntax, str):
+        syntax = {"profile": syntax}
+
+    profile_name = syntax.get("profile")
+    if profile_name is not None and profile_name not in profiles:
+        raise ValueError(f"Unknown syntax profile: {profile_name!r}")
+
+    merged: Dict[str, Any] = dict(profiles.get(profile_name) or {})
+    merged.update({k: v for k, v in syntax.items() if k != "profile"})
+    return merged
+
+
+def _build_lexers() -> Dict[str, CodeLexer]:
+    profiles = LANGUAGES_YAML.get("syntax_profiles") or {}
+    lexers: Dict[str, CodeLexer] = {}
+    for language, info in LANGUAGES.items():
+        spec = _resolve_syntax((info or {}).get("syntax"), profiles)
+        lexers[language] = CodeLexer(LexicalRules.from_config(spec))
+    return lexers
+
+
+_LEXERS: Dict[str, CodeLexer] = _build_lexers()
+_DEFAULT_LEXER = CodeLexer(LexicalRules.from_config(DEFAULT_SYNTAX))
+
+
+def get_lexer(language: Optional[str]) -> CodeLexer:
+    """Return the cached lexer for a language, falling back to generic rules."""
+    if not language:
+        return _DEFAULT_LEXER
+    return _LEXERS.get(language, _DEFAULT_LEXER)
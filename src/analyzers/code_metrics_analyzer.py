@@ -2,13 +2,20 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Iterable, Set
+from typing import Dict, List, Optional, Any, Iterable, Set, Tuple, Union
 
 import os
-import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 from src.FileCategorizer import FileCategorizer
+from .code_lexer import get_lexer
 from .language_detector import detect_language_per_file
+from .metrics_table import MetricsTable
+from .python_stats import content_hash, python_stats_for, remember_python_stats
+
+# Below this many files, process start-up costs more than it saves.
+PARALLEL_MIN_FILES = 64
 
 
 @dataclass
@@ -35,6 +42,10 @@ class CodeFileAnalysis:
     snippet_matches: Dict[str, int] = field(default_factory=dict)
     snippet_skills: List[str] = field(default_factory=list)
 
+    # SHA-256 of the file contents and AST counters (Python files only)
+    content_hash: Optional[str] = None
+    python_stats: Dict[str, int] = field(default_factory=dict)
+
 
 class CodeMetricsAnalyzer:
     """
@@ -42,9 +53,11 @@ class CodeMetricsAnalyzer:
     all files categorized as 'code' or 'tests' by FileCategorizer.
     """
 
-    def __init__(self, root_dir: Path) -> None:
+    def __init__(self, root_dir: Path, workers: Optional[int] = None) -> None:
         self.root_dir = Path(root_dir)
         self.categorizer = FileCategorizer()
+        # Worker processes for the per-file pass; None means os.cpu_count()
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
 
     # ------------------------------------------------------------------
     # Public API
@@ -56,7 +69,7 @@ class CodeMetricsAnalyzer:
         Returns:
             A list of CodeFileAnalysis objects, one per analyzed file.
         """
-        analyses: List[CodeFileAnalysis] = []
+        jobs: List[Tuple[Path, Optional[str], bool]] = []
         seen_paths: Set[Path] = set()
 
         for file_path in self._iter_candidate_files():
@@ -80,15 +93,19 @@ class CodeMetricsAnalyzer:
                 # For now this is empty as analysis is only done in code/test files.
                 continue
 
-            analysis = self._analyze_single_file(file_path, language, is_test)
-            analyses.append(analysis)
+            jobs.append((file_path, language, is_test))
 
-        return analyses
+        return self._run_jobs(jobs)
 
-    def summarize(self, analyses: List[CodeFileAnalysis]) -> Dict[str, Any]:
+    def summarize(
+        self, analyses: Union[List[CodeFileAnalysis], MetricsTable]
+    ) -> Dict[str, Any]:
         """
         Summarize the per-file analyses into overall stats and per-language stats.
 
+        Accepts either the list returned by analyze() or a MetricsTable
+        built from it with MetricsTable.from_analyses.
+
         Tests expect:
           - overall["total_files"]
           - overall["num_code_files"]
@@ -97,93 +114,9 @@ class CodeMetricsAnalyzer:
           - overall["comment_ratio"]
           - overall["avg_functions_per_file"]
         """
-        total_files = len(analyses) or 0
-        total_loc = sum(a.code_lines for a in analyses)
-        total_functions = sum(a.function_count for a in analyses)
-        total_function_lines = sum(a.total_function_lines for a in analyses)
-        max_func_len_overall = max(
-            (a.max_function_length for a in analyses), default=0
-        )
-
-        # Split code vs test
-        num_code_files = sum(1 for a in analyses if not a.is_test)
-        num_test_files = sum(1 for a in analyses if a.is_test)
-
-        # Comment ratio = comment / (comment + code)
-        total_comment = sum(a.comment_lines for a in analyses)
-        total_code = sum(a.code_lines for a in analyses)
-        denom = total_comment + total_code
-        comment_ratio = (total_comment / denom) if denom > 0 else 0.0
-
-        # Average function length across all functions
-        avg_func_len = (
-            total_function_lines / total_functions if total_functions > 0 else 0.0
-        )
-
-        avg_functions_per_file = (
-            total_functions / total_files if total_files > 0 else 0.0
-        )
-
-        # Ratio of test files to code files (tests assume denominator = code files)
-        test_file_ratio = (
-            num_test_files / num_code_files if num_code_files > 0 else 0.0
-        )
-
-        overall = {
-            "file_count": total_files,
-            "total_files": total_files,
-            "num_code_files": num_code_files,
-            "num_test_files": num_test_files,
-            "test_file_ratio": test_file_ratio,
-            "total_lines_of_code": total_loc,
-            "avg_function_length": avg_func_len,
-            "max_function_length": max_func_len_overall,
-            "comment_ratio": comment_ratio,
-            "avg_functions_per_file": avg_functions_per_file,
-        }
-
-        # Group by language, with richer stats
-        per_language: Dict[str, Dict[str, Any]] = {}
-        for a in analyses:
-            lang = a.language or "Unknown"
-            if lang not in per_language:
-                per_language[lang] = {
-                    "file_count": 0,
-                    "loc": 0,
-                    "functions": 0,
-                    "comment_lines": 0,
-                    "code_lines": 0,
-                    "test_file_count": 0,
-                    "max_function_length": 0,
-                }
-            stats = per_language[lang]
-            stats["file_count"] += 1
-            stats["loc"] += a.code_lines
-            stats["functions"] += a.function_count
-            stats["comment_lines"] += a.comment_lines
-            stats["code_lines"] += a.code_lines
-            if a.is_test:
-                stats["test_file_count"] += 1
-            stats["max_function_length"] = max(
-                stats["max_function_length"], a.max_function_length
-            )
-
-        # Derived per-language stats
-        for lang, stats in per_language.items():
-            denom = stats["comment_lines"] + stats["code_lines"]
-            stats["comment_ratio"] = (
-                stats["comment_lines"] / denom if denom > 0 else 0.0
-            )
-            stats["avg_functions_per_file"] = (
-                stats["functions"] / stats["file_count"]
-                if stats["file_count"] > 0
-                else 0.0
-            )
-
-        return {
-            "overall": overall,
-            "per_language": per_language,
-        }
+        if not isinstance(analyses, MetricsTable):
+            analyses = MetricsTable.from_analyses(analyses)
+        return analyses.summarize()
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -220,81 +153,40 @@ class CodeMetricsAnalyzer:
 
                 yield file_path
 
-    def _analyze_single_file(
-        self, file_path: Path, language: Optional[str], is_test: bool
-    ) -> CodeFileAnalysis:
+    def _run_jobs(
+        self, jobs: List[Tuple[Path, Optional[str], bool]]
+    ) -> List[CodeFileAnalysis]:
         """
-        Compute metrics for a single file.
+        Analyze the selected files, fanning out to worker processes for
+        large trees. Falls back to in-process analysis if the pool fails.
         """
-        total = 0
-        code = 0
-        comment = 0
-        blank = 0
-
-        function_count = 0
-        max_func_len = 0
-        current_func_len = 0
-        in_function = False
-        total_func_lines = 0
+        workers = min(self.workers, len(jobs))
+        if workers <= 1 or len(jobs) < PARALLEL_MIN_FILES:
+            return [self._analyze_single_file(*job) for job in jobs]
 
         try:
-            text = file_path.read_text(encoding="utf-8", errors="ignore")
-        except OSError:
-            return CodeFileAnalysis(
-                path=file_path,
-                language=language,
-                is_test=is_test,
-            )
-
-        lines = text.splitlines()
-        total = len(lines)
-
-        for line in lines:
-            stripped = line.strip()
-
-            if not stripped:
-                blank += 1
-            else:
-                # Crude multi-language comment detection
-                if stripped.startswith("#") or stripped.startswith("//"):
-                    comment += 1
-                elif "/*" in stripped or stripped.endswith("*/") or stripped.startswith("*"):
-                    comment += 1
-                elif "#" in stripped or "//" in stripped:
-                    # Inline comment: code ... # comment / code ... // comment
-                    code += 1
-                    comment += 1
-                else:
-                    code += 1
-
-            # Naive function detection
-            if self._is_function_start(stripped, language):
-                if in_function:
-                    # Close previous function
-                    max_func_len = max(max_func_len, current_func_len)
-                    total_func_lines += current_func_len
-                in_function = True
-                current_func_len = 1
-                function_count += 1
-            elif in_function:
-                current_func_len += 1
-
-        if in_function:
-            max_func_len = max(max_func_len, current_func_len)
-            total_func_lines += current_func_len
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                analyses = list(
+                    pool.map(
+                        _analyze_job,
+                        jobs,
+                        chunksize=max(1, len(jobs) // (workers * 4)),
+                    )
+                )
+        except (OSError, BrokenProcessPool):
+            return [self._analyze_single_file(*job) for job in jobs]
+
+        # Workers parse with their own cache; keep the results in ours.
+        for analysis in analyses:
+            if analysis.content_hash and analysis.python_stats:
+                remember_python_stats(analysis.content_hash, analysis.python_stats)
+        return analyses
 
-        return CodeFileAnalysis(
-            path=file_path,
-            language=language,
-            is_test=is_test,
-            total_lines=total,
-            code_lines=code,
-            comment_lines=comment,
-            blank_lines=blank,
-            function_count=function_count,
-            max_function_length=max_func_len,
-            total_function_lines=total_func_lines,
-        )
+    def _analyze_single_file(
+        self, file_path: Path, language: Optional[str], is_test: bool
+    ) -> CodeFileAnalysis:
+        """Compute metrics for a single file (see analyze_file)."""
+        return analyze_file(file_path, language, is_test)
 
     def _is_test_file(self, rel_path: Path, category: str) -> bool:
         """Decide if a file should be treated as test code."""
@@ -303,38 +195,51 @@ class CodeMetricsAnalyzer:
         lower_parts = [p.lower() for p in rel_path.parts]
         return any(part in ("tests", "test") for part in lower_parts)
 
-    def _is_function_start(self, stripped: str, language: Optional[str]) -> bool:
-        """
-        Rough heuristic to detect when a line starts a function or method.
-        This is intentionally simple and language-agnostic.
-        """
-        if not stripped:
-            return False
-
-        lang = (language or "").lower()
-
-        # Python: def foo(
-        if lang == "python":
-            return stripped.startswith("def ") and "(" in stripped and ":" in stripped
-
-        # JavaScript / TypeScript / C-like:
-        if lang in ("javascript", "typescript", "js", "ts"):
-            # function foo(
-            if stripped.startswith("function "):
-                return True
-            # foo() {
-            if re.match(r"\w+\s*\([^)]*\)\s*\{", stripped):
-                return True
-            # Simple arrow function heuristic: const foo = (...) =>
-            if "=>" in stripped and re.search(r"\bfunction\b", stripped) is None:
-                return True
-
-        # C / C++ / Java / C#
-        if lang in ("c", "c++", "cpp", "java", "c#"):
-            # Very naive: "type name(args) {"
-            return bool(
-                re.match(r"[A-Za-z_][A-Za-z0-9_<>,\s\*]*\([^)]*\)\s*\{", stripped)
-            )
-
-        # generic fallback: anything that looks like name(args) {
-        return bool(re.match(r"\w+\s*\([^)]*\)\s*\{", stripped))
+
+def analyze_file(
+    file_path: Path, language: Optional[str], is_test: bool
+) -> CodeFileAnalysis:
+    """
+    Compute metrics for a single file.
+
+    Line classification and function boundaries come from the
+    language's lexical rules in languages.yml (see code_lexer.py).
+    Python files additionally get AST counters (see python_stats.py),
+    computed from the same read and cached by content hash.
+    """
+    try:
+        data = file_path.read_bytes()
+    except OSError:
+        return CodeFileAnalysis(
+            path=file_path,
+            language=language,
+            is_test=is_test,
+        )
+
+    text = data.decode("utf-8", errors="ignore")
+    result = get_lexer(language).scan(text)
+    lengths = result.function_lengths
+
+    analysis = CodeFileAnalysis(
+        path=file_path,
+        language=language,
+        is_test=is_test,
+        total_lines=result.total_lines,
+        code_lines=result.code_lines,
+        comment_lines=result.comment_lines,
+        blank_lines=result.blank_lines,
+        function_count=len(lengths),
+        max_function_length=max(lengths, default=0),
+        total_function_lines=sum(lengths),
+    )
+
+    if language == "Python":
+        analysis.content_hash = content_hash(data)
+        analysis.python_stats = python_stats_for(text, analysis.content_hash)
+
+    return analysis
+
+
+def _analyze_job(job: Tuple[Path, Optional[str], bool]) -> CodeFileAnalysis:
+    """Picklable entry point for worker processes."""
+    return analyze_file(*job)
@@ -0,0 +1,191 @@
+"""
+config_hints.py
+
+Precompiled matcher for KNOWN_CONFIG_HINTS (config-file naming conventions
+such as next.config.js or Dockerfile).
+
+Hints are sorted once, at import, into buckets:
+  - exact:  anchored literal patterns, e.g. ^angular\\.json$ or
+            ^vite\\.config\\.(js|ts)$ (alternations are expanded)
+  - suffix: end-anchored extensions, e.g. \\.uproject$
+  - checks: everything else (general regexes, substring strings and
+            objects exposing .matches(name)), tested one by one
+
+Exact and suffix hints resolve with dict lookups, so matching a filename
+costs a few lookups plus the (short) list of general checks.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .skill_patterns import KNOWN_CONFIG_HINTS
+
+# (hint index, skill, source_kind); the index keeps results in hint order
+_Entry = Tuple[int, str, str]
+
+# "(a|b|c)" group whose alternatives are plain literals
+_LITERAL_GROUP_RE = re.compile(r"\(((?:[\w-]|\\\W)+(?:\|(?:[\w-]|\\\W)+)*)\)")
+
+
+def _unescape(literal: str) -> str:
+    return re.sub(r"\\(\W)", r"\1", literal)
+
+
+def _expand_literal(source: str) -> Optional[List[str]]:
+    """
+    Expand a regex body made only of literals and literal alternation
+    groups into every string it matches. Returns None for anything else.
+    """
+    results = [""]
+    i = 0
+    while i < len(source):
+        ch = source[i]
+        if ch == "\\":
+            if i + 1 >= len(source) or source[i + 1].isalnum() or source[i + 1] == "_":
+                return None  # character class such as \d or \w
+            results = [r + source[i + 1] for r in results]
+            i += 2
+        elif ch.isalnum() or ch in "-_":
+            results = [r + ch for r in results]
+            i += 1
+        elif ch == "(":
+            group = _LITERAL_GROUP_RE.match(source, i)
+            if group is None:
+                return None
+            alts = [_unescape(a) for a in group.group(1).split("|")]
+            results = [r + a for r in results for a in alts]
+            i = group.end()
+        else:
+            return None
+    return results
+
+
+def _normalize_hint(item: Any) -> Optional[Tuple[Any, str, str]]:
+    """
+    Normalize one hint into (pattern, skill, source_kind).
+
+    Supports:
+      - Tuples: (pattern, skill) or (pattern, skill, source_kind)
+      - Dicts: {"pattern": ..., "skill": ..., "source_kind": "..."}
+      - Objects with .matches(name), .skill, .source_kind (pattern is the object)
+    """
+    pattern = None
+    skill = None
+    source_kind = "config_hint"
+
+    if isinstance(item, tuple):
+        if len(item) >= 2:
+            pattern, skill = item[0], item[1]
+        if len(item) >= 3:
+            source_kind = item[2]
+    elif isinstance(item, dict):
+        pattern = item.get("pattern")
+        skill = item.get("skill")
+        source_kind = item.get("source_kind", source_kind)
+    elif hasattr(item, "matches") and hasattr(item, "skill"):
+        pattern = item
+        skill = getattr(item, "skill")
+        source_kind = getattr(item, "source_kind", source_kind)
+
+    if pattern is None or skill is None:
+        return None
+    return pattern, skill, source_kind
+
+
+class ConfigHintMatcher:
+    """
+    Resolves filenames to (skill, source_kind) pairs for a fixed hint list.
+    """
+
+    def __init__(self, raw_hints: Iterable[Any]) -> None:
+        self._exact: Dict[str, List[_Entry]] = {}
+        self._exact_ci: Dict[str, List[_Entry]] = {}
+        self._suffix: Dict[str, List[_Entry]] = {}
+        self._suffix_ci: Dict[str, List[_Entry]] = {}
+        self._checks: List[Tuple[Callable[[str], bool], _Entry]] = []
+
+        for index, item in enumerate(raw_hints):
+            normalized = _normalize_hint(item)
+            if normalized is None:
+                continue
+            pattern, skill, source_kind = normalized
+            self._add(pattern, (index, skill, source_kind))
+
+    def match(self, name: str) -> List[Tuple[str, str]]:
+        """Return (skill, source_kind) for every hint matching `name`, in hint order."""
+        lower = name.lower()
+        hits: List[_Entry] = []
+
+        if name in self._exact:
+            hits += self._exact[name]
+        if lower in self._exact_ci:
+            hits += self._exact_ci[lower]
+
+        dot = name.rfind(".")
+        if dot >= 0:
+            suffix = name[dot:]
+            if suffix in self._suffix:
+                hits += self._suffix[suffix]
+            suffix = lower[dot:]
+            if suffix in self._suffix_ci:
+                hits += self._suffix_ci[suffix]
+
+        for check, entry in self._checks:
+            if check(name):
+                hits.append(entry)
+
+        if len(hits) > 1:
+            # A hint lands in exactly one bucket, so only ordering is needed
+            hits.sort()
+        return [(skill, kind) for _, skill, kind in hits]
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+
+    def _add(self, pattern: Any, entry: _Entry) -> None:
+        if hasattr(pattern, "matches"):
+            self._checks.append((pattern.matches, entry))
+            return
+
+        if not hasattr(pattern, "search"):
+            # Plain strings are case-insensitive substring hints
+            needle = str(pattern).lower()
+            self._checks.append((lambda name, s=needle: s in name.lower(), entry))
+            return
+
+        if self._add_literal(pattern, entry):
+            return
+
+        self._checks.append((lambda name, p=pattern: bool(p.search(name)), entry))
+
+    def _add_literal(self, pattern: "re.Pattern[str]", entry: _Entry) -> bool:
+        """Bucket anchored literal patterns; False if the pattern needs a regex."""
+        if pattern.flags & ~(re.IGNORECASE | re.UNICODE):
+            return False
+        ignore_case = bool(pattern.flags & re.IGNORECASE)
+        source = pattern.pattern
+
+        if not source.endswith("$") or source.endswith("\\$"):
+            return False
+
+        if source.startswith("^"):
+            names = _expand_literal(source[1:-1])
+            if not names:
+                return False
+            bucket = self._exact_ci if ignore_case else self._exact
+        else:
+            names = _expand_literal(source[:-1])
+            # Only single-extension suffixes (".unity") resolve via rfind(".")
+            if not names or any(n.rfind(".") != 0 for n in names):
+                return False
+            bucket = self._suffix_ci if ignore_case else self._suffix
+
+        for key in {n.lower() if ignore_case else n for n in names}:
+            bucket.setdefault(key, []).append(entry)
+        return True
+
+
+CONFIG_HINT_MATCHER = ConfigHintMatcher(KNOWN_CONFIG_HINTS)
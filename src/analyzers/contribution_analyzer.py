@@ -1,32 +1,24 @@
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import List, Dict, Set, Any, Tuple
+from typing import List, Dict, Iterable, Set, Any, Optional, Tuple
 import subprocess
 import re
 from src.FileCategorizer import FileCategorizer
-import yaml
+from src.pattern_automaton import iter_ids
+from src.rule_bundle import ROLE_SIGNALS_FILE, RoleRules, get_rule_bundle
 
-CONFIG_DIR = Path(__file__).parent.parent / "config"
-ROLE_SIGNALS_FILE = CONFIG_DIR / "role_signals.yml"
 
 class RoleSignals:
-    def __init__(self):
-        with open(ROLE_SIGNALS_FILE, "r", encoding="utf-8") as f:
-            self.conf = (yaml.safe_load(f) or {}).get("roles", {})
+    def __init__(self, rules: Optional[RoleRules] = None):
+        # Compiled role_signals.yml, shared by every instance unless given explicitly
+        rules = rules or get_rule_bundle().roles
+        self.conf = rules.roles
 
         # Pre-built lookup tables for O(1) scoring instead of per-call loops
-        self._lang_to_roles: Dict[str, List[str]] = {}
-        self._cat_to_roles: Dict[str, List[str]] = {}
-        self._path_patterns: List[tuple] = []  # [(pattern_lower, role)]
-
-        for role, rules in self.conf.items():
-            for lang in rules.get("languages", []):
-                self._lang_to_roles.setdefault(lang, []).append(role)
-            for cat in rules.get("categories", []):
-                self._cat_to_roles.setdefault(cat, []).append(role)
-            for p in rules.get("path_patterns", []):
-                self._path_patterns.append((p.lower(), role))
-
+        self._lang_to_roles = rules.lang_to_roles
+        self._cat_to_roles = rules.cat_to_roles
+        self._path_patterns = rules.path_patterns  # ((pattern_lower, role),)
+        self._path_automaton = rules.path_automaton
 
     def infer_role_bucket(self, path: str, language: str, category: str) -> str:
         lang = (language or "").strip()
@@ -39,9 +31,10 @@ class RoleSignals:
         if lang:
             for role in self._lang_to_roles.get(lang, []):
                 scores[role] = scores.get(role, 0) + 2
-        for pattern, role in self._path_patterns:
-            if pattern in path_l:
-                scores[role] = scores.get(role, 0) + 1
+        # One automaton pass finds every matching pattern, in pattern order
+        for pattern_id in iter_ids(self._path_automaton.scan(path_l)):
+            role = self._path_patterns[pattern_id][1]
+            scores[role] = scores.get(role, 0) + 1
         if not scores:
             return "none"
         best_role = max(scores, key=lambda r: scores[r])
@@ -271,6 +264,17 @@ class ContributionAnalyzer:
             )
         return self._cat_cache[path]
 
+    def _classify_files(self, paths: Iterable[str]) -> None:
+        """Fill the category cache for `paths` with one classify_many call."""
+        new = [path for path in paths if path not in self._cat_cache]
+        if not new:
+            return
+        codes = self.file_categorizer.classify_many(
+            new, [self._language_from_extension(path) for path in new]
+        )
+        names = self.file_categorizer.category_names
+        self._cat_cache.update(zip(new, (names[code] for code in codes)))
+
     def _categorize_file_path(self, path: str) -> str:
         if path not in self._coarse_cache:
             lower = path.lower().replace("\\", "/")
@@ -364,6 +368,8 @@ class ContributionAnalyzer:
             entry = author_data[email]
             entry["total_commits"] += 1
             entry["stats"].total_commits += 1  # add this line
+            # Classify the commit's new paths as one batch up front.
+            self._classify_files(files)
             for path, (ins, dels) in files.items():
                 self._accumulate_file(entry["stats"], path, ins, dels)
 
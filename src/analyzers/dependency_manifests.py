@@ -0,0 +1,341 @@
+"""
+dependency_manifests.py
+
+Parses dependency manifests (package.json, requirements.txt, pyproject.toml,
+pom.xml, go.mod, Cargo.toml, ...) into sets of lowercase dependency names,
+and resolves those names to skills via the rule tables in skill_patterns.py.
+
+Formats without a dedicated parser (lock files, setup.py, CMakeLists.txt,
+Gradle scripts, ...) fall back to the name-like tokens in the file, which
+keeps word rules such as "redis" working for them.
+
+Parsed name sets are cached by the SHA-256 of the file contents, so a
+manifest that has not changed is parsed once per process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import tomllib
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+import yaml
+
+from .skill_patterns import DEP_NAME_TO_SKILL, DEP_PREFIX_TO_SKILL, DEP_WORD_TO_SKILL
+
+# Upper bound on cached manifests; oldest entries are evicted first.
+CACHE_SIZE = 1024
+
+_CACHE: "OrderedDict[Tuple[str, str], FrozenSet[str]]" = OrderedDict()
+
+# PEP 508 requirement name at the start of a requirement string
+_REQUIREMENT_NAME_RE = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+_GEM_RE = re.compile(r"""^\s*gem\s+['"]([^'"]+)['"]""", re.M)
+_NAME_TOKEN_RE = re.compile(r"[@\w][\w.@/+-]*")
+_WORD_RE = re.compile(r"\w+")
+
+
+# ---------------------------------------------------------------------------
+# Parsers: text -> set of dependency names
+# ---------------------------------------------------------------------------
+
+def _scan_names(text: str) -> Set[str]:
+    """Fallback: every name-like token in the file."""
+    return set(_NAME_TOKEN_RE.findall(text.lower()))
+
+
+def _requirement_name(spec: Any) -> Optional[str]:
+    match = _REQUIREMENT_NAME_RE.match(str(spec))
+    return match.group(1).lower() if match else None
+
+
+def _requirement_names(specs: Iterable[Any]) -> Set[str]:
+    return {name for name in map(_requirement_name, specs) if name}
+
+
+def _parse_package_json(text: str) -> Set[str]:
+    data = json.loads(text)
+    names: Set[str] = set()
+    for section in (
+        "dependencies",
+        "devDependencies",
+        "peerDependencies",
+        "optionalDependencies",
+    ):
+        deps = data.get(section)
+        if isinstance(deps, dict):
+            names.update(str(k).lower() for k in deps)
+    return names
+
+
+def _parse_package_lock(text: str) -> Set[str]:
+    data = json.loads(text)
+    names: Set[str] = set()
+    # lockfileVersion >= 2: "node_modules/<name>" keys
+    for key in data.get("packages") or {}:
+        if key:
+            names.add(key.rsplit("node_modules/", 1)[-1].lower())
+    # lockfileVersion 1
+    names.update(str(k).lower() for k in data.get("dependencies") or {})
+    return names
+
+
+def _parse_requirements(text: str) -> Set[str]:
+    names: Set[str] = set()
+    for line in text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line or line.startswith("-"):
+            continue
+        name = _requirement_name(line)
+        if name:
+            names.add(name)
+    return names
+
+
+def _parse_pyproject(text: str) -> Set[str]:
+    data = tomllib.loads(text)
+    names: Set[str] = set()
+
+    project = data.get("project") or {}
+    names |= _requirement_names(project.get("dependencies") or [])
+    for group in (project.get("optional-dependencies") or {}).values():
+        names |= _requirement_names(group)
+
+    build = data.get("build-system") or {}
+    names |= _requirement_names(build.get("requires") or [])
+
+    poetry = (data.get("tool") or {}).get("poetry")
+    if isinstance(poetry, dict):
+        names.add("poetry")
+        tables = [poetry.get("dependencies"), poetry.get("dev-dependencies")]
+        tables += [g.get("dependencies") for g in (poetry.get("group") or {}).values()]
+        for table in tables:
+            if isinstance(table, dict):
+                names.update(str(k).lower() for k in table)
+    return names
+
+
+def _parse_pipfile(text: str) -> Set[str]:
+    data = tomllib.loads(text)
+    names: Set[str] = set()
+    for section in ("packages", "dev-packages"):
+        names.update(str(k).lower() for k in data.get(section) or {})
+    return names
+
+
+def _parse_environment(text: str) -> Set[str]:
+    data = yaml.safe_load(text) or {}
+    names: Set[str] = set()
+    for dep in data.get("dependencies") or []:
+        if isinstance(dep, dict):
+            names |= _requirement_names(dep.get("pip") or [])
+        else:
+            # conda specs: "channel::name=version"
+            names |= _requirement_names([str(dep).rsplit("::", 1)[-1]])
+    return names
+
+
+def _parse_pom(text: str) -> Set[str]:
+    root = ET.fromstring(text)
+    names: Set[str] = set()
+    # dependencies, plugins and <parent> all carry groupId/artifactId pairs
+    for elem in root.iter():
+        coords = {
+            child.tag.rsplit("}", 1)[-1]: (child.text or "").strip()
+            for child in elem
+        }
+        artifact = coords.get("artifactId")
+        if artifact and elem is not root:
+            group = coords.get("groupId", "")
+            names.add(f"{group}:{artifact}".lower() if group else artifact.lower())
+    return names
+
+
+def _parse_msbuild(text: str) -> Set[str]:
+    """*.csproj and packages.config: SDK plus package references."""
+    root = ET.fromstring(text)
+    names: Set[str] = set()
+    sdk = root.get("Sdk")
+    if sdk:
+        names.add(sdk.lower())
+    for elem in root.iter():
+        tag = elem.tag.rsplit("}", 1)[-1]
+        if tag in ("PackageReference", "Reference", "Sdk"):
+            ref = elem.get("Include") or elem.get("Name")
+        elif tag == "package":
+            ref = elem.get("id")
+        else:
+            continue
+        if ref:
+            names.add(ref.split(",", 1)[0].strip().lower())
+    return names
+
+
+def _parse_go_mod(text: str) -> Set[str]:
+    names: Set[str] = set()
+    in_block = False
+    for line in text.splitlines():
+        line = line.split("//", 1)[0].strip()
+        if not line:
+            continue
+        if in_block:
+            if line == ")":
+                in_block = False
+            else:
+                names.add(line.split()[0].lower())
+        elif line.startswith("require"):
+            rest = line[len("require"):].strip()
+            if rest == "(":
+                in_block = True
+            elif rest:
+                names.add(rest.split()[0].lower())
+    return names
+
+
+def _parse_cargo(text: str) -> Set[str]:
+    data = tomllib.loads(text)
+    names: Set[str] = set()
+    tables = [data] + list((data.get("target") or {}).values())
+    for table in tables:
+        for section in ("dependencies", "dev-dependencies", "build-dependencies"):
+            names.update(str(k).lower() for k in table.get(section) or {})
+    return names
+
+
+def _parse_gemfile(text: str) -> Set[str]:
+    return {name.lower() for name in _GEM_RE.findall(text)}
+
+
+def _parse_pubspec(text: str) -> Set[str]:
+    data = yaml.safe_load(text) or {}
+    names: Set[str] = set()
+    for section in ("dependencies", "dev_dependencies"):
+        names.update(str(k).lower() for k in data.get(section) or {})
+    return names
+
+
+# Keyed by file name; "*.<ext>" keys match by extension.
+MANIFEST_PARSERS: Dict[str, Callable[[str], Set[str]]] = {
+    "package.json": _parse_package_json,
+    "package-lock.json": _parse_package_lock,
+    "requirements.txt": _parse_requirements,
+    "pyproject.toml": _parse_pyproject,
+    "Pipfile": _parse_pipfile,
+    "environment.yml": _parse_environment,
+    "pom.xml": _parse_pom,
+    "*.csproj": _parse_msbuild,
+    "packages.config": _parse_msbuild,
+    "go.mod": _parse_go_mod,
+    "Cargo.toml": _parse_cargo,
+    "Gemfile": _parse_gemfile,
+    "pubspec.yaml": _parse_pubspec,
+}
+
+
+def _parser_key(path: Path) -> str:
+    if path.name in MANIFEST_PARSERS:
+        return path.name
+    ext_key = "*" + path.suffix.lower()
+    return ext_key if ext_key in MANIFEST_PARSERS else ""
+
+
+def parse_manifest_text(path: Path, text: str) -> FrozenSet[str]:
+    """
+    Parse manifest text into lowercase dependency names.
+
+    Malformed JSON/TOML/XML/YAML falls back to the token scan rather than
+    dropping the file.
+    """
+    parser = MANIFEST_PARSERS.get(_parser_key(path))
+    if parser is not None:
+        try:
+            return frozenset(parser(text))
+        except (ValueError, TypeError, AttributeError, ET.ParseError, yaml.YAMLError):
+            pass
+    return frozenset(_scan_names(text))
+
+
+def parse_manifest(path: Path) -> Optional[FrozenSet[str]]:
+    """
+    Return the dependency names declared in `path`, or None if unreadable.
+    Results are cached by content hash.
+    """
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+
+    key = (_parser_key(path), hashlib.sha256(data).hexdigest())
+    names = _CACHE.get(key)
+    if names is not None:
+        _CACHE.move_to_end(key)
+        return names
+
+    names = parse_manifest_text(path, data.decode("utf-8", errors="ignore"))
+    _CACHE[key] = names
+    while len(_CACHE) > CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return names
+
+
+def clear_cache() -> None:
+    """Drop all cached manifests."""
+    _CACHE.clear()
+
+
+# ---------------------------------------------------------------------------
+# Name -> skill resolution
+# ---------------------------------------------------------------------------
+
+_Rule = Tuple[str, Optional[Set[str]]]
+
+
+def _index(rules: List[Tuple[str, str, Optional[Set[str]]]]) -> Dict[str, List[_Rule]]:
+    index: Dict[str, List[_Rule]] = {}
+    for key, skill, allowed in rules:
+        index.setdefault(key.lower(), []).append((skill, allowed))
+    return index
+
+
+_NAME_INDEX = _index(DEP_NAME_TO_SKILL)
+_WORD_INDEX = _index(DEP_WORD_TO_SKILL)
+_PREFIX_INDEX = _index(DEP_PREFIX_TO_SKILL)
+_PREFIXES = tuple(_PREFIX_INDEX)
+
+
+def _allows(allowed: Optional[Set[str]], path: Path) -> bool:
+    """allowed entries starting with "*." are extension patterns (e.g. "*.csproj")."""
+    if allowed is None or path.name in allowed:
+        return True
+    return ("*" + path.suffix.lower()) in allowed
+
+
+def resolve_skills(path: Path, names: Iterable[str]) -> Dict[str, str]:
+    """
+    Map dependency names from manifest `path` to skills.
+
+    Returns {skill: dependency name that triggered it}; when several names
+    map to the same skill, the alphabetically first one is reported.
+    """
+    found: Dict[str, str] = {}
+
+    def hit(rules: Optional[List[_Rule]], name: str) -> None:
+        for skill, allowed in rules or ():
+            if _allows(allowed, path) and (skill not in found or name < found[skill]):
+                found[skill] = name
+
+    for name in names:
+        hit(_NAME_INDEX.get(name), name)
+        words = _WORD_RE.findall(name)
+        for word in {name, *words}:
+            hit(_WORD_INDEX.get(word), name)
+            if word.startswith(_PREFIXES):
+                for prefix in _PREFIXES:
+                    if word.startswith(prefix):
+                        hit(_PREFIX_INDEX[prefix], name)
+    return found
@@ -2,6 +2,8 @@ from pathlib import Path
 import yaml
 from typing import Dict, List, Optional
 
+from utils.tree_walk import walk_tree
+
 """
 language_detector.py
 
@@ -19,7 +21,7 @@ E.g. {"Javascript": 48.6, "Java": 43.6, "CSS": 5.9, "SQL": 1.5, "HTML": 0.3}
 
 Workflow overview: 
 1. analyze_language_share: acts as the main entry point of the module
-2. filter_files: all files are scanned recursively, irrelevant files (e.g. build files, hidden files) are filtered out.
+2. filter_files: files are scanned recursively, pruning ignored directories before descending; irrelevant files (e.g. build files, hidden files) are filtered out.
 3. aggregate_loc_by_language: for each 'relevant file', if the extension exists in the LANGUAGE_MAP, calls count_loc_by_file helper function.
 4. count_loc_by_file: counts lines of code of a file, skipping over empty lines.
 5. the final calculation of share per language is done in analyze_language_share, which returns the dict.
@@ -66,6 +68,11 @@ IGNORED_DIRS = set(IGNORED_DIRS_YAML.get("ignored_dirs", []))
 IGNORED_EXTENSIONS = set(str(ext).lower() for ext in IGNORED_DIRS_YAML.get("ignored_extensions", []))
 IGNORED_FILENAMES = set(name.lower() for name in IGNORED_DIRS_YAML.get("ignored_filenames", []))
 
+# Directories never descended into while looking for source files. .git is
+# pruned here rather than listed in ignored_directories.yml, because zip
+# extraction and repository discovery still need .git directories.
+PRUNED_DIRS = IGNORED_DIRS | {".git"}
+
 def analyze_language_share(root_dir: str) -> Dict[str, float]:
     """Return a dict where:
     - Key: language name (str)
@@ -87,33 +94,33 @@ def analyze_language_share(root_dir: str) -> Dict[str, float]:
 def filter_files(path: Path) -> List[Path]:
     """Return a list of files to analyze, ignoring hidden files and specified directories."""
     relevant_files = []
-    all_files = [f for f in path.rglob("*") if f.is_file()]
 
-    for file in all_files:
-        filename = file.name.lower()
-        extension = file.suffix.lstrip(".").lower()
+    for _, dirs, files in walk_tree(path):
+        # 1. Ignore directories (pruned before descending into them)
+        dirs[:] = [d for d in dirs if d.name.lower() not in PRUNED_DIRS]
 
-        # 1. Ignore hidden files
-        if filename.startswith("."):
-            continue
+        for entry in files:
+            filename = entry.name.lower()
+            dot = filename.rfind(".")
+            extension = filename[dot + 1:] if dot > 0 else ""
 
-        # 2. Ignore directories
-        if any(part.lower() in IGNORED_DIRS for part in file.parts):
-            continue
+            # 2. Ignore hidden files
+            if filename.startswith("."):
+                continue
 
-        # 3. Ignore filenames
-        if filename in IGNORED_FILENAMES:
-            continue
+            # 3. Ignore filenames
+            if filename in IGNORED_FILENAMES:
+                continue
 
-        # 4. Ignore extensions
-        if extension in IGNORED_EXTENSIONS:
-            continue
+            # 4. Ignore extensions
+            if extension in IGNORED_EXTENSIONS:
+                continue
 
-        # 5. Only process known-language extensions
-        if extension not in LANGUAGE_MAP:
-            continue
+            # 5. Only process known-language extensions
+            if extension not in LANGUAGE_MAP:
+                continue
 
-        relevant_files.append(file)
+            relevant_files.append(Path(entry.path))
 
     return relevant_files
 
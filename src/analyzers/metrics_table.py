@@ -0,0 +1,172 @@
+"""
+metrics_table.py
+
+Columnar (struct-of-arrays) storage for per-file code metrics.
+
+Rows are grouped by language, so each language is a contiguous slice of
+every column and per-language totals are plain slice reductions over
+`array` buffers.
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Integer columns, in storage order (names match CodeFileAnalysis fields)
+COLUMNS: Tuple[str, ...] = (
+    "total_lines",
+    "code_lines",
+    "comment_lines",
+    "blank_lines",
+    "function_count",
+    "max_function_length",
+    "total_function_lines",
+    "is_test",
+)
+
+_TYPECODE = "q"  # signed 64-bit on every supported platform
+
+# Name given to files without a detected language
+UNKNOWN_LANGUAGE = "Unknown"
+
+
+class MetricsTable:
+    """
+    Per-file metrics as one `array('q')` per column.
+
+    Attributes:
+        languages: language names, in order of first appearance
+        offsets:   rows for languages[i] are offsets[i]:offsets[i + 1]
+        columns:   column name -> array of per-file values
+    """
+
+    def __init__(
+        self,
+        languages: List[str],
+        offsets: "array[int]",
+        columns: Dict[str, "array[int]"],
+    ) -> None:
+        self.languages = languages
+        self.offsets = offsets
+        self.columns = columns
+
+    def __len__(self) -> int:
+        return self.offsets[-1] if self.offsets else 0
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_analyses(cls, analyses: Iterable[Any]) -> "MetricsTable":
+        """Build a table from CodeFileAnalysis-like objects."""
+        analyses = list(analyses)
+        raw_langs = list(map(attrgetter("language"), analyses))
+
+        # Language codes in order of first appearance; None/"" count as UNKNOWN_LANGUAGE
+        names: List[str] = []
+        code_of: Dict[Any, int] = {}
+        for lang in dict.fromkeys(raw_langs):
+            name = lang or UNKNOWN_LANGUAGE
+            if name not in names:
+                names.append(name)
+            code_of[lang] = names.index(name)
+
+        # One pass over the objects, then transpose with strided slices
+        rows = list(map(attrgetter(*COLUMNS), analyses))
+        codes = list(map(code_of.__getitem__, raw_langs))
+        if len(names) > 1:
+            # Stable sort, so rows keep their relative order within a language
+            order = sorted(range(len(codes)), key=codes.__getitem__)
+            rows = list(map(rows.__getitem__, order))
+
+        flat = array(_TYPECODE)
+        flat.fromlist(list(chain.from_iterable(rows)))
+        width = len(COLUMNS)
+        columns = {name: flat[i::width] for i, name in enumerate(COLUMNS)}
+
+        offsets = array(_TYPECODE, [0])
+        for code in range(len(names)):
+            offsets.append(offsets[-1] + codes.count(code))
+
+        return cls(names, offsets, columns)
+
+    # ------------------------------------------------------------------
+    # Summaries
+    # ------------------------------------------------------------------
+
+    def language_totals(self, column: str) -> Dict[str, int]:
+        """Sum of `column` per language, in table order."""
+        values = self.columns[column]
+        return {
+            lang: sum(values[self.offsets[i]:self.offsets[i + 1]])
+            for i, lang in enumerate(self.languages)
+        }
+
+    def summarize(self) -> Dict[str, Any]:
+        """
+        Overall and per-language stats, in the shape returned by
+        CodeMetricsAnalyzer.summarize().
+        """
+        col = self.columns
+        total_files = len(self)
+        total_functions = sum(col["function_count"])
+        total_function_lines = sum(col["total_function_lines"])
+        total_code = sum(col["code_lines"])
+        total_comment = sum(col["comment_lines"])
+        num_test_files = sum(col["is_test"])
+        num_code_files = total_files - num_test_files
+
+        denom = total_comment + total_code
+        overall = {
+            "file_count": total_files,
+            "total_files": total_files,
+            "num_code_files": num_code_files,
+            "num_test_files": num_test_files,
+            # Ratio of test files to code files (tests assume denominator = code files)
+            "test_file_ratio": (
+                num_test_files / num_code_files if num_code_files > 0 else 0.0
+            ),
+            "total_lines_of_code": total_code,
+            "avg_function_length": (
+                total_function_lines / total_functions if total_functions > 0 else 0.0
+            ),
+            "max_function_length": max(col["max_function_length"], default=0),
+            # Comment ratio = comment / (comment + code)
+            "comment_ratio": (total_comment / denom) if denom > 0 else 0.0,
+            "avg_functions_per_file": (
+                total_functions / total_files if total_files > 0 else 0.0
+            ),
+        }
+
+        per_language: Dict[str, Dict[str, Any]] = {}
+        for i, lang in enumerate(self.languages):
+            start, stop = self.offsets[i], self.offsets[i + 1]
+            file_count = stop - start
+            code_lines = sum(col["code_lines"][start:stop])
+            comment_lines = sum(col["comment_lines"][start:stop])
+            functions = sum(col["function_count"][start:stop])
+            denom = comment_lines + code_lines
+            per_language[lang] = {
+                "file_count": file_count,
+                "loc": code_lines,
+                "functions": functions,
+                "comment_lines": comment_lines,
+                "code_lines": code_lines,
+                "test_file_count": sum(col["is_test"][start:stop]),
+                "max_function_length": max(
+                    col["max_function_length"][start:stop], default=0
+                ),
+                "comment_ratio": comment_lines / denom if denom > 0 else 0.0,
+                "avg_functions_per_file": (
+                    functions / file_count if file_count > 0 else 0.0
+                ),
+            }
+
+        return {
+            "overall": overall,
+            "per_language": per_language,
+        }
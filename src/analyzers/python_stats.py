@@ -0,0 +1,127 @@
+"""
+python_stats.py
+
+AST-based structural counters for Python source files, consumed by
+ProficiencyEstimator via SkillAnalyzer's stats["python"] block.
+
+Counters (all ints):
+  - defs:        every function definition, sync or async
+  - async_defs:  the async subset of defs
+  - classes:     class definitions
+  - with_blocks: `with` / `async with` statements
+  - doc_quotes:  docstrings on the module, classes and functions
+  - type_arrows: functions with a return annotation
+  - type_params: annotated parameters (including *args / **kwargs)
+
+Results are cached by the SHA-256 of the file contents (the same digest
+utils.file_hashing.compute_file_hash produces), so unchanged files are not
+re-parsed across analysis runs in the same process.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+PYTHON_STAT_KEYS: Tuple[str, ...] = (
+    "defs",
+    "async_defs",
+    "classes",
+    "with_blocks",
+    "doc_quotes",
+    "type_arrows",
+    "type_params",
+)
+
+# Upper bound on cached entries; oldest entries are evicted first.
+CACHE_SIZE = 4096
+
+_CACHE: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+
+
+def empty_python_stats() -> Dict[str, int]:
+    """Return a counter dict with every key set to zero."""
+    return dict.fromkeys(PYTHON_STAT_KEYS, 0)
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest used as the cache key."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def collect_python_stats(source: str) -> Dict[str, int]:
+    """
+    Parse `source` and count the structural features listed above.
+
+    Files that do not parse (syntax errors, Python 2 code, null bytes)
+    yield all-zero counters rather than raising.
+    """
+    stats = empty_python_stats()
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return stats
+
+    if ast.get_docstring(tree, clean=False) is not None:
+        stats["doc_quotes"] += 1
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            stats["defs"] += 1
+            if isinstance(node, ast.AsyncFunctionDef):
+                stats["async_defs"] += 1
+            if node.returns is not None:
+                stats["type_arrows"] += 1
+            stats["type_params"] += _count_annotated_args(node.args)
+            if ast.get_docstring(node, clean=False) is not None:
+                stats["doc_quotes"] += 1
+        elif isinstance(node, ast.ClassDef):
+            stats["classes"] += 1
+            if ast.get_docstring(node, clean=False) is not None:
+                stats["doc_quotes"] += 1
+        elif isinstance(node, (ast.With, ast.AsyncWith)):
+            stats["with_blocks"] += 1
+
+    return stats
+
+
+def cached_python_stats(digest: str) -> Optional[Dict[str, int]]:
+    """Return a copy of the cached counters for `digest`, if present."""
+    stats = _CACHE.get(digest)
+    if stats is None:
+        return None
+    _CACHE.move_to_end(digest)
+    return dict(stats)
+
+
+def remember_python_stats(digest: str, stats: Dict[str, int]) -> None:
+    """Store counters for `digest`, evicting the oldest entries past CACHE_SIZE."""
+    _CACHE[digest] = dict(stats)
+    _CACHE.move_to_end(digest)
+    while len(_CACHE) > CACHE_SIZE:
+        _CACHE.popitem(last=False)
+
+
+def python_stats_for(source: str, digest: str) -> Dict[str, int]:
+    """Return counters for `source`, parsing only on a cache miss."""
+    stats = cached_python_stats(digest)
+    if stats is None:
+        stats = collect_python_stats(source)
+        remember_python_stats(digest, stats)
+    return stats
+
+
+def clear_cache() -> None:
+    """Drop all cached counters."""
+    _CACHE.clear()
+
+
+def _count_annotated_args(args: ast.arguments) -> int:
+    params = [*args.posonlyargs, *args.args, *args.kwonlyargs]
+    if args.vararg is not None:
+        params.append(args.vararg)
+    if args.kwarg is not None:
+        params.append(args.kwarg)
+    return sum(1 for p in params if p.annotation is not None)
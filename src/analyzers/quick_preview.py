@@ -0,0 +1,85 @@
+"""
+quick_preview.py
+
+Instant project estimate built only from the ZIP central directory, i.e.
+the ProjectFolder tree returned by ZipParser.parse_zip_to_project_folders.
+Nothing is extracted or read, so it is available right after upload,
+before the full analysis pipeline runs.
+
+- file_count / categories: the same inputs analyze_metadata and
+  analyze_categories use, so these match the full run.
+- language_share: weighted by uncompressed bytes rather than lines of
+  code, so it only approximates the final language_share.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.FileCategorizer import FileCategorizer
+from src.ProjectFolder import ProjectFolder
+from .language_detector import detect_language_per_file
+
+
+def _iter_files(root: ProjectFolder) -> List[Any]:
+    files: List[Any] = []
+    stack = [root]
+    while stack:
+        folder = stack.pop()
+        files.extend(folder.children)
+        stack.extend(folder.subdir)
+    return files
+
+
+def estimate_project_folder(
+    root: ProjectFolder, categorizer: Optional[FileCategorizer] = None
+) -> Dict[str, Any]:
+    """
+    Estimate file counts, category counts and byte-weighted language share
+    for one parsed project folder.
+    """
+    categorizer = categorizer or FileCategorizer()
+    files = _iter_files(root)
+    paths = [f.full_path for f in files]
+    languages = [detect_language_per_file(Path(path)) for path in paths]
+    codes = categorizer.classify_many(paths, languages)
+    ignored_code = categorizer.category_names.index("ignored")
+
+    language_bytes: Counter = Counter()
+    total_bytes = 0
+
+    for f, language, code in zip(files, languages, codes):
+        size = int(f.size or 0)
+        total_bytes += size
+
+        # Mirror language_detector.filter_files: hidden and ignored files
+        # do not count towards language share.
+        if language and code != ignored_code and not f.file_name.startswith("."):
+            language_bytes[language] += size
+
+    names = categorizer.category_names
+    categories = {names[code]: n for code, n in Counter(codes).items()}
+
+    weighted_total = sum(language_bytes.values())
+    language_share = {
+        lang: round(size / weighted_total * 100, 1)
+        for lang, size in language_bytes.most_common()
+    } if weighted_total else {}
+
+    return {
+        "name": root.name,
+        "file_count": len(files),
+        "total_bytes": total_bytes,
+        "categories": categories,
+        "language_share": language_share,
+    }
+
+
+def estimate_zip_projects(
+    root_folders: List[ProjectFolder], categorizer: Optional[FileCategorizer] = None
+) -> List[Dict[str, Any]]:
+    """Estimate every root folder of a parsed ZIP, sharing one categorizer."""
+    categorizer = categorizer or FileCategorizer()
+    return [estimate_project_folder(root, categorizer) for root in root_folders]
@@ -19,66 +19,90 @@ DART_DEP_FILES: Set[str] = {"pubspec.yaml"}
 RUST_DEP_FILES: Set[str] = {"Cargo.toml"}
 ALL_DEP_FILES: Optional[Set[str]] = None  # None = match any dependency file
 
-# Each entry: (pattern, skill, allowed_dep_files)
-# allowed_dep_files=None means the pattern runs against all dependency files.
-DEP_TO_SKILL: List[Tuple[re.Pattern, str, Optional[Set[str]]]] = [
+# Dependency-name rules, resolved against the dependency names parsed out of
+# each manifest by dependency_manifests.py. Each entry:
+#   (name, skill, allowed_dep_files)
+# allowed_dep_files=None means the rule applies to all dependency files.
+# Names are lowercase.
+
+# Exact package names (the full dependency name must match)
+DEP_NAME_TO_SKILL: List[Tuple[str, str, Optional[Set[str]]]] = [
     # JS/TS — only look in JS package files
-    (re.compile(r"\"react(-dom)?\"", re.I), "React", JS_DEP_FILES),
-    (re.compile(r"\"next\"", re.I), "Next.js", JS_DEP_FILES),
-    (re.compile(r"\"@angular/core\"", re.I), "Angular", JS_DEP_FILES),
-    (re.compile(r"\"vue\"", re.I), "Vue", JS_DEP_FILES),
-    (re.compile(r"\"svelte\"", re.I), "Svelte", JS_DEP_FILES),
-    (re.compile(r"\"express\"", re.I), "Node.js", JS_DEP_FILES),
-    (re.compile(r"\"typescript\"", re.I), "TypeScript", JS_DEP_FILES),
-    (re.compile(r"\"webpack\"", re.I), "Webpack", JS_DEP_FILES),
-    (re.compile(r"\"vite\"", re.I), "Vite", JS_DEP_FILES),
-    (re.compile(r"\"jest\"", re.I), "Jest", JS_DEP_FILES),
-    (re.compile(r"\"vitest\"", re.I), "Vitest", JS_DEP_FILES),
-    (re.compile(r"\"cypress\"", re.I), "Cypress", JS_DEP_FILES),
-    (re.compile(r"\"@playwright/", re.I), "Playwright", JS_DEP_FILES),
-    (re.compile(r"\"tailwindcss\"", re.I), "Tailwind", JS_DEP_FILES),
-    (re.compile(r"\"bootstrap\"", re.I), "Bootstrap", JS_DEP_FILES),
-    (re.compile(r"\"(@reduxjs/toolkit|redux)\"", re.I), "Redux", JS_DEP_FILES),
+    ("react", "React", JS_DEP_FILES),
+    ("react-dom", "React", JS_DEP_FILES),
+    ("next", "Next.js", JS_DEP_FILES),
+    ("@angular/core", "Angular", JS_DEP_FILES),
+    ("vue", "Vue", JS_DEP_FILES),
+    ("svelte", "Svelte", JS_DEP_FILES),
+    ("express", "Node.js", JS_DEP_FILES),
+    ("typescript", "TypeScript", JS_DEP_FILES),
+    ("webpack", "Webpack", JS_DEP_FILES),
+    ("vite", "Vite", JS_DEP_FILES),
+    ("jest", "Jest", JS_DEP_FILES),
+    ("vitest", "Vitest", JS_DEP_FILES),
+    ("cypress", "Cypress", JS_DEP_FILES),
+    ("tailwindcss", "Tailwind", JS_DEP_FILES),
+    ("bootstrap", "Bootstrap", JS_DEP_FILES),
+    ("@reduxjs/toolkit", "Redux", JS_DEP_FILES),
+    ("redux", "Redux", JS_DEP_FILES),
+    # Python
+    ("scikit-learn", "scikit-learn", PYTHON_DEP_FILES),
+    ("py.test", "PyTest", PYTHON_DEP_FILES),
+]
+
+# Whole words inside a dependency name (e.g. "django" in "django-cors-headers"
+# or "junit" in "org.junit.jupiter:junit-jupiter")
+DEP_WORD_TO_SKILL: List[Tuple[str, str, Optional[Set[str]]]] = [
     # Python — only look in Python dep files
-    (re.compile(r"\bdjango\b", re.I), "Django", PYTHON_DEP_FILES),
-    (re.compile(r"\bflask\b", re.I), "Flask", PYTHON_DEP_FILES),
-    (re.compile(r"\bfastapi\b", re.I), "FastAPI", PYTHON_DEP_FILES),
-    (re.compile(r"\bpandas\b", re.I), "Pandas", PYTHON_DEP_FILES),
-    (re.compile(r"\bnumpy\b", re.I), "NumPy", PYTHON_DEP_FILES),
-    (re.compile(r"(scikit-learn|sklearn)", re.I), "scikit-learn", PYTHON_DEP_FILES),
-    (re.compile(r"\bmatplotlib\b", re.I), "Matplotlib", PYTHON_DEP_FILES),
-    (re.compile(r"(pytest|py\.test)", re.I), "PyTest", PYTHON_DEP_FILES),
-    (re.compile(r"\bpoetry\b", re.I), "Poetry", PYTHON_DEP_FILES),
-    (re.compile(r"\bplaywright\b", re.I), "Playwright", PYTHON_DEP_FILES),
+    ("django", "Django", PYTHON_DEP_FILES),
+    ("flask", "Flask", PYTHON_DEP_FILES),
+    ("fastapi", "FastAPI", PYTHON_DEP_FILES),
+    ("pandas", "Pandas", PYTHON_DEP_FILES),
+    ("numpy", "NumPy", PYTHON_DEP_FILES),
+    ("sklearn", "scikit-learn", PYTHON_DEP_FILES),
+    ("matplotlib", "Matplotlib", PYTHON_DEP_FILES),
+    ("poetry", "Poetry", PYTHON_DEP_FILES),
+    ("playwright", "Playwright", PYTHON_DEP_FILES),
     # Java — only look in Java build files
-    (re.compile(r"spring(-boot)?", re.I), "Spring", JAVA_DEP_FILES),
-    (re.compile(r"\bjunit\b", re.I), "JUnit", JAVA_DEP_FILES),
-    (re.compile(r"\bhibernate\b", re.I), "Hibernate", JAVA_DEP_FILES),
+    ("junit", "JUnit", JAVA_DEP_FILES),
+    ("hibernate", "Hibernate", JAVA_DEP_FILES),
     # Ruby
-    (re.compile(r"\brails\b", re.I), "Rails", RUBY_DEP_FILES),
-    (re.compile(r"\brspec\b", re.I), "RSpec", RUBY_DEP_FILES),
+    ("rails", "Rails", RUBY_DEP_FILES),
+    ("rspec", "RSpec", RUBY_DEP_FILES),
     # Dart / Flutter
-    (re.compile(r"\bflutter\b", re.I), "Flutter", DART_DEP_FILES),
+    ("flutter", "Flutter", DART_DEP_FILES),
     # C++ / Tooling
-    (re.compile(r"\bcmake\b", re.I), "CMake", CPP_DEP_FILES),
-    (re.compile(r"\bconan\b", re.I), "Conan", CPP_DEP_FILES),
+    ("cmake", "CMake", CPP_DEP_FILES),
+    ("conan", "Conan", CPP_DEP_FILES),
     # .NET
-    (re.compile(r"(asp\.?net|entityframework|efcore)", re.I), "ASP.NET", DOTNET_DEP_FILES),
-    (re.compile(r"(microsoft\.net|dotnet)", re.I), ".NET", DOTNET_DEP_FILES),
+    ("dotnet", ".NET", DOTNET_DEP_FILES),
     # Game — Unity/Unreal are never listed in standard dep files; detected via config/snippet only
     # DB / Cloud — these are safe to match broadly since names are distinctive
-    (re.compile(r"\bpostgres(ql)?\b", re.I), "PostgreSQL", ALL_DEP_FILES),
-    (re.compile(r"\bmysql\b", re.I), "MySQL", ALL_DEP_FILES),
-    (re.compile(r"\bsqlite\b", re.I), "SQLite", ALL_DEP_FILES),
-    (re.compile(r"\bmongodb\b", re.I), "MongoDB", ALL_DEP_FILES),
-    (re.compile(r"\bredis\b", re.I), "Redis", ALL_DEP_FILES),
-    (re.compile(r"\baws\b", re.I), "AWS", ALL_DEP_FILES),
-    (re.compile(r"google-cloud-", re.I), "GCP", ALL_DEP_FILES),
-    (re.compile(r"\bazure\b", re.I), "Azure", ALL_DEP_FILES),
-    (re.compile(r"\bfirebase\b", re.I), "Firebase", ALL_DEP_FILES),
+    ("postgres", "PostgreSQL", ALL_DEP_FILES),
+    ("postgresql", "PostgreSQL", ALL_DEP_FILES),
+    ("mysql", "MySQL", ALL_DEP_FILES),
+    ("sqlite", "SQLite", ALL_DEP_FILES),
+    ("mongodb", "MongoDB", ALL_DEP_FILES),
+    ("redis", "Redis", ALL_DEP_FILES),
+    ("aws", "AWS", ALL_DEP_FILES),
+    ("azure", "Azure", ALL_DEP_FILES),
+    ("firebase", "Firebase", ALL_DEP_FILES),
     # Other
-    (re.compile(r"\bgraphql\b", re.I), "GraphQL", ALL_DEP_FILES),
-    (re.compile(r"\bgrpc\b", re.I), "gRPC", ALL_DEP_FILES),
+    ("graphql", "GraphQL", ALL_DEP_FILES),
+    ("grpc", "gRPC", ALL_DEP_FILES),
+]
+
+# Prefixes of a dependency name or of any word inside it
+DEP_PREFIX_TO_SKILL: List[Tuple[str, str, Optional[Set[str]]]] = [
+    ("@playwright/", "Playwright", JS_DEP_FILES),
+    ("pytest", "PyTest", PYTHON_DEP_FILES),
+    ("spring", "Spring", JAVA_DEP_FILES),
+    ("aspnet", "ASP.NET", DOTNET_DEP_FILES),
+    ("asp.net", "ASP.NET", DOTNET_DEP_FILES),
+    ("entityframework", "ASP.NET", DOTNET_DEP_FILES),
+    ("efcore", "ASP.NET", DOTNET_DEP_FILES),
+    ("microsoft.net", ".NET", DOTNET_DEP_FILES),
+    ("google-cloud-", "GCP", ALL_DEP_FILES),
 ]
 
 
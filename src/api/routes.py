@@ -1,14 +1,16 @@
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any, List, Optional
 
-from fastapi import APIRouter, UploadFile, File, HTTPException, status, Depends
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, BackgroundTasks, UploadFile, File, HTTPException, Query, status, Depends
+from fastapi.responses import FileResponse, HTMLResponse, StreamingResponse
 from pathlib import Path
-from collections import Counter
 import tempfile, shutil
 from uuid import uuid4
 from pydantic import BaseModel
 
 from src.analyzers.ProjectAnalyzer import ProjectAnalyzer
+from src.managers.AuthorManager import AuthorManager
 from src.managers.ConfigManager import ConfigManager
 from src.managers.ConsentManager import ConsentManager
 from src.managers.ProjectManager import ProjectManager
@@ -16,13 +18,20 @@ from src.managers.ReportManager import ReportManager
 from src.exporters.ReportExporter import ReportExporter
 from src.generators.PortfolioGenerator import PortfolioGenerator
 from src.ZipParser import parse_zip_to_project_folders
+from src.analyzers.quick_preview import estimate_zip_projects
 from src.services.badge_wrapped_service import build_badge_progress, build_yearly_wrapped
+from src.services.retention_service import maybe_apply_retention
+from src.services.transfer_service import export_ndjson, import_ndjson
 
 from src.api.schemas.skills import SkillsListResponse, SkillItem, SkillsUsageResponse, SkillUsageItem
 from src.api.schemas.projects import (
     UploadProjectResponse,
+    ProjectPreview,
+    ProjectPreviewResponse,
     ProjectsListResponse,
     ProjectSummary,
+    RankedProject,
+    RankedProjectsResponse,
     ProjectDetailResponse,
     ProjectDetail,
 )
@@ -235,7 +244,7 @@ def _require_report_kind(report, expected_kind: str):
 
 
 @router.post("/projects/upload-path", dependencies=[Depends(require_consent)])
-def upload_project_from_path(req: UploadPathRequest):
+def upload_project_from_path(req: UploadPathRequest, background_tasks: BackgroundTasks):
     """
     Dev-only endpoint: load a ZIP file from a local path on the backend.
     WARNING: This endpoint is for development/testing only.
@@ -252,6 +261,8 @@ def upload_project_from_path(req: UploadPathRequest):
     analyzer = ProjectAnalyzer(ConfigManager(), root_folders, zip_path)
     created_projects = analyzer.initialize_projects()
     pending_duplicates, pending_identity = _run_post_upload_analyses(analyzer, created_projects)
+    # Each upload adds a workspace; expire old ones after the response is sent
+    background_tasks.add_task(maybe_apply_retention)
     if pending_duplicates:
         status = "needs_resolution"
     elif pending_identity:
@@ -267,8 +278,25 @@ def upload_project_from_path(req: UploadPathRequest):
     }
 
 
+@router.post("/projects/preview", response_model=ProjectPreviewResponse)
+def preview_project(zip_file: UploadFile = File(...)):
+    """Estimate file, category and language breakdown from the zip listing, before /projects/upload."""
+    tmp_path = _copy_upload_to_temp_zip(zip_file)
+    try:
+        root_folders = parse_zip_to_project_folders(str(tmp_path))
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    if not root_folders:
+        raise HTTPException(status_code=400, detail="Zip parsed no projects (invalid or empty zip.)")
+    return ProjectPreviewResponse(
+        ok=True,
+        estimate=True,
+        projects=[ProjectPreview(**p) for p in estimate_zip_projects(root_folders)],
+    )
+
+
 @router.post("/projects/upload", response_model=UploadProjectResponse, status_code=status.HTTP_201_CREATED)
-def upload_project(zip_file: UploadFile = File(...)):
+def upload_project(background_tasks: BackgroundTasks, zip_file: UploadFile = File(...)):
     """Upload a zip file, analyze projects inside, and persist project records."""
     tmp_path = _copy_upload_to_temp_zip(zip_file)
     root_folders = parse_zip_to_project_folders(str(tmp_path))
@@ -280,6 +308,7 @@ def upload_project(zip_file: UploadFile = File(...)):
     created_projects = analyzer.initialize_projects()
     pending_duplicates, pending_identity = _run_post_upload_analyses(analyzer, created_projects)
     tmp_path.unlink(missing_ok=True)
+    background_tasks.add_task(maybe_apply_retention)
     if pending_duplicates:
         status = "needs_resolution"
     elif pending_identity:
@@ -314,7 +343,7 @@ def upload_consent(req: ConsentRequest):
 def get_list_projects():
     """List all analyzed/uploaded projects."""
     pm = ProjectManager()
-    grouped_projects = pm.get_project_groups()
+    grouped_projects = pm.get_project_groups(columns=("id", "name"))
 
     current_projects = [ProjectSummary(id=p.id, name=p.name) for p in grouped_projects["current"]]
     previous_projects = [ProjectSummary(id=p.id, name=p.name) for p in grouped_projects["previous"]]
@@ -334,6 +363,16 @@ def clear_projects():
     return {"ok": True}
 
 
+@router.get("/projects/top", response_model=RankedProjectsResponse)
+def get_top_projects(k: int = Query(10, ge=1, le=100)):
+    """The k best scored projects, ranked by their score today."""
+    pm = ProjectManager()
+    projects = pm.get_ranked(limit=k, columns=("id", "name"))
+    return RankedProjectsResponse(
+        projects=[RankedProject(id=p.id, name=p.name, resume_score=p.resume_score) for p in projects]
+    )
+
+
 @router.get("/projects/{id}", response_model=ProjectDetailResponse)
 def get_project(id: int):
     """Get metadata/details for a project by id."""
@@ -354,10 +393,9 @@ def delete_project(id: int):
     project = pm.get(id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found.")
+    # The project's author and file hash links (and authors or hashes seen nowhere else) go with it
     if not pm.delete(id):
         raise HTTPException(status_code=500, detail="Failed to delete project.")
-    analyzer = ProjectAnalyzer(ConfigManager(), root_folders=[], zip_path=None)
-    analyzer.rebuild_seen_authors()
     return None
 
 
@@ -412,12 +450,7 @@ def resolve_contributors_batch(req: ContributorMergeBatchRequest):
 @router.get("/skills", response_model=SkillsListResponse)
 def get_skills_list():
     pm = ProjectManager()
-    projects = list(pm.get_all())
-    counts = Counter()
-    for p in projects:
-        for s in (p.skills_used or []):
-            if s:
-                counts[s.strip()] += 1
+    counts = pm.get_skill_counts()
     skills = [
         SkillItem(name=name, project_count=count)
         for name, count in sorted(counts.items(), key=lambda x: (-x[1], x[0].lower()))
@@ -428,18 +461,10 @@ def get_skills_list():
 @router.get("/skills/usage", response_model=SkillsUsageResponse)
 def get_skills_usage():
     pm = ProjectManager()
-    projects = list(pm.get_all())
-
-    usage_map = {}
-    for p in projects:
-        project_name = (getattr(p, "name", "") or "").strip()
-        for s in (p.skills_used or []):
-            skill = (s or "").strip()
-            if not skill:
-                continue
-            usage_map.setdefault(skill, set())
-            if project_name:
-                usage_map[skill].add(project_name)
+    usage_map = {
+        skill: {name.strip() for name in project_names if name and name.strip()}
+        for skill, project_names in pm.get_skill_usage().items()
+    }
 
     skills = [
         SkillUsageItem(
@@ -957,10 +982,19 @@ def delete_resume_export(export_id: str):
     return {"ok": True}
 
 
+def _config_with_authors(cm: ConfigManager) -> dict:
+    """All config values, plus seen_authors (now kept in the authors table) when there are any."""
+    config = dict(cm.get_all())
+    seen_authors = AuthorManager().get_seen_authors()
+    if seen_authors:
+        config["seen_authors"] = seen_authors
+    return config
+
+
 @router.get("/config")
 def get_config():
     cm = ConfigManager()
-    return {"ok": True, "config": cm.get_all()}
+    return {"ok": True, "config": _config_with_authors(cm)}
 
 
 class SetIdentityRequest(BaseModel):
@@ -1022,7 +1056,7 @@ def save_config(req: ConfigSaveRequest):
             cm.set(key, str(value).strip())
     if identity_changed:
         cm.delete("usernames")
-    return {"ok": True, "config": cm.get_all()}
+    return {"ok": True, "config": _config_with_authors(cm)}
 
 
 @router.post("/projects/{id}/thumbnail")
@@ -1073,6 +1107,27 @@ def config_set(req: ConfigSetRequest):
     return {"ok": True, "key": req.key}
 
 
+@router.get("/store/export", dependencies=[Depends(require_consent)])
+def export_store():
+    """Stream projects, reports, config and file hashes as NDJSON, for POST /store/import elsewhere."""
+    return StreamingResponse(
+        export_ndjson(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="analysis-store.ndjson"'},
+    )
+
+
+@router.post("/store/import", dependencies=[Depends(require_consent)])
+def import_store(file: UploadFile = File(...)):
+    """Import a GET /store/export stream; projects are upserted by name."""
+    try:
+        # Read line by line from the spooled upload, so memory stays bounded
+        counts = import_ndjson(file.file)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"ok": True, "imported": counts}
+
+
 def _require_private_mode(report):
     mode = getattr(report, "portfolio_mode", "private") or "private"
     if mode != "private":
@@ -1147,7 +1202,7 @@ def _generate_portfolio_slug(title: str, report_manager: ReportManager, exclude_
     base = re.sub(r"[^a-z0-9]+", "-", (title or "portfolio").lower()).strip("-") or "portfolio"
     existing_tokens = {
         getattr(r, "public_token", None)
-        for r in report_manager.list_reports()
+        for r in report_manager.list_reports(include_projects=False)
         if r.id != exclude_id
     }
     if base not in existing_tokens:
@@ -1175,22 +1230,50 @@ def publish_portfolio(id: int):
     return PortfolioPublishResponse(ok=True, portfolio=_build_portfolio_report(report), message="Portfolio published.")
 
 
+# Rendered public portfolio pages: report id -> (content version, html), least recently used first
+_PUBLIC_PAGE_CACHE: "OrderedDict[int, tuple]" = OrderedDict()
+_PUBLIC_PAGE_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=1)
+def _public_portfolio_template():
+    import jinja2
+
+    templates_dir = Path(__file__).parent / "templates"
+    env = jinja2.Environment(loader=jinja2.FileSystemLoader(str(templates_dir)), autoescape=True)
+    return env.get_template("public_portfolio.html")
+
+
 @router.get("/public/portfolio/{token}", response_class=HTMLResponse)
 def public_portfolio_page(token: str):
-    """Serve a publicly accessible HTML portfolio page. No auth required; only works when portfolio_mode is 'public'."""
-    import jinja2
-    from pathlib import Path as _Path
+    """
+    Serve a publicly accessible HTML portfolio page. No auth required; only works when portfolio_mode is 'public'.
 
+    Rendered pages are cached per report and reused until the reports, their projects,
+    the analyzed projects or the configured usernames change.
+    """
     report_manager = ReportManager()
-    all_reports = report_manager.list_reports()
-    report = next(
-        (r for r in all_reports if getattr(r, "public_token", None) == token and r.portfolio_mode == "public"),
-        None,
-    )
-    if not report:
+    report = report_manager.get_by_public_token(token, include_projects=False)
+    if not report or report.portfolio_mode != "public":
         raise HTTPException(status_code=404, detail="Portfolio not found or not public.")
     _require_report_kind(report, "portfolio")
 
+    project_manager = ProjectManager()
+    cfg = ConfigManager()
+    heatmap_usernames = _normalize_username_candidates(cfg.get("usernames") or [])
+    version = (
+        report_manager.content_version(),
+        project_manager.content_version(),
+        tuple(heatmap_usernames),
+    )
+    cached = _PUBLIC_PAGE_CACHE.get(report.id)
+    if cached and cached[0] == version:
+        _PUBLIC_PAGE_CACHE.move_to_end(report.id)
+        return HTMLResponse(content=cached[1])
+
+    report = report_manager.get_report(report.id)
+    if not report:
+        raise HTTPException(status_code=404, detail="Portfolio not found or not public.")
     portfolio = _build_portfolio_report(report)
 
     published_at = None
@@ -1202,7 +1285,6 @@ def public_portfolio_page(token: str):
         if not (p.portfolio_customizations or {}).get("is_hidden", False)
     ]
 
-    project_manager = ProjectManager()
     thumbnail_urls = {}
     for p in visible_projects:
         proj = project_manager.get_by_name(p.project_name)
@@ -1218,14 +1300,9 @@ def public_portfolio_page(token: str):
             if name:
                 badges_by_project.setdefault(name, []).append(badge)
 
-    cfg = ConfigManager()
-    heatmap_usernames = _normalize_username_candidates(cfg.get("usernames") or [])
     heatmap = _build_heatmap_data(visible_projects, project_manager, usernames=heatmap_usernames)
 
-    templates_dir = _Path(__file__).parent / "templates"
-    env = jinja2.Environment(loader=jinja2.FileSystemLoader(str(templates_dir)), autoescape=True)
-    template = env.get_template("public_portfolio.html")
-    html = template.render(
+    html = _public_portfolio_template().render(
         title=portfolio.title or "Portfolio",
         published_at=published_at,
         projects=visible_projects,
@@ -1234,4 +1311,9 @@ def public_portfolio_page(token: str):
         heatmap=heatmap,
         heatmap_usernames=heatmap_usernames,
     )
+
+    _PUBLIC_PAGE_CACHE[report.id] = (version, html)
+    _PUBLIC_PAGE_CACHE.move_to_end(report.id)
+    while len(_PUBLIC_PAGE_CACHE) > _PUBLIC_PAGE_CACHE_SIZE:
+        _PUBLIC_PAGE_CACHE.popitem(last=False)
     return HTMLResponse(content=html)
@@ -36,12 +36,39 @@ class UploadProjectResponse(BaseModel):
     pending_identity: List[PendingIdentityProject] = Field(default_factory=list)
 
 
+class ProjectPreview(BaseModel):
+    name: str
+    file_count: int
+    total_bytes: int
+    categories: Dict[str, int] = Field(default_factory=dict)
+    language_share: Dict[str, float] = Field(default_factory=dict)
+
+
+class ProjectPreviewResponse(BaseModel):
+    ok: bool = True
+    # Built from the ZIP listing only; language_share is byte-weighted and
+    # will differ from the LOC-weighted share of the full analysis.
+    estimate: bool = True
+    projects: List[ProjectPreview]
+
+
 class ProjectsListResponse(BaseModel):
     projects: List[ProjectSummary]
     current_projects: List[ProjectSummary]
     previous_projects: List[ProjectSummary]
 
 
+class RankedProject(BaseModel):
+    id: Optional[int] = None
+    name: str
+    # Includes the recency of the project at request time
+    resume_score: float
+
+
+class RankedProjectsResponse(BaseModel):
+    projects: List[RankedProject]
+
+
 class ProjectDetail(BaseModel):
     id: Optional[int] = None
     name: str = ""
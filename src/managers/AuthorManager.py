@@ -0,0 +1,181 @@
+import sqlite3
+from typing import Dict, Iterable, List, Optional
+
+from src.managers.StorageManager import StorageManager
+from src.managers.migrations import Migration
+
+# Git identities seen across all analyzed projects. ref_count is the number of
+# projects whose history contains the email; it is kept up to date by triggers on
+# project_authors, and authors whose last project is deleted are dropped. Emails
+# merged into another identity keep a row pointing at their canonical_email.
+AUTHOR_TABLES = (
+    """CREATE TABLE IF NOT EXISTS authors (
+        email TEXT PRIMARY KEY,
+        name TEXT NOT NULL,
+        canonical_email TEXT,
+        ref_count INTEGER NOT NULL DEFAULT 0
+        )""",
+    # No foreign key: INSERT OR REPLACE on projects would cascade and drop the links.
+    # Rows are removed by the projects delete trigger created in ProjectManager.
+    """CREATE TABLE IF NOT EXISTS project_authors (
+        project_id INTEGER NOT NULL,
+        email TEXT NOT NULL,
+        PRIMARY KEY (project_id, email)
+        )""",
+    "CREATE INDEX IF NOT EXISTS idx_project_authors_email ON project_authors (email)",
+    """CREATE TRIGGER IF NOT EXISTS project_authors_insert_ref AFTER INSERT ON project_authors
+        BEGIN
+            UPDATE authors SET ref_count = ref_count + 1 WHERE email = NEW.email;
+        END""",
+    """CREATE TRIGGER IF NOT EXISTS project_authors_delete_ref AFTER DELETE ON project_authors
+        BEGIN
+            UPDATE authors SET ref_count = ref_count - 1 WHERE email = OLD.email;
+            DELETE FROM authors WHERE email = OLD.email AND ref_count <= 0 AND canonical_email IS NULL;
+        END""",
+)
+
+
+def create_author_tables(cursor: sqlite3.Cursor) -> None:
+    """Migration step shared by AuthorManager and ProjectManager, which both need the tables."""
+    for query in AUTHOR_TABLES:
+        cursor.execute(query)
+
+
+class AuthorManager(StorageManager):
+    """
+    Manages the git author identities seen across projects (email -> display name).
+
+    Lives in the projects database; each project's authors are recorded with
+    record_project_authors(), so deleting a project or merging identities only
+    touches the affected rows.
+    """
+
+    def __init__(self, db_path: str = "projects.db") -> None:
+        super().__init__(db_path)
+
+    @property
+    def create_table_query(self) -> str:
+        return AUTHOR_TABLES[0]
+
+    @property
+    def migrations(self) -> List[Migration]:
+        """Schema steps, applied once per database; only ever append (see migrations.py)."""
+        return [create_author_tables]
+
+    @property
+    def table_name(self) -> str:
+        return "authors"
+
+    @property
+    def primary_key(self) -> str:
+        return "email"
+
+    @property
+    def columns(self) -> str:
+        return "email, name, canonical_email, ref_count"
+
+    def add_authors(self, author_map: Dict[str, str]) -> None:
+        """
+        Record email -> name pairs without linking them to a project.
+
+        Names of already known emails are kept.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            self._upsert(cursor, author_map)
+
+    def record_project_authors(self, project_id: Optional[int], author_map: Dict[str, str]) -> None:
+        """
+        Record the authors found in a project's history, replacing its previous set.
+
+        Names of already known emails are kept, and emails merged into another
+        identity are linked to their canonical email instead.
+
+        Args:
+            project_id: id of the project, or None to only record the names
+            author_map: email -> display name, as returned by ContributionAnalyzer.get_name_map
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            self._upsert(cursor, author_map)
+            if project_id is None:
+                return
+
+            emails = set(self._canonical_emails(cursor, author_map))
+            cursor.execute("SELECT email FROM project_authors WHERE project_id = ?", (project_id,))
+            linked = {row[0] for row in cursor.fetchall()}
+            cursor.executemany(
+                "DELETE FROM project_authors WHERE project_id = ? AND email = ?",
+                [(project_id, email) for email in linked - emails],
+            )
+            cursor.executemany(
+                "INSERT INTO project_authors (project_id, email) VALUES (?, ?)",
+                [(project_id, email) for email in emails - linked],
+            )
+
+    def merge(self, canonical: str, emails: Iterable[str]) -> None:
+        """
+        Merge identities into `canonical`: their project links move to it, they are
+        hidden from get_seen_authors(), and `canonical` takes the display name of
+        the last merged email.
+        """
+        stale = [email for email in emails if email != canonical]
+        if not stale:
+            return
+        placeholders = ", ".join("?" for _ in stale)
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT email, name FROM authors WHERE email IN ({placeholders})", stale)
+            names = dict(cursor.fetchall())
+            name = next((names[email] for email in reversed(stale) if email in names), None)
+            if name is not None:
+                cursor.execute(
+                    """INSERT INTO authors (email, name) VALUES (?, ?)
+                    ON CONFLICT(email) DO UPDATE SET name = excluded.name, canonical_email = NULL""",
+                    (canonical, name),
+                )
+
+            cursor.execute(
+                f"UPDATE authors SET canonical_email = ? WHERE email IN ({placeholders}) OR canonical_email IN ({placeholders})",
+                [canonical, *stale, *stale],
+            )
+            cursor.execute(
+                f"""INSERT OR IGNORE INTO project_authors (project_id, email)
+                SELECT project_id, ? FROM project_authors WHERE email IN ({placeholders})""",
+                [canonical, *stale],
+            )
+            cursor.execute(f"DELETE FROM project_authors WHERE email IN ({placeholders})", stale)
+
+    def get_seen_authors(self) -> Dict[str, str]:
+        """Return email -> name for every known identity that was not merged into another."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT email, name FROM {self.table_name} WHERE canonical_email IS NULL ORDER BY email")
+            return dict(cursor.fetchall())
+
+    def get_project_authors(self, project_id: int) -> List[str]:
+        """Return the (canonical) author emails recorded for a project."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT email FROM project_authors WHERE project_id = ? ORDER BY email", (project_id,))
+            return [row[0] for row in cursor.fetchall()]
+
+    def _upsert(self, cursor: sqlite3.Cursor, author_map: Dict[str, str]) -> None:
+        cursor.executemany(
+            f"INSERT OR IGNORE INTO {self.table_name} (email, name) VALUES (?, ?)",
+            list(author_map.items()),
+        )
+
+    def _canonical_emails(self, cursor: sqlite3.Cursor, emails: Iterable[str]) -> List[str]:
+        """Map each email to its canonical email, if it was merged."""
+        emails = list(emails)
+        if not emails:
+            return []
+        placeholders = ", ".join("?" for _ in emails)
+        cursor.execute(
+            f"SELECT email, canonical_email FROM {self.table_name} WHERE email IN ({placeholders}) AND canonical_email IS NOT NULL",
+            emails,
+        )
+        aliases = dict(cursor.fetchall())
+        return [aliases.get(email, email) for email in emails]
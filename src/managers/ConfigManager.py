@@ -1,5 +1,31 @@
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
 from src.managers.StorageManager import StorageManager
-from typing import Any, Dict
+from src.managers.ConnectionPool import ConnectionPool, get_pool
+from src.managers.migrations import Migration, version_triggers
+
+
+class _ConfigCache:
+    """
+    Stored (serialized) config rows of one database file, shared by every
+    ConfigManager in the process.
+
+    `stamp` is the (pool generation, content version) the rows were read at; they
+    are reused until either changes, i.e. until any process writes to configs or
+    the database file is replaced.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.stamp: Optional[Tuple[int, int]] = None
+        self.rows: Dict[str, Any] = {}
+
+
+_caches: "weakref.WeakKeyDictionary[ConnectionPool, _ConfigCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
 
 class ConfigManager(StorageManager):
     """
@@ -9,6 +35,10 @@ class ConfigManager(StorageManager):
 
     Values of complex data type are automatically serialized to JSON for storage and
     deserialized upon retrieval.
+
+    Reads are served from a process-wide cache of the table. Writes go through to
+    the database and the cache; writes from other processes are noticed through the
+    table's content version (see migrations.version_triggers).
     """
 
     def __init__(self, db_path="config.db") -> None:
@@ -18,6 +48,14 @@ class ConfigManager(StorageManager):
     def create_table_query(self) -> str:
         return "CREATE TABLE IF NOT EXISTS configs (key TEXT PRIMARY KEY, value TEXT)"
 
+    @property
+    def migrations(self) -> List[Migration]:
+        """Schema steps, applied once per database; only ever append (see migrations.py)."""
+        return [
+            self.create_table_query,
+            version_triggers("configs"),
+        ]
+
     @property
     def table_name(self) -> str:
         return "configs"
@@ -30,6 +68,44 @@ class ConfigManager(StorageManager):
     def columns(self) -> str:
         return "key, value"
 
+    def _cache(self) -> Optional[Tuple[ConnectionPool, _ConfigCache]]:
+        """The shared cache for this database, or None if it is not pooled (e.g. ":memory:")."""
+        pool = get_pool(self.db_path)
+        if pool is None:
+            return None
+        with _caches_lock:
+            cache = _caches.get(pool)
+            if cache is None:
+                cache = _caches[pool] = _ConfigCache()
+        return pool, cache
+
+    def _cached_rows(self) -> Optional[Dict[str, Any]]:
+        """Return the stored rows as {key: serialized value}, reloading them if anything changed."""
+        found = self._cache()
+        if found is None:
+            return None
+        pool, cache = found
+
+        conn = pool.acquire()
+        try:
+            cursor = conn.cursor()
+            # Version first: a write landing before the reload below only causes one more reload
+            cursor.execute("SELECT version FROM content_version WHERE name = ?", (self.table_name,))
+            row = cursor.fetchone()
+            stamp = (pool.generation, row[0] if row else 0)
+            with cache.lock:
+                if cache.stamp == stamp:
+                    return cache.rows
+
+            cursor.execute(f"SELECT {self.columns} FROM {self.table_name}")
+            rows = dict(cursor.fetchall())
+        finally:
+            pool.release(conn)
+
+        with cache.lock:
+            cache.stamp, cache.rows = stamp, rows
+        return rows
+
     def set(self, key: str, value: Any) -> None:
         """
         Store or update a configuration value by key.
@@ -38,7 +114,27 @@ class ConfigManager(StorageManager):
 
         value (Any): The value to store. Can be any JSON serializable type.
         """
-        super().set({"key": key, "value": value})
+        row = self._serialize_row({"key": key, "value": value})
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            query = f"INSERT OR REPLACE INTO {self.table_name} ({self.columns}) VALUES ({self.placeholders})"
+            cursor.execute(query, (row["key"], row["value"]))
+            # Still inside the write transaction, so this write bumped the version by exactly one
+            cursor.execute("SELECT version FROM content_version WHERE name = ?", (self.table_name,))
+            version = cursor.fetchone()[0]
+
+        found = self._cache()
+        if found is None:
+            return
+        pool, cache = found
+        with cache.lock:
+            generation = pool.generation
+            if cache.stamp == (generation, version - 1):
+                cache.rows = {**cache.rows, key: row["value"]}
+                cache.stamp = (generation, version)
+            else:
+                # Other writes happened since the cache was filled; reload on next read
+                cache.stamp = None
 
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -51,10 +147,17 @@ class ConfigManager(StorageManager):
         Returns the deserialized value associated with the key, if found,
         or else default.
         """
-        result = super().get(key, default)
-        if result and isinstance(result, dict):
-            return result.get("value")
-        return default
+        rows = self._cached_rows()
+        if rows is None:
+            result = super().get(key, default)
+            if result and isinstance(result, dict):
+                return result.get("value")
+            return default
+
+        if key not in rows:
+            return default
+        # Deserialized per call, so callers can never mutate the cached value
+        return self._deserialize_row({"value": rows[key]})["value"]
 
     def get_all(self) -> Dict[str, Any]:
         """
@@ -62,5 +165,7 @@ class ConfigManager(StorageManager):
 
         Keys are mapped to their corresponding deserialized values.
         """
-        rows = super().get_all()
-        return {row["key"]: row["value"] for row in rows}
+        rows = self._cached_rows()
+        if rows is None:
+            return {row["key"]: row["value"] for row in super().get_all()}
+        return {key: self._deserialize_row({"value": value})["value"] for key, value in rows.items()}
@@ -0,0 +1,211 @@
+"""
+File: ConnectionPool.py
+
+Per-process pool of SQLite connections, shared by every StorageManager that
+points at the same database file.
+
+Opening a connection and applying PRAGMAs on every get/set dominated the cost
+of small reads and writes, so connections are kept open and handed out one
+caller at a time. Each new connection is configured once:
+
+- journal_mode=WAL: readers keep reading while a writer holds its transaction,
+  so API requests are not blocked by a long-running analysis.
+- synchronous=NORMAL: safe with WAL, fsyncs only at checkpoints.
+- cache_size / temp_store: larger page cache, temp tables in memory.
+- foreign_keys=ON: same as before pooling.
+
+Connections are created with check_same_thread=False but are never shared:
+a connection is used by exactly one caller between acquire() and release().
+If the database file is deleted or replaced, idle connections are discarded so
+callers never read a stale, unlinked file. ":memory:" and URI databases are
+not pooled, because each connection to them is a separate database.
+"""
+
+import atexit
+import os
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+# Idle connections kept per database file; extra ones are closed on release
+POOL_SIZE = 8
+
+# Seconds a connection waits for another writer's lock before failing
+BUSY_TIMEOUT = 30.0
+
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA cache_size = -8000;",  # negative = KiB, i.e. ~8 MB
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA foreign_keys = ON;",
+)
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_dev, st.st_ino
+
+
+def _remove_orphaned_wal(path: str) -> None:
+    """
+    Delete -wal/-shm files left by connections to a database file that has
+    since been deleted, so a new database at the same path cannot replay them.
+    """
+    if os.path.exists(path):
+        return
+    for suffix in ("-wal", "-shm"):
+        try:
+            os.remove(path + suffix)
+        except OSError:
+            pass
+
+
+def connect(db_path: str) -> sqlite3.Connection:
+    """Open a configured connection (unpooled)."""
+    # Only settable before the file has content (existing databases switch at their
+    # next VACUUM), and setting it on a database another connection is writing blocks
+    new_file = not os.path.exists(db_path) or os.path.getsize(db_path) == 0
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+    if new_file:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL;")
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class ConnectionPool:
+    """Idle connections for one database file."""
+
+    def __init__(self, db_path: str, size: int = POOL_SIZE) -> None:
+        self.db_path = db_path
+        self.size = size
+        self._idle: List[sqlite3.Connection] = []
+        self._identity: Optional[Tuple[int, int]] = None
+        # Bumped whenever the file is replaced; connections from older
+        # generations are closed instead of returning to the pool
+        self._generation = 0
+        self._born: Dict[int, int] = {}
+        # Schemas (see migrations.py) already brought up to date in this file
+        self._schemas: Set[str] = set()
+        self._lock = threading.Lock()
+
+    def _check_identity(self) -> None:
+        """Drop idle connections and schema state if the file was deleted or replaced."""
+        identity = _file_identity(self.db_path)
+        stale: List[sqlite3.Connection] = []
+        with self._lock:
+            if identity == self._identity:
+                return
+            stale, self._idle = self._idle, []
+            self._generation += 1
+            self._schemas.clear()
+            for old in stale:
+                self._born.pop(id(old), None)
+        for old in stale:
+            old.close()
+        if stale:
+            _remove_orphaned_wal(self.db_path)
+
+    def acquire(self) -> sqlite3.Connection:
+        """Take an idle connection, or open a new one."""
+        self._check_identity()
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+
+        if conn is None:
+            conn = connect(self.db_path)
+            with self._lock:
+                self._identity = _file_identity(self.db_path)
+                self._born[id(conn)] = self._generation
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection; any open transaction is rolled back first."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            conn.row_factory = None
+        except sqlite3.Error:
+            self._discard(conn)
+            return
+        with self._lock:
+            current = self._born.get(id(conn)) == self._generation
+            if current and len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        self._discard(conn)
+
+    def _discard(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            self._born.pop(id(conn), None)
+        conn.close()
+
+    @property
+    def generation(self) -> int:
+        """Changes whenever the file is found deleted or replaced, or the pool is closed."""
+        with self._lock:
+            return self._generation
+
+    def schema_ready(self, name: str) -> bool:
+        """True if schema `name` was already migrated in the current file."""
+        self._check_identity()
+        with self._lock:
+            return name in self._schemas
+
+    def mark_schema_ready(self, name: str) -> None:
+        with self._lock:
+            self._schemas.add(name)
+
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+            self._identity = None
+            self._generation += 1
+            self._schemas.clear()
+            for conn in idle:
+                self._born.pop(id(conn), None)
+        for conn in idle:
+            conn.close()
+        if idle:
+            _remove_orphaned_wal(self.db_path)
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_pid = os.getpid()
+_pools_lock = threading.Lock()
+
+
+def _is_poolable(db_path: str) -> bool:
+    return db_path != ":memory:" and not db_path.startswith("file:") and db_path != ""
+
+
+def get_pool(db_path: str) -> Optional[ConnectionPool]:
+    """Process-wide pool for `db_path`, or None if the path cannot be pooled."""
+    global _pools, _pools_pid
+    if not _is_poolable(db_path):
+        return None
+    key = os.path.abspath(db_path)
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            # Forked child: the parent's connections must not be reused (or closed)
+            _pools, _pools_pid = {}, os.getpid()
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(key)
+    return pool
+
+
+def close_all_pools() -> None:
+    """Close every pooled connection in this process (checkpoints WAL files)."""
+    with _pools_lock:
+        pools = list(_pools.values()) if _pools_pid == os.getpid() else []
+    for pool in pools:
+        pool.close_all()
+
+
+atexit.register(close_all_pools)
@@ -1,32 +1,74 @@
 from datetime import datetime
-from typing import Any, Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, Iterable, List, Optional, Set, Tuple
 import sqlite3
 
 from src.managers.StorageManager import StorageManager
+from src.managers.migrations import Migration, version_triggers
+
+# Which projects contain each known file hash. A hash is deleted together with its
+# last link, so file_hashes only holds files of projects that still exist.
+FILE_HASH_TABLES = (
+    """CREATE TABLE IF NOT EXISTS file_hashes (
+        file_hash TEXT PRIMARY KEY,
+        file_path TEXT,
+        project_name TEXT,
+        last_seen TEXT
+        )""",
+    # Keyed by name, as files are registered before new projects are given an id.
+    # No foreign key: links are removed by the projects delete trigger created in ProjectManager.
+    """CREATE TABLE IF NOT EXISTS project_file_hashes (
+        project_name TEXT NOT NULL,
+        file_hash TEXT NOT NULL,
+        PRIMARY KEY (project_name, file_hash)
+        )""",
+    "CREATE INDEX IF NOT EXISTS idx_project_file_hashes_hash ON project_file_hashes (file_hash)",
+    """CREATE TRIGGER IF NOT EXISTS project_file_hashes_delete_gc AFTER DELETE ON project_file_hashes
+        BEGIN
+            DELETE FROM file_hashes WHERE file_hash = OLD.file_hash
+                AND NOT EXISTS (SELECT 1 FROM project_file_hashes WHERE file_hash = OLD.file_hash);
+        END""",
+    # Hashes registered before links existed belong to the project that first uploaded them
+    """INSERT OR IGNORE INTO project_file_hashes (project_name, file_hash)
+        SELECT project_name, file_hash FROM file_hashes WHERE project_name IS NOT NULL""",
+)
+
+
+def create_file_hash_tables(cursor: sqlite3.Cursor) -> None:
+    """Migration step shared by FileHashManager and ProjectManager, which both need the tables."""
+    for query in FILE_HASH_TABLES:
+        cursor.execute(query)
 
 
 class FileHashManager(StorageManager):
-    """Tracks unique file hashes across uploads to avoid duplicate storage."""
+    """
+    Tracks unique file hashes across uploads to avoid duplicate storage.
+
+    Hashes are linked to the projects they were uploaded with and dropped once no
+    project links them, e.g. when the last such project is deleted.
+    """
+
+    # Bound on the number of ? placeholders in one query
+    _CHUNK_SIZE = 500
 
     def __init__(self, db_path: str = "projects.db") -> None:
         super().__init__(db_path)
-        self._cache: set = self._load_all_hashes()
-
-    def _load_all_hashes(self) -> set:
-        """Load all known hashes from DB into memory once at startup."""
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(f"SELECT file_hash FROM {self.table_name}")
-            return {row[0] for row in cursor.fetchall()}
+        # Loaded on first use, so e.g. exports never hold every hash in memory
+        self._cache: Set[str] = set()
+        self._cache_version: Optional[int] = None
 
     @property
     def create_table_query(self) -> str:
-        return """CREATE TABLE IF NOT EXISTS file_hashes (
-        file_hash TEXT PRIMARY KEY,
-        file_path TEXT,
-        project_name TEXT,
-        last_seen TEXT
-        )"""
+        return FILE_HASH_TABLES[0]
+
+    @property
+    def migrations(self) -> List[Migration]:
+        """Schema steps, applied once per database; only ever append (see migrations.py)."""
+        return [
+            self.create_table_query,
+            create_file_hash_tables,
+            # Only deletes can make the in-memory hashes wrong, see refresh()
+            version_triggers("file_hashes", events=("DELETE",)),
+        ]
 
     @property
     def table_name(self) -> str:
@@ -40,9 +82,34 @@ class FileHashManager(StorageManager):
     def columns(self) -> str:
         return "file_hash, file_path, project_name, last_seen"
 
+    def refresh(self) -> None:
+        """
+        Load the known hashes into memory, unless none were deleted (by any
+        process) since they were last loaded.
+
+        Hashes registered by other processes are not picked up; missing one only
+        makes a project look changed, never unchanged.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            # Version first: a delete landing before the reload below only causes one more reload
+            cursor.execute("SELECT version FROM content_version WHERE name = ?", (self.table_name,))
+            row = cursor.fetchone()
+            version = row[0] if row else 0
+            if version == self._cache_version:
+                return
+            cursor.execute(f"SELECT file_hash FROM {self.table_name}")
+            self._cache = {row[0] for row in cursor.fetchall()}
+            self._cache_version = version
+
+    def _known(self) -> Set[str]:
+        if self._cache_version is None:
+            self.refresh()
+        return self._cache
+
     def has_hash(self, file_hash: str) -> bool:
         """O(1) in-memory lookup."""
-        return file_hash in self._cache
+        return file_hash in self._known()
 
     def register_hash(
         self,
@@ -52,21 +119,7 @@ class FileHashManager(StorageManager):
         seen_at: Optional[datetime] = None,
     ) -> bool:
         """Register a single hash; returns True if new, False if already known."""
-        if file_hash in self._cache:
-            return False
-        timestamp = (seen_at or datetime.now()).isoformat()
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                f"""INSERT OR IGNORE INTO {self.table_name}
-                (file_hash, file_path, project_name, last_seen)
-                VALUES (?, ?, ?, ?)""",
-                (file_hash, file_path, project_name, timestamp),
-            )
-            if cursor.rowcount > 0:
-                self._cache.add(file_hash)
-                return True
-        return False
+        return self.register_hashes_batch([(file_hash, file_path, project_name)], seen_at)["new"] == 1
 
     def register_hashes_batch(
         self,
@@ -74,34 +127,146 @@ class FileHashManager(StorageManager):
         seen_at: Optional[datetime] = None,
     ) -> Dict[str, int]:
         """
-        Register multiple hashes in a single DB transaction.
+        Register multiple hashes in a single DB transaction, linking each to its project.
         entries: list of (file_hash, file_path, project_name)
         Returns {"new": int, "duplicate": int}
         """
+        if not entries:
+            return {"new": 0, "duplicate": 0}
+        with self._get_connection() as conn:
+            return self._register(conn.cursor(), entries, seen_at)
+
+    def register_project_hashes(
+        self,
+        project_name: str,
+        entries: List[Tuple[str, str]],
+        seen_at: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """
+        Register the files of a project, replacing its previous set: hashes that
+        were only linked to an earlier upload of the project are dropped.
+        entries: list of (file_hash, file_path)
+        Returns {"new": int, "duplicate": int}
+        """
+        current = {file_hash for file_hash, _ in entries}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            result = self._register(
+                cursor, [(file_hash, file_path, project_name) for file_hash, file_path in entries], seen_at
+            )
+            cursor.execute("SELECT file_hash FROM project_file_hashes WHERE project_name = ?", (project_name,))
+            stale = [row[0] for row in cursor.fetchall() if row[0] not in current]
+            cursor.executemany(
+                "DELETE FROM project_file_hashes WHERE project_name = ? AND file_hash = ?",
+                [(project_name, file_hash) for file_hash in stale],
+            )
+            self._cache.difference_update(set(stale) - self._existing(cursor, stale))
+        return result
+
+    def get_project_hashes(self, project_name: str) -> List[str]:
+        """Return the hashes linked to a project."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT file_hash FROM project_file_hashes WHERE project_name = ? ORDER BY file_hash",
+                (project_name,),
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+    def export_links(self) -> Generator[Dict[str, str], None, None]:
+        """Yield every project -> hash link, one at a time, for bulk export."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT project_name, file_hash FROM project_file_hashes")
+            while True:
+                row = cursor.fetchone()
+                if row is None:
+                    break
+                yield {"project_name": row[0], "file_hash": row[1]}
+
+    def import_links(self, rows: Iterable[Dict[str, str]]) -> int:
+        """Add links as yielded by export_links() in one transaction; returns the number of rows read."""
+        rows = [(row["project_name"], row["file_hash"]) for row in rows]
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "INSERT OR IGNORE INTO project_file_hashes (project_name, file_hash) VALUES (?, ?)", rows
+            )
+        return len(rows)
+
+    def compact(self) -> Dict[str, int]:
+        """
+        Drop links to projects that no longer exist and hashes no project links,
+        then rebuild the database file.
+
+        Meant to be run offline (see utils/compact_db.py), as the rebuild locks the
+        whole database. Returns what was freed: {"links": int, "hashes": int, "bytes": int}
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
+            hashes_before = cursor.fetchone()[0]
+            links = 0
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects'")
+            # Projects normally share this database; links can only be checked when they do
+            if cursor.fetchone():
+                cursor.execute(
+                    "DELETE FROM project_file_hashes WHERE project_name NOT IN (SELECT name FROM projects)"
+                )
+                links = cursor.rowcount
+            cursor.execute(
+                f"""DELETE FROM {self.table_name} WHERE NOT EXISTS
+                (SELECT 1 FROM project_file_hashes WHERE project_file_hashes.file_hash = {self.table_name}.file_hash)"""
+            )
+            cursor.execute(f"SELECT COUNT(*) FROM {self.table_name}")
+            hashes = hashes_before - cursor.fetchone()[0]
+
+        freed = self.vacuum()
+        self.refresh()
+        return {"links": links, "hashes": hashes, "bytes": freed}
+
+    def get_all(self) -> Generator[Dict[str, Any], None, None]:
+        return super().get_all()
+
+    def _register(
+        self,
+        cursor: sqlite3.Cursor,
+        entries: List[Tuple[str, str, str]],
+        seen_at: Optional[datetime],
+    ) -> Dict[str, int]:
         timestamp = (seen_at or datetime.now()).isoformat()
         new_count = 0
         duplicate_count = 0
 
+        known = self._known()
         new_entries = []
         for file_hash, file_path, project_name in entries:
-            if file_hash in self._cache:
+            if file_hash in known:
                 duplicate_count += 1
             else:
                 new_entries.append((file_hash, file_path, project_name, timestamp))
-                self._cache.add(file_hash)
+                known.add(file_hash)
                 new_count += 1
 
-        if new_entries:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.executemany(
-                    f"""INSERT OR IGNORE INTO {self.table_name}
-                    (file_hash, file_path, project_name, last_seen)
-                    VALUES (?, ?, ?, ?)""",
-                    new_entries,
-                )
-
+        cursor.executemany(
+            f"""INSERT OR IGNORE INTO {self.table_name}
+            (file_hash, file_path, project_name, last_seen)
+            VALUES (?, ?, ?, ?)""",
+            new_entries,
+        )
+        cursor.executemany(
+            "INSERT OR IGNORE INTO project_file_hashes (project_name, file_hash) VALUES (?, ?)",
+            [(project_name, file_hash) for file_hash, _, project_name in entries],
+        )
         return {"new": new_count, "duplicate": duplicate_count}
 
-    def get_all(self) -> Generator[Dict[str, Any], None, None]:
-        return super().get_all()
+    def _existing(self, cursor: sqlite3.Cursor, hashes: Iterable[str]) -> Set[str]:
+        """Return which of `hashes` are still stored."""
+        hashes = list(hashes)
+        found: Set[str] = set()
+        for start in range(0, len(hashes), self._CHUNK_SIZE):
+            chunk = hashes[start:start + self._CHUNK_SIZE]
+            placeholders = ", ".join("?" for _ in chunk)
+            cursor.execute(f"SELECT file_hash FROM {self.table_name} WHERE file_hash IN ({placeholders})", chunk)
+            found.update(row[0] for row in cursor.fetchall())
+        return found
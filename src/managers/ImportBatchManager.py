@@ -0,0 +1,95 @@
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from src.managers.StorageManager import StorageManager
+
+
+class ImportBatchManager(StorageManager):
+    """
+    Records the import batches (one per uploaded zip) and where each was extracted.
+
+    Projects point into the extracted workspace of the batch they were last
+    uploaded with, so a workspace is kept until the retention policy expires its
+    batch and no project points into it any more, i.e. all of its projects were
+    re-imported or deleted (see services/retention_service.py).
+    """
+
+    def __init__(self, db_path: str = "projects.db") -> None:
+        super().__init__(db_path)
+
+    @property
+    def create_table_query(self) -> str:
+        return """CREATE TABLE IF NOT EXISTS import_batches (
+        batch_id TEXT PRIMARY KEY,
+        workspace TEXT,
+        created_at TEXT NOT NULL,
+        expired_at TEXT
+        )"""
+
+    @property
+    def table_name(self) -> str:
+        return "import_batches"
+
+    @property
+    def primary_key(self) -> str:
+        return "batch_id"
+
+    @property
+    def columns(self) -> str:
+        return "batch_id, workspace, created_at, expired_at"
+
+    def record(self, batch_id: str, workspace: str, created_at: Optional[datetime] = None) -> None:
+        """Record the workspace a batch was extracted to."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"""INSERT INTO {self.table_name} (batch_id, workspace, created_at) VALUES (?, ?, ?)
+                ON CONFLICT(batch_id) DO UPDATE SET workspace = excluded.workspace, expired_at = NULL""",
+                (batch_id, workspace, (created_at or datetime.now()).isoformat()),
+            )
+
+    def get_expirable(
+        self,
+        keep_batches: Optional[int],
+        max_age_days: Optional[float],
+        now: Optional[datetime] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Return the unexpired batches that fall outside the newest `keep_batches`
+        or are older than `max_age_days`, oldest first. None disables a limit.
+
+        Batches whose workspace still holds a stored project's file_path are
+        never returned, as analyses of that project read its files from there.
+        """
+        cutoff = ""
+        if max_age_days is not None:
+            cutoff = ((now or datetime.now()) - timedelta(days=max_age_days)).isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            in_use = ""
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects'")
+            # Projects normally share this database; references can only be checked when they do
+            if cursor.fetchone():
+                in_use = f"""AND NOT EXISTS (SELECT 1 FROM projects WHERE projects.file_path = workspace
+                    OR substr(projects.file_path, 1, length(workspace) + 1) = workspace || '{os.sep}')"""
+            cursor.execute(
+                f"""SELECT batch_id, workspace FROM {self.table_name}
+                WHERE expired_at IS NULL AND (created_at < ? OR batch_id NOT IN
+                    (SELECT batch_id FROM {self.table_name} ORDER BY created_at DESC LIMIT ?))
+                {in_use}
+                ORDER BY created_at""",
+                # LIMIT -1 keeps every batch
+                (cutoff, -1 if keep_batches is None else keep_batches),
+            )
+            return [{"batch_id": row[0], "workspace": row[1]} for row in cursor.fetchall()]
+
+    def mark_expired(self, batch_ids: Iterable[str], expired_at: Optional[datetime] = None) -> None:
+        """Mark batches whose workspace was removed."""
+        timestamp = (expired_at or datetime.now()).isoformat()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                f"UPDATE {self.table_name} SET expired_at = ? WHERE batch_id = ?",
+                [(timestamp, batch_id) for batch_id in batch_ids],
+            )
@@ -1,8 +1,57 @@
 import sqlite3
 import json
-from typing import Any, Dict, Generator, Optional, List
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Generator, Iterable, Iterator, Optional, List, Set
 from src.managers.StorageManager import StorageManager
+from src.managers.AuthorManager import create_author_tables
+from src.managers.FileHashManager import create_file_hash_tables
+from src.managers.migrations import Migration, add_column, version_triggers
 from src.models.Project import Project
+from src.ProjectRanker import ProjectRanker
+
+# One row per (project, value) for list fields that are counted across projects.
+# Rows are rewritten whenever their source fields are saved and cascade on delete
+# (including the delete done by INSERT OR REPLACE).
+VALUE_TABLES = {
+    "project_skills": """CREATE TABLE IF NOT EXISTS project_skills (
+        project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+        skill TEXT NOT NULL,
+        uses INTEGER NOT NULL DEFAULT 1,
+        PRIMARY KEY (project_id, skill)
+        )""",
+    "project_languages": """CREATE TABLE IF NOT EXISTS project_languages (
+        project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+        language TEXT NOT NULL,
+        share REAL,
+        PRIMARY KEY (project_id, language)
+        )""",
+    "project_frameworks": """CREATE TABLE IF NOT EXISTS project_frameworks (
+        project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+        framework TEXT NOT NULL,
+        PRIMARY KEY (project_id, framework)
+        )""",
+}
+
+VALUE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_project_skills_skill ON project_skills (skill)",
+    "CREATE INDEX IF NOT EXISTS idx_project_languages_language ON project_languages (language)",
+    "CREATE INDEX IF NOT EXISTS idx_project_frameworks_framework ON project_frameworks (framework)",
+)
+
+# Project fields mirrored by VALUE_TABLES
+VALUE_FIELDS = frozenset({"skills_used", "languages", "language_share", "frameworks"})
+
+# Rankings order projects by base_score plus ProjectRanker.recency_score() at query
+# time. Projects scored before base_score existed rank by their stored resume_score.
+RANK_KEY = "COALESCE(base_score, resume_score)"
+# ProjectRanker.recency_score() in SQL; timestamps are compared as UTC wall-clock times
+RECENCY_SQL = (
+    f"IFNULL(MIN({ProjectRanker.MAX_RECENCY}, MAX(0.0, {ProjectRanker.MAX_RECENCY} - "
+    f"CAST(julianday(:now) - julianday(substr(last_modified, 1, 19)) AS INTEGER) / {ProjectRanker.RECENCY_DECAY_DAYS})), 0.0)"
+)
+RANK_SCORE_SQL = f"{RANK_KEY} + CASE WHEN base_score IS NULL THEN 0.0 ELSE {RECENCY_SQL} END"
 
 
 class ProjectManager(StorageManager):
@@ -14,44 +63,106 @@ class ProjectManager(StorageManager):
         3. Add variable to `columns` method
         4. the display() method must be updated to reflect the addition of this variable
     """
+    # Enough to list, group and rank projects without reading the JSON columns
+    SUMMARY_COLUMNS = ("id", "name", "import_batch_id", "resume_score", "date_created", "last_modified")
+
     def __init__(self, db_path="projects.db") -> None:
+        # Projects buffered by an open unit_of_work(), keyed by object identity
+        self._pending: Optional[Dict[int, Project]] = None
+        # Buffered stored projects whose name changed, which get_by_name() must flush
+        self._renamed: Set[int] = set()
         super().__init__(db_path)
-        self._ensure_import_batch_id_column()
-        self._ensure_portfolio_details_column()
-        self._ensure_project_type_column()
-        self._ensure_author_daily_contributions_column()
 
-    def _ensure_import_batch_id_column(self) -> None:
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(projects)")
-            existing = {row[1] for row in cursor.fetchall()}
-            if "import_batch_id" not in existing:
-                cursor.execute("ALTER TABLE projects ADD COLUMN import_batch_id TEXT")
+    @property
+    def migrations(self) -> List[Migration]:
+        """Schema steps, applied once per database; only ever append (see migrations.py)."""
+        return [
+            self.create_table_query,
+            add_column("projects", "import_batch_id", "TEXT"),
+            add_column("projects", "portfolio_details", "TEXT"),
+            add_column("projects", "project_type", "TEXT DEFAULT ''"),
+            add_column("projects", "author_daily_contributions", "TEXT"),
+            self._create_value_tables,
+            version_triggers("projects"),
+            create_author_tables,
+            # Not fired by INSERT OR REPLACE, so rewriting a project keeps its author links
+            """CREATE TRIGGER IF NOT EXISTS projects_delete_authors AFTER DELETE ON projects
+            BEGIN
+                DELETE FROM project_authors WHERE project_id = OLD.id;
+            END""",
+            create_file_hash_tables,
+            # Likewise; dropping the links garbage-collects hashes no other project has
+            """CREATE TRIGGER IF NOT EXISTS projects_delete_file_hashes AFTER DELETE ON projects
+            BEGIN
+                DELETE FROM project_file_hashes WHERE project_name = OLD.name;
+            END""",
+            # The ranking key below reads both
+            add_column("projects", "resume_score", "REAL"),
+            add_column("projects", "base_score", "REAL"),
+            self._backfill_base_scores,
+            # Scores never exceed their key by more than MAX_RECENCY, see get_ranked()
+            f"CREATE INDEX IF NOT EXISTS idx_projects_rank_key ON projects ({RANK_KEY})",
+        ]
 
-    def _ensure_portfolio_details_column(self) -> None:
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(projects)")
-            existing = {row[1] for row in cursor.fetchall()}
-            if "portfolio_details" not in existing:
-                cursor.execute("ALTER TABLE projects ADD COLUMN portfolio_details TEXT")
+    def _backfill_base_scores(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute(f"PRAGMA table_info({self.table_name})")
+        stored = {row[1] for row in cursor.fetchall()}
+        # Projects with a score have had their skills analysed, so their metrics are stored
+        # (tables older than some metrics lack those columns; they keep their defaults)
+        columns = [self.primary_key, *(c for c in ProjectRanker.BASE_SCORE_FIELDS if c in stored)]
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {self.table_name} WHERE resume_score > 0")
+        cursor.executemany(
+            f"UPDATE {self.table_name} SET base_score = ? WHERE {self.primary_key} = ?",
+            [
+                (ProjectRanker(Project.from_row(self._stored_values(columns, row))).calculate_base_score(), row[0])
+                for row in cursor.fetchall()
+            ],
+        )
 
-    def _ensure_project_type_column(self) -> None:
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(projects)")
-            existing = {row[1] for row in cursor.fetchall()}
-            if "project_type" not in existing:
-                cursor.execute("ALTER TABLE projects ADD COLUMN project_type TEXT DEFAULT ''")
+    def _create_value_tables(self, cursor: sqlite3.Cursor) -> None:
+        for query in (*VALUE_TABLES.values(), *VALUE_INDEXES):
+            cursor.execute(query)
+        # Fill from the JSON columns of projects saved before the tables existed
+        columns = [self.primary_key, *sorted(VALUE_FIELDS)]
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {self.table_name}")
+        for row in cursor.fetchall():
+            self._sync_value_tables(cursor, Project.from_row(dict(zip(columns, row))), VALUE_FIELDS)
 
-    def _ensure_author_daily_contributions_column(self) -> None:
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(projects)")
-            existing = {row[1] for row in cursor.fetchall()}
-            if "author_daily_contributions" not in existing:
-                cursor.execute("ALTER TABLE projects ADD COLUMN author_daily_contributions TEXT")
+    @staticmethod
+    def _stored_values(columns: List[str], row: Iterable[Any]) -> Dict[str, Any]:
+        """Non-NULL values of a row, so NULL columns keep their Project defaults."""
+        return {col: value for col, value in zip(columns, row) if value is not None}
+
+    def _sync_value_tables(self, cursor: sqlite3.Cursor, proj: Project, changed: Iterable[str]) -> None:
+        """Rewrite the VALUE_TABLES rows of a saved project for the fields that changed."""
+        changed = VALUE_FIELDS.intersection(changed)
+        if not changed:
+            return
+
+        if "skills_used" in changed:
+            uses = Counter(s.strip() for s in proj.skills_used or [] if isinstance(s, str) and s.strip())
+            cursor.execute("DELETE FROM project_skills WHERE project_id = ?", (proj.id,))
+            cursor.executemany(
+                "INSERT INTO project_skills (project_id, skill, uses) VALUES (?, ?, ?)",
+                [(proj.id, skill, n) for skill, n in uses.items()],
+            )
+
+        if "languages" in changed or "language_share" in changed:
+            shares = proj.language_share or {}
+            languages = dict.fromkeys(l for l in [*(proj.languages or []), *shares] if isinstance(l, str) and l)
+            cursor.execute("DELETE FROM project_languages WHERE project_id = ?", (proj.id,))
+            cursor.executemany(
+                "INSERT INTO project_languages (project_id, language, share) VALUES (?, ?, ?)",
+                [(proj.id, lang, shares.get(lang)) for lang in languages],
+            )
+
+        if "frameworks" in changed:
+            frameworks = dict.fromkeys(f.strip() for f in proj.frameworks or [] if isinstance(f, str) and f.strip())
+            cursor.execute("DELETE FROM project_frameworks WHERE project_id = ?", (proj.id,))
+            cursor.executemany(
+                "INSERT INTO project_frameworks (project_id, framework) VALUES (?, ?)",
+                [(proj.id, fw) for fw in frameworks],
+            )
 
     def _retrieve_id(self, cursor: sqlite3.Cursor, row: Dict[str, Any]) -> None:
         """
@@ -118,6 +229,7 @@ class ProjectManager(StorageManager):
         thumbnail TEXT,
         project_type TEXT DEFAULT '',
         resume_score REAL,
+        base_score REAL,
         date_created TEXT,
         last_modified TEXT,
         last_accessed TEXT
@@ -152,7 +264,7 @@ class ProjectManager(StorageManager):
             "language_depth_level, language_depth_score, "
             "has_dockerfile, has_database, has_frontend, has_backend, "
             "has_test_files, has_readme, readme_keywords, "
-            "bullets, summary, portfolio_entry, portfolio_details, thumbnail, project_type, resume_score, "
+            "bullets, summary, portfolio_entry, portfolio_details, thumbnail, project_type, resume_score, base_score, "
             "date_created, last_modified, last_accessed"
         )
 
@@ -163,45 +275,170 @@ class ProjectManager(StorageManager):
     def set(self, proj: Project) -> None:
         """
         Store a Project in the database.
+
+        Inside unit_of_work() the write is buffered until the unit is flushed.
         """
+        if self._pending is not None:
+            self._pending[id(proj)] = proj
+            if proj.id is not None and proj.name_changed():
+                self._renamed.add(id(proj))
+            return
+        self.set_many([proj])
+
+    def set_many(self, projects: Iterable[Project]) -> None:
+        """
+        Store several Projects in a single transaction.
+        New projects get their autogenerated id assigned.
+        """
+        projects = list(projects)
+        if not projects:
+            return
+        written = []
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for proj in projects:
+                written.append((proj, self._write_project(cursor, proj)))
+        # Only once committed, so a rolled back batch stays dirty
+        for proj, stored in written:
+            proj.mark_clean(stored)
+
+    def _write_project(self, cursor: sqlite3.Cursor, proj: Project) -> Dict[str, Any]:
+        """
+        Write a project and return the column values written.
+
+        Projects loaded or saved through this manager only write the columns that
+        changed since (see Project.dirty_fields); others are written in full.
+        """
+        changed = proj.dirty_fields()
+        if proj.id is not None and changed is not None and self.primary_key not in changed:
+            if not changed:
+                return {}
+            updates = proj.to_columns(c for c in self.columns_list if c in changed)
+            assignments = ", ".join(f"{col} = ?" for col in updates)
+            # OR REPLACE keeps INSERT OR REPLACE's behaviour on a clashing name
+            query = f"UPDATE OR REPLACE {self.table_name} SET {assignments} WHERE {self.primary_key} = ?"
+            cursor.execute(query, [*updates.values(), proj.id])
+            if cursor.rowcount:
+                self._sync_value_tables(cursor, proj, updates)
+                return updates
+            # Row was deleted since the project was loaded; insert it again
+
         project_dict = proj.to_dict()
 
         columns_to_set = self.columns_list
         if proj.id is None:
             columns_to_set = [c for c in columns_to_set if c != self.primary_key]
 
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cols_str = ", ".join(columns_to_set)
-            placeholders = ", ".join("?" for _ in columns_to_set)
+        cols_str = ", ".join(columns_to_set)
+        placeholders = ", ".join("?" for _ in columns_to_set)
 
-            raw_values = [project_dict.get(col) for col in columns_to_set]
-            values = []
-            for v in raw_values:
-                if isinstance(v, (list, dict)):
-                    values.append(json.dumps(v))
-                else:
-                    values.append(v)
+        raw_values = [project_dict.get(col) for col in columns_to_set]
+        values = []
+        for v in raw_values:
+            if isinstance(v, (list, dict)):
+                values.append(json.dumps(v))
+            else:
+                values.append(v)
 
-            query = f"INSERT OR REPLACE INTO {self.table_name} ({cols_str}) VALUES ({placeholders})"
+        query = f"INSERT OR REPLACE INTO {self.table_name} ({cols_str}) VALUES ({placeholders})"
 
-            cursor.execute(query, values)
+        cursor.execute(query, values)
 
-            if proj.id is None:
-                proj.id = cursor.lastrowid
+        if proj.id is None:
+            proj.id = cursor.lastrowid
+        # The replaced row's value rows were removed by ON DELETE CASCADE
+        self._sync_value_tables(cursor, proj, VALUE_FIELDS)
+        return project_dict
+
+    @contextmanager
+    def unit_of_work(self) -> Iterator["ProjectManager"]:
+        """
+        Buffer set() calls and write them in one transaction when the block exits.
+
+        A project set several times is written once, with its latest state. Reads
+        through this manager always see buffered writes: get() and get_by_name()
+        return a buffered project itself, other reads flush the buffer first. Nested units join the outermost one. Buffered projects are still
+        written if the block raises, matching what immediate set() calls would have
+        persisted before the error.
+        """
+        if self._pending is not None:
+            yield self
+            return
+        self._pending = {}
+        try:
+            yield self
+        finally:
+            pending, self._pending = self._pending, None
+            self._renamed.clear()
+            self.set_many(pending.values())
+
+    def flush(self) -> None:
+        """Write any projects buffered by an open unit_of_work() now."""
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            self._renamed.clear()
+            self.set_many(pending.values())
+
+    def _load_project(self, row: Dict[str, Any], deserialize: bool = True, lazy: bool = True) -> Project:
+        """
+        Build a Project from a stored row and start tracking its changes.
+
+        With `lazy`, JSON columns are left encoded until first accessed (see
+        Project.from_row); list endpoints rarely read e.g. author_contributions.
+        """
+        stored = {col: row[col] for col in Project.JSON_FIELDS if col in row}
+        if lazy:
+            scalars = {k: v for k, v in row.items() if k not in stored}
+            if deserialize:
+                scalars = self._deserialize_row(scalars)
+            project = Project.from_row({**scalars, **stored})
+        else:
+            project = Project.from_dict(self._deserialize_row(row) if deserialize else row)
+        project.mark_clean(stored)
+        return project
+
+    def _projection(self, columns: Optional[Iterable[str]]) -> Optional[List[str]]:
+        """Validated column list for a projected query; the primary key is always included."""
+        if columns is None:
+            return None
+        wanted = {self.primary_key, *columns}
+        unknown = wanted.difference(self.columns_list)
+        if unknown:
+            raise ValueError(f"Unknown project columns: {sorted(unknown)}")
+        return [c for c in self.columns_list if c in wanted]
 
     def get(self, id: int) -> Optional[Project]:
-        """Retrieve a Project from the database by its primary key."""
-        file_dict = super().get(id)
-        if file_dict is None:
+        """
+        Retrieve a Project from the database by its primary key.
+
+        Like get_by_name(), returns a project buffered by unit_of_work() as is.
+        """
+        if self._pending:
+            for proj in self._pending.values():
+                if proj.id == id:
+                    return proj
+        self.flush()
+        row = self._get_raw(id)
+        if row is None:
             return None
-        return Project.from_dict(file_dict)
+        # Single project views read every field, so decode eagerly
+        return self._load_project(row, lazy=False)
 
     def get_by_name(self, name: str) -> Optional[Project]:
         """
         Retrieves a project by its unique name. This is essential for checking
         if a project already exists before deciding to update or insert.
+
+        Inside unit_of_work() a buffered project with that name is returned as is,
+        without flushing, so per-project lookups keep the stage to one write.
         """
+        if self._pending:
+            for proj in self._pending.values():
+                if proj.name == name:
+                    return proj
+            # Only a buffered rename can change which stored row has this name
+            if self._renamed:
+                self.flush()
         with self._get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
@@ -209,21 +446,23 @@ class ProjectManager(StorageManager):
             cursor.execute(query, (name,))
             result = cursor.fetchone()
             if result:
-                return Project.from_dict(dict(result))
+                return self._load_project(dict(result), deserialize=False)
         return None
 
     def get_projects_by_batch_id(self, import_batch_id: str) -> Generator[Project, None, None]:
         """Return projects associated with a specific import batch."""
+        self.flush()
         with self._get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             query = f"SELECT * FROM {self.table_name} WHERE import_batch_id = ? ORDER BY id DESC"
             cursor.execute(query, (import_batch_id,))
             for row in cursor.fetchall():
-                yield Project.from_dict(dict(row))
+                yield self._load_project(dict(row), deserialize=False)
 
     def get_latest_import_batch_id(self) -> Optional[str]:
         """Return the latest non-null batch id based on row insertion order."""
+        self.flush()
         with self._get_connection() as conn:
             cursor = conn.cursor()
             query = f"SELECT import_batch_id FROM {self.table_name} WHERE import_batch_id IS NOT NULL ORDER BY id DESC LIMIT 1"
@@ -231,10 +470,16 @@ class ProjectManager(StorageManager):
             row = cursor.fetchone()
             return row[0] if row else None
 
-    def get_project_groups(self) -> Dict[str, List[Project]]:
-        """Return current batch projects and previous projects for dashboard grouping."""
+    def get_project_groups(self, columns: Optional[Iterable[str]] = None) -> Dict[str, List[Project]]:
+        """
+        Return current batch projects and previous projects for dashboard grouping.
+
+        `columns` limits which fields are read, as in get_all().
+        """
         latest_batch_id = self.get_latest_import_batch_id()
-        all_projects = list(self.get_all())
+        if columns is not None:
+            columns = [*columns, "import_batch_id"]
+        all_projects = list(self.get_all(columns=columns))
 
         if not latest_batch_id:
             return {"current": all_projects, "previous": []}
@@ -243,12 +488,155 @@ class ProjectManager(StorageManager):
         previous = [p for p in all_projects if p.import_batch_id != latest_batch_id]
         return {"current": current, "previous": previous}
 
-    def get_all(self) -> Generator[Project, None, None]:
-        """Return a Generator that yields all stored projects."""
-        for row in super().get_all():
-            yield Project.from_dict(row)
+    def get_all(self, columns: Optional[Iterable[str]] = None) -> Generator[Project, None, None]:
+        """
+        Return a Generator that yields all stored projects.
+
+        With `columns`, only those columns (and the id) are read. The other fields
+        keep their defaults and are not written back by set() unless assigned.
+        """
+        self.flush()
+        for row in self._iter_raw(self._projection(columns)):
+            yield self._load_project(row)
+
+    def get_summaries(self) -> Generator[Project, None, None]:
+        """Yield every project with only the SUMMARY_COLUMNS loaded, for list views."""
+        return self.get_all(columns=self.SUMMARY_COLUMNS)
+
+    def get_ranked(
+        self,
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None,
+        columns: Optional[Iterable[str]] = None,
+    ) -> List[Project]:
+        """
+        Return the scored projects best first, with resume_score set to their
+        score at `now` (base_score plus recency, see ProjectRanker).
+
+        With `limit`, only projects whose key (base_score) is within MAX_RECENCY
+        of the limit-th best key can make the cut, so just those are read through
+        the key index. `columns` limits which fields are read, as in get_all().
+        Nothing is analysed: projects without a score are left out.
+        """
+        self.flush()
+        now = now or datetime.now(timezone.utc)
+        if now.tzinfo:
+            now = now.astimezone(timezone.utc).replace(tzinfo=None)
+        selected = [c for c in self._projection(columns) or self.columns_list if c != "resume_score"]
+        params = {"now": now.isoformat(), "limit": -1 if limit is None else limit}
+        with self._get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            bound = ""
+            if limit:
+                cursor.execute(
+                    f"SELECT {RANK_KEY} FROM {self.table_name} WHERE {RANK_KEY} IS NOT NULL "
+                    f"ORDER BY {RANK_KEY} DESC LIMIT 1 OFFSET ?",
+                    (limit - 1,),
+                )
+                kth = cursor.fetchone()
+                # The top `limit` all score at least the limit-th best key
+                if kth is not None:
+                    bound = f"AND {RANK_KEY} >= :cutoff"
+                    params["cutoff"] = kth[0] - ProjectRanker.MAX_RECENCY
+            cursor.execute(
+                f"""SELECT {', '.join(selected)}, {RANK_SCORE_SQL} AS rank_score FROM {self.table_name}
+                WHERE {RANK_SCORE_SQL} > 0 {bound}
+                ORDER BY rank_score DESC, {self.primary_key} LIMIT :limit""",
+                params,
+            )
+            rows = cursor.fetchall()
+        projects = []
+        for row in rows:
+            row = dict(row)
+            row["resume_score"] = row.pop("rank_score")
+            projects.append(self._load_project(row))
+        return projects
+
+    def get_skill_counts(self) -> Dict[str, int]:
+        """How many times each skill appears in projects' skills_used."""
+        self.flush()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT skill, SUM(uses) FROM project_skills GROUP BY skill")
+            return dict(cursor.fetchall())
+
+    def get_skill_usage(self) -> Dict[str, List[str]]:
+        """Names of the projects using each skill."""
+        self.flush()
+        usage: Dict[str, List[str]] = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT s.skill, p.name FROM project_skills s "
+                f"JOIN {self.table_name} p ON p.id = s.project_id ORDER BY s.skill, p.name"
+            )
+            for skill, name in cursor.fetchall():
+                usage.setdefault(skill, []).append(name)
+        return usage
+
+    def get_language_rollup(self) -> Dict[str, Dict[str, Any]]:
+        """Per language: number of projects using it and its average share (%) where known."""
+        self.flush()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT language, COUNT(*), AVG(share) FROM project_languages GROUP BY language"
+            )
+            return {
+                language: {"project_count": count, "avg_share": avg_share}
+                for language, count, avg_share in cursor.fetchall()
+            }
+
+    def get_framework_counts(self) -> Dict[str, int]:
+        """Number of projects using each framework."""
+        self.flush()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT framework, COUNT(*) FROM project_frameworks GROUP BY framework")
+            return dict(cursor.fetchall())
 
     def get_all_as_dict(self) -> Generator[Dict[str, Any], None, None]:
         """Return a Generator that yields all stored projects as dicts."""
+        self.flush()
         for row in super().get_all():
             yield row
+
+    def export_rows(self) -> Generator[Dict[str, Any], None, None]:
+        self.flush()
+        return super().export_rows()
+
+    def import_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Upsert rows as yielded by export_rows() by project name, in one transaction.
+
+        Exported ids are ignored: existing projects keep theirs, so what is linked
+        to them (authors, file hashes) survives, and new projects get a new one.
+        Returns the number of rows written.
+        """
+        self.flush()
+        count = 0
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for row in rows:
+                columns = [col for col in self.columns_list if col in row and col != self.primary_key]
+                updates = ", ".join(f"{col} = excluded.{col}" for col in columns if col != "name")
+                query = (
+                    f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+                    f"ON CONFLICT(name) DO {f'UPDATE SET {updates}' if updates else 'NOTHING'} RETURNING {self.primary_key}"
+                )
+                cursor.execute(query, [row[col] for col in columns])
+                found = cursor.fetchone()
+                if found:
+                    values = {field: row[field] for field in VALUE_FIELDS if field in row}
+                    self._sync_value_tables(cursor, Project.from_row({**values, "id": found[0]}), values)
+                count += 1
+        return count
+
+    def delete(self, key: int) -> bool:
+        self.flush()
+        return super().delete(key)
+
+    def clear(self) -> None:
+        self.flush()
+        super().clear()
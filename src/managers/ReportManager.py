@@ -1,8 +1,9 @@
-from typing import List, Literal, Optional, Dict, Any, Generator
+from typing import List, Literal, Optional, Dict, Any, Generator, Iterable, Sequence
 from datetime import datetime
 import sqlite3
 
 from src.managers.StorageManager import StorageManager
+from src.managers.migrations import Migration, add_column, version_triggers
 from src.managers.ReportProjectManager import ReportProjectManager
 from src.models.Report import Report
 from src.models.ReportProject import ReportProject
@@ -13,8 +14,7 @@ class ReportManager(StorageManager):
 
     def __init__(self, db_path: str = "reports.db") -> None:
         super().__init__(db_path)
-        self.report_project_manager = ReportProjectManager()
-        self._ensure_report_columns()
+        self.report_project_manager = ReportProjectManager(db_path)
 
     def _retrieve_id(self, cursor: sqlite3.Cursor, row: Dict[str, Any]) -> None:
         """
@@ -38,6 +38,30 @@ class ReportManager(StorageManager):
             portfolio_published_at TEXT
         )"""
 
+    @property
+    def migrations(self) -> List[Migration]:
+        """Schema steps, applied once per database; only ever append (see migrations.py)."""
+        return [
+            self.create_table_query,
+            add_column("reports", "report_kind", "TEXT DEFAULT 'resume'"),
+            add_column("reports", "portfolio_mode", "TEXT DEFAULT 'private'"),
+            add_column("reports", "portfolio_published_at", "TEXT"),
+            add_column("reports", "public_token", "TEXT"),
+            self._index_public_token,
+            version_triggers("reports"),
+            "CREATE INDEX IF NOT EXISTS idx_reports_title_created ON reports(title, date_created)",
+        ]
+
+    def _index_public_token(self, cursor: sqlite3.Cursor) -> None:
+        # Older databases may hold a token twice; the lowest id keeps it, as it did when
+        # public pages were found by scanning all reports
+        cursor.execute(
+            """UPDATE reports SET public_token = NULL
+            WHERE public_token IS NOT NULL
+            AND id > (SELECT MIN(r.id) FROM reports r WHERE r.public_token = reports.public_token)"""
+        )
+        cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_reports_public_token ON reports(public_token)")
+
     @property
     def table_name(self) -> str:
         return "reports"
@@ -86,24 +110,54 @@ class ReportManager(StorageManager):
             return None
 
         projects = self.report_project_manager.get_all_for_report(id)
+        return self._row_to_report(report_dict, projects)
 
+    def _row_to_report(self, row_dict: Dict[str, Any], projects: List[ReportProject]) -> Report:
+        """Convert a deserialized reports row and its projects to a Report object"""
         return Report(
-            id=report_dict["id"],
-            title=report_dict["title"],
-            date_created=datetime.fromisoformat(report_dict["date_created"]),
-            sort_by=report_dict["sort_by"],
+            id=row_dict["id"],
+            title=row_dict["title"],
+            date_created=datetime.fromisoformat(row_dict["date_created"]),
+            sort_by=row_dict["sort_by"],
             projects=projects,
-            notes=report_dict.get("notes"),
-            report_kind=report_dict.get("report_kind", "resume") or "resume",
-            portfolio_mode=report_dict.get("portfolio_mode", "private") or "private",
+            notes=row_dict.get("notes"),
+            report_kind=row_dict.get("report_kind", "resume") or "resume",
+            portfolio_mode=row_dict.get("portfolio_mode", "private") or "private",
             portfolio_published_at=(
-                datetime.fromisoformat(report_dict["portfolio_published_at"])
-                if report_dict.get("portfolio_published_at")
+                datetime.fromisoformat(row_dict["portfolio_published_at"])
+                if row_dict.get("portfolio_published_at")
                 else None
             ),
-            public_token=report_dict.get("public_token"),
+            public_token=row_dict.get("public_token"),
         )
 
+    def get_by_public_token(self, token: str, include_projects: bool = True) -> Optional[Report]:
+        """
+        Retrieve the report published under a public token.
+
+        Args:
+            token: public_token of the report
+            include_projects: False to skip loading the report's projects
+
+        Returns:
+            Report object or None if no report has this token
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            query = f"SELECT {self.columns} FROM {self.table_name} WHERE public_token = ?"
+            cursor.execute(query, (token,))
+            row = cursor.fetchone()
+        if row is None:
+            return None
+
+        row_dict = self._deserialize_row(dict(zip(self.columns_list, row)))
+        projects = self.report_project_manager.get_all_for_report(row_dict["id"]) if include_projects else []
+        return self._row_to_report(row_dict, projects)
+
+    def content_version(self, tables: Optional[Sequence[str]] = None) -> int:
+        """Content version covering reports and their projects (see StorageManager.content_version)."""
+        return super().content_version(tables or ["reports", "report_projects"])
+
     def set_title(self, id: int, title: str) -> bool:
         """
         Update report title.
@@ -198,35 +252,27 @@ class ReportManager(StorageManager):
         # ReportProjects deleted automatically via ON DELETE CASCADE
         return self.delete(id)
 
-    def list_reports(self) -> List[Report]:
+    def list_reports(self, include_projects: bool = True) -> List[Report]:
         """
         Retrieve all reports with their projects.
 
+        Reports and their projects are loaded with one query each and grouped
+        in memory, rather than one project query per report.
+
+        Args:
+            include_projects: False to skip loading projects entirely, for callers
+                that only need report fields (e.g. public tokens). The returned
+                reports then have no projects.
+
         Returns:
             List of Report objects
         """
-        reports = []
-        for row_dict in super().get_all():
-            id = row_dict["id"]
-            projects = self.report_project_manager.get_all_for_report(id)
-            reports.append(Report(
-                id=row_dict["id"],
-                title=row_dict["title"],
-                date_created=datetime.fromisoformat(row_dict["date_created"]),
-                sort_by=row_dict["sort_by"],
-                projects=projects,
-                notes=row_dict.get("notes"),
-                report_kind=row_dict.get("report_kind", "resume") or "resume",
-                portfolio_mode=row_dict.get("portfolio_mode", "private") or "private",
-                portfolio_published_at=(
-                    datetime.fromisoformat(row_dict["portfolio_published_at"])
-                    if row_dict.get("portfolio_published_at")
-                    else None
-                ),
-                public_token=row_dict.get("public_token"),
-            ))
-
-        return reports
+        rows = list(super().get_all())
+        projects_by_report: Dict[int, List[ReportProject]] = {}
+        if include_projects and rows:
+            projects_by_report = self.report_project_manager.get_all_by_report()
+
+        return [self._row_to_report(row_dict, projects_by_report.get(row_dict["id"], [])) for row_dict in rows]
 
     def list_reports_summary(self) -> List[Dict[str, Any]]:
         """
@@ -268,38 +314,65 @@ class ReportManager(StorageManager):
         """
         Persist edits to an existing report and all its ReportProjects.
 
-        This updates the reports row (title/sort_by/notes) and replaces all
-        report_projects rows for that report with the current in-memory list.
+        The stored rows are diffed against the in-memory report: only changed
+        report columns are updated, and only ReportProjects that were added,
+        edited or removed are written (see ReportProjectManager.sync_for_report).
+        Everything happens in one transaction.
         """
         if report.id is None:
             return False
 
-        # 1) Update report row
-        self.set(report.to_dict())
-
-        # 2) Replace all ReportProjects for this report
-        self.report_project_manager.delete_all_for_report(report.id)
-        for project in report.projects:
-            self.report_project_manager.set_from_report_project(report.id, project)
+        row = self._serialize_row(report.to_dict())
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            query = f"SELECT {self.columns} FROM {self.table_name} WHERE {self.primary_key} = ?"
+            cursor.execute(query, (report.id,))
+            result = cursor.fetchone()
+            if result is None:
+                # Row was deleted meanwhile, write it back
+                query = f"INSERT INTO {self.table_name} ({self.columns}) VALUES ({self.placeholders})"
+                cursor.execute(query, [row[c] for c in self.columns_list])
+            else:
+                stored = dict(zip(self.columns_list, result))
+                changed = [c for c in self.columns_list if row[c] != stored[c]]
+                if changed:
+                    assignments = ", ".join(f"{c} = ?" for c in changed)
+                    query = f"UPDATE {self.table_name} SET {assignments} WHERE {self.primary_key} = ?"
+                    cursor.execute(query, [row[c] for c in changed] + [report.id])
+
+            self.report_project_manager.sync_for_report(cursor, report.id, report.projects)
 
         return True
 
 
+    def import_reports(self, rows: Iterable[Dict[str, Any]]) -> Dict[int, Optional[int]]:
+        """
+        Add reports as yielded by export_rows() in one transaction, as new reports.
+
+        A report was imported before, and is skipped, if its public token is
+        already in use or a report with the same title and creation timestamp
+        exists. Returns exported id -> new id (None for skipped reports), to
+        attach the reports' projects with.
+        """
+        ids: Dict[int, Optional[int]] = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for row in rows:
+                cursor.execute(
+                    f"""SELECT 1 FROM {self.table_name}
+                    WHERE public_token = ? OR (title = ? AND date_created = ?)""",
+                    (row.get("public_token"), row.get("title"), row.get("date_created")),
+                )
+                if cursor.fetchone():
+                    ids[row.get("id")] = None
+                    continue
+                columns = [col for col in self.columns_list if col in row and col != self.primary_key]
+                query = f"INSERT INTO {self.table_name} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+                cursor.execute(query, [row[col] for col in columns])
+                ids[row.get("id")] = cursor.lastrowid
+        return ids
+
     def get_all(self) -> Generator[Report, None, None]:
         """Yield all reports with their projects"""
         for report in self.list_reports():
             yield report
-
-    def _ensure_report_columns(self) -> None:
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(reports)")
-            existing = {row[1] for row in cursor.fetchall()}
-            if "report_kind" not in existing:
-                cursor.execute("ALTER TABLE reports ADD COLUMN report_kind TEXT DEFAULT 'resume'")
-            if "portfolio_mode" not in existing:
-                cursor.execute("ALTER TABLE reports ADD COLUMN portfolio_mode TEXT DEFAULT 'private'")
-            if "portfolio_published_at" not in existing:
-                cursor.execute("ALTER TABLE reports ADD COLUMN portfolio_published_at TEXT")
-            if "public_token" not in existing:
-                cursor.execute("ALTER TABLE reports ADD COLUMN public_token TEXT")
@@ -1,8 +1,9 @@
-from typing import List, Optional, Dict, Any, Generator
+from typing import List, Optional, Dict, Any, Generator, Iterable
 from datetime import datetime
 import sqlite3
 
 from src.managers.StorageManager import StorageManager
+from src.managers.migrations import Migration, add_column, version_triggers
 from src.models.ReportProject import ReportProject, PortfolioDetails
 
 
@@ -11,16 +12,6 @@ class ReportProjectManager(StorageManager):
     # uses same db file as reports to allow for foreign key constraints
     def __init__(self, db_path: str = "reports.db") -> None:
         super().__init__(db_path)
-        self._ensure_portfolio_details_column()
-        self._ensure_portfolio_columns()
-
-    def _ensure_portfolio_details_column(self) -> None:
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(report_projects)")
-            existing = {row[1] for row in cursor.fetchall()}
-            if "portfolio_details" not in existing:
-                cursor.execute("ALTER TABLE report_projects ADD COLUMN portfolio_details TEXT")
 
     def _retrieve_id(self, cursor: sqlite3.Cursor, row: Dict[str, Any]) -> None:
         """
@@ -54,6 +45,16 @@ class ReportProjectManager(StorageManager):
             FOREIGN KEY (report_id) REFERENCES reports(id) ON DELETE CASCADE
         )"""
 
+    @property
+    def migrations(self) -> List[Migration]:
+        """Schema steps, applied once per database; only ever append (see migrations.py)."""
+        return [
+            self.create_table_query,
+            add_column("report_projects", "portfolio_details", "TEXT"),
+            add_column("report_projects", "portfolio_customizations", "TEXT"),
+            version_triggers("report_projects"),
+        ]
+
     @property
     def table_name(self) -> str:
         return "report_projects"
@@ -85,7 +86,11 @@ class ReportProjectManager(StorageManager):
             report_id: id of the parent report
             report_project: ReportProject object to store
         """
-        row = {
+        self.set(self._to_row(report_id, report_project))
+
+    def _to_row(self, report_id: int, report_project: ReportProject) -> Dict[str, Any]:
+        """Convert a ReportProject to a row dict for the given report, without an id"""
+        return {
             "id": None, # AUTOINCREMENT field
             "report_id": report_id,
             "project_name": report_project.project_name,
@@ -101,7 +106,57 @@ class ReportProjectManager(StorageManager):
             "last_modified": report_project.last_modified.isoformat() if report_project.last_modified else None,
             "collaboration_status": report_project.collaboration_status,
         }
-        self.set(row)
+
+    def sync_for_report(self, cursor: sqlite3.Cursor, report_id: int, projects: List[ReportProject]) -> int:
+        """
+        Make the stored ReportProjects of a report match `projects`, writing only what differs.
+
+        Stored rows are paired with projects by position (rows in id order), so the
+        report keeps the order a full rewrite would give it, including after a rename:
+        paired rows get an UPDATE of their changed columns, extra projects are
+        inserted and extra rows are deleted. The caller owns the transaction.
+
+        Args:
+            cursor: cursor on this manager's database, inside the caller's transaction
+            report_id: id of the parent report
+            projects: the report's current ReportProjects
+
+        Returns:
+            Number of rows inserted, updated or deleted
+        """
+        query = f"SELECT {self.columns} FROM {self.table_name} WHERE report_id = ? ORDER BY id"
+        cursor.execute(query, (report_id,))
+        stored = [dict(zip(self.columns_list, row)) for row in cursor.fetchall()]
+
+        written = 0
+        value_columns = [c for c in self.columns_list if c != "id"]
+        for old, project in zip(stored, projects):
+            row = self._serialize_row(self._to_row(report_id, project))
+            changed = [c for c in value_columns if row[c] != old[c]]
+            if changed:
+                assignments = ", ".join(f"{c} = ?" for c in changed)
+                query = f"UPDATE {self.table_name} SET {assignments} WHERE {self.primary_key} = ?"
+                cursor.execute(query, [row[c] for c in changed] + [old["id"]])
+                written += 1
+
+        added = [
+            self._serialize_row(self._to_row(report_id, project))
+            for project in projects[len(stored):]
+        ]
+        if added:
+            query = (
+                f"INSERT INTO {self.table_name} ({', '.join(value_columns)}) "
+                f"VALUES ({', '.join('?' for _ in value_columns)})"
+            )
+            cursor.executemany(query, [[row[c] for c in value_columns] for row in added])
+            written += len(added)
+
+        leftover = [(old["id"],) for old in stored[len(projects):]]
+        if leftover:
+            query = f"DELETE FROM {self.table_name} WHERE {self.primary_key} = ?"
+            cursor.executemany(query, leftover)
+            written += len(leftover)
+        return written
 
     def get(self, id: int) -> Optional[ReportProject]:
         """Retrieve a ReportProject by its primary key"""
@@ -133,6 +188,37 @@ class ReportProjectManager(StorageManager):
 
         return projects
 
+    def get_all_by_report(self, report_ids: Optional[Iterable[int]] = None) -> Dict[int, List[ReportProject]]:
+        """
+        Retrieve the ReportProjects of many reports in a single query.
+
+        Args:
+            report_ids: IDs of the parent reports, or None for every report
+
+        Returns:
+            Dict mapping report id to its ReportProjects, in insertion order.
+            Reports without projects are absent.
+        """
+        grouped: Dict[int, List[ReportProject]] = {}
+        query = f"SELECT {self.columns} FROM {self.table_name}"
+        params: List[int] = []
+        if report_ids is not None:
+            params = list(report_ids)
+            if not params:
+                return grouped
+            query += f" WHERE report_id IN ({', '.join('?' for _ in params)})"
+        query += " ORDER BY report_id, id"
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+
+            for row in cursor.fetchall():
+                row_dict = self._deserialize_row(dict(zip(self.columns_list, row)))
+                grouped.setdefault(row_dict["report_id"], []).append(self._dict_to_report_project(row_dict))
+
+        return grouped
+
     def delete_by_name(self, report_id: int, project_name: str) -> bool:
         """
         Delete a ReportProject by project name within a specific report.
@@ -207,13 +293,3 @@ class ReportProjectManager(StorageManager):
             last_modified=last_modified,
             collaboration_status=row_dict.get("collaboration_status", "individual"),
         )
-
-    def _ensure_portfolio_columns(self) -> None:
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("PRAGMA table_info(report_projects)")
-            existing = {row[1] for row in cursor.fetchall()}
-            if "portfolio_details" not in existing:
-                cursor.execute("ALTER TABLE report_projects ADD COLUMN portfolio_details TEXT")
-            if "portfolio_customizations" not in existing:
-                cursor.execute("ALTER TABLE report_projects ADD COLUMN portfolio_customizations TEXT")
@@ -2,7 +2,10 @@ import sqlite3
 import json
 from contextlib import contextmanager
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generator, Optional
+from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence
+
+from src.managers.ConnectionPool import connect, get_pool
+from src.managers.migrations import Migration, ensure_schema
 
 class StorageManager(ABC):
     """
@@ -20,9 +23,7 @@ class StorageManager(ABC):
         self._init_db()
 
     def _init_db(self) -> None:
-        with self._get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(self.create_table_query)
+        ensure_schema(self.db_path, self.table_name, self.migrations)
 
     def _deserialize_row(self, row_dict: Dict[str, Any]) -> Dict[str, Any]:
         """Unpack any complex data types from serialized JSON back to its original form."""
@@ -33,6 +34,13 @@ class StorageManager(ABC):
                 row_dict[col] = val
         return row_dict
 
+    def _serialize_row(self, row_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Pack complex data types (dict, list, bool) into JSON, as they are stored."""
+        return {
+            col: json.dumps(val) if isinstance(val, (dict, list, bool)) else val
+            for col, val in row_dict.items()
+        }
+
     def _retrieve_id(self, cursor: sqlite3.Cursor, row: Dict[str, Any]) -> None:
         """To be overidden in child classes if needed, for use with schema that include autoincremented ids."""
         pass
@@ -42,15 +50,20 @@ class StorageManager(ABC):
         """
         Manages the setup and cleanup for database reads and writes.
 
-        Returns a Generator object, ensuring that only one connection is open at once.
+        Returns a Generator object that borrows a connection from the process-wide
+        pool for this database (WAL mode, see ConnectionPool.py), commits on success
+        and hands the connection back, rolling back anything left uncommitted.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON;")
+        pool = get_pool(self.db_path)
+        conn = pool.acquire() if pool else connect(self.db_path)
         try:
             yield conn
             conn.commit()
         finally:
-            conn.close()
+            if pool:
+                pool.release(conn)
+            else:
+                conn.close()
 
     @property
     def columns_list(self) -> list[str]:
@@ -71,6 +84,15 @@ class StorageManager(ABC):
         """Return the create table query for a table for use in SQL queries."""
         pass
 
+    @property
+    def migrations(self) -> Sequence[Migration]:
+        """
+        Ordered schema steps for this table, applied once per database (see migrations.py).
+
+        Child classes that change their schema return this list with steps appended.
+        """
+        return [self.create_table_query]
+
     @property
     @abstractmethod
     def table_name(self) -> str:
@@ -97,11 +119,8 @@ class StorageManager(ABC):
         """
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            values = [row[i] for i in self.columns_list]
-            serialized_values = [
-            json.dumps(v) if isinstance(v, (dict, list, bool)) else v
-            for v in values
-            ]
+            serialized = self._serialize_row({col: row[col] for col in self.columns_list})
+            serialized_values = list(serialized.values())
             query = f"INSERT OR REPLACE INTO {self.table_name} ({self.columns}) VALUES ({self.placeholders})"
             cursor.execute(query, serialized_values)
             self._retrieve_id(cursor, row)
@@ -113,16 +132,21 @@ class StorageManager(ABC):
 
         default is an optional fallback value to be used if the key doesn't exist. Defaults to None.
         """
+        row_dict = self._get_raw(key)
+        if row_dict is None:
+            return default
+        return self._deserialize_row(row_dict)
 
+    def _get_raw(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retrieve a row by primary key as stored, without deserializing it."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
             query = f"SELECT {self.columns} FROM {self.table_name} WHERE {self.primary_key} = ?"
             cursor.execute(query, (key,))
             result = cursor.fetchone()
             if result:
-                row_dict = dict(zip(self.columns_list, result))
-                return self._deserialize_row(row_dict)
-        return default
+                return dict(zip(self.columns_list, result))
+        return None
 
     def delete(self, key: str) -> bool:
         """
@@ -144,16 +168,66 @@ class StorageManager(ABC):
 
         Can be wrapped as list(Manager.get_all()) if you need to load the whole table into memory.
         """
+        for row_dict in self._iter_raw():
+            yield self._deserialize_row(row_dict)
+
+    def _iter_raw(self, columns: Optional[List[str]] = None) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yield all rows as stored, without deserializing them.
+
+        `columns` restricts the query to those (already validated) column names.
+        """
+        columns = columns or self.columns_list
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            query = f"SELECT {self.columns} FROM {self.table_name}"
+            query = f"SELECT {', '.join(columns)} FROM {self.table_name}"
             cursor.execute(query)
             while True:
                 row = cursor.fetchone()
                 if row is None:
                     break
-                row_dict = dict(zip(self.columns_list, row))
-                yield self._deserialize_row(row_dict)
+                yield dict(zip(columns, row))
+
+    def export_rows(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        Yield all rows as stored (complex values still JSON encoded), one at a
+        time, for bulk export.
+        """
+        return self._iter_raw()
+
+    def import_rows(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or replace rows as yielded by export_rows() in one transaction.
+
+        Columns missing from a row take their default; unknown keys are ignored.
+        Returns the number of rows written.
+        """
+        count = 0
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for row in rows:
+                columns = [col for col in self.columns_list if col in row]
+                query = f"INSERT OR REPLACE INTO {self.table_name} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+                cursor.execute(query, [row[col] for col in columns])
+                count += 1
+        return count
+
+    def content_version(self, tables: Optional[Sequence[str]] = None) -> int:
+        """
+        Return a number that grows with every write to this table, or to `tables`.
+
+        Only tables whose migrations include migrations.version_triggers are counted.
+        """
+        tables = list(tables or [self.table_name])
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            query = f"SELECT COALESCE(SUM(version), 0) FROM content_version WHERE name IN ({', '.join('?' for _ in tables)})"
+            try:
+                cursor.execute(query, tables)
+            except sqlite3.OperationalError:
+                # No table has version triggers in this database yet
+                return 0
+            return cursor.fetchone()[0]
 
     def clear(self) -> None:
         """
@@ -165,3 +239,56 @@ class StorageManager(ABC):
             cursor = conn.cursor()
             query = f"DELETE FROM {self.table_name}"
             cursor.execute(query)
+
+    def vacuum(self) -> int:
+        """
+        Rebuild the whole database file (not just this table) to give space left
+        by deleted rows back to the filesystem.
+
+        Databases created before incremental vacuuming was enabled (see
+        ConnectionPool.connect) are switched to it by the rebuild, so reclaim()
+        only needs to run this once for them.
+
+        Returns the number of bytes freed. Takes the write lock for the duration,
+        so it is meant for maintenance rather than the request path.
+        """
+        with self._get_connection() as conn:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            before = conn.execute("PRAGMA page_count").fetchone()[0]
+            # Only takes effect on an existing file through the VACUUM that follows
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            conn.execute("VACUUM")
+            after = conn.execute("PRAGMA page_count").fetchone()[0]
+            # In WAL mode the rebuilt pages only land in the main file at a checkpoint
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return (before - after) * page_size
+
+    def reclaim(self, max_pages: int = 1024) -> int:
+        """
+        Give up to `max_pages` free pages of the database file back to the
+        filesystem and refresh the query planner's statistics.
+
+        Unlike vacuum() this only holds the write lock briefly, so it can run
+        alongside requests. Databases created before incremental vacuuming was
+        enabled (see ConnectionPool.connect) are rebuilt with vacuum() once.
+
+        Returns the number of bytes freed.
+        """
+        with self._get_connection() as conn:
+            incremental = conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        if not incremental:
+            freed = self.vacuum()
+        else:
+            with self._get_connection() as conn:
+                page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+                before = conn.execute("PRAGMA page_count").fetchone()[0]
+                # execute() would step the pragma once, freeing a single page
+                conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+                after = conn.execute("PRAGMA page_count").fetchone()[0]
+                conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+            freed = (before - after) * page_size
+        with self._get_connection() as conn:
+            # Samples a bounded number of rows per index, so the cost does not grow with the tables
+            conn.execute("PRAGMA analysis_limit = 400")
+            conn.execute("ANALYZE")
+        return freed
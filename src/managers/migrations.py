@@ -0,0 +1,122 @@
+"""
+File: migrations.py
+
+Versioned, one-time schema migrations for the SQLite stores.
+
+Each StorageManager lists the steps that build its table(s) in `migrations`:
+step i brings the schema to version i + 1. A step is either a SQL string or a
+callable taking a cursor. Steps are only ever appended; existing steps must not
+change, because databases that already ran them will not run them again.
+
+The version reached by each schema (named after the manager's table) is kept in
+a `schema_version` table in the same database file. Within a process, the
+connection pool remembers which schemas are up to date, so constructing a
+manager costs a stat() of the database file rather than a connection and a
+round of PRAGMA checks. The check is redone if the file is deleted or replaced.
+
+Tables can also keep a content version: a counter in `content_version` that
+triggers bump on every insert, update or delete, so caches can tell whether
+anything was written to them, by any process, since they were filled.
+"""
+
+import sqlite3
+from typing import Callable, Sequence, Union
+
+from src.managers.ConnectionPool import connect, get_pool
+
+Migration = Union[str, Callable[[sqlite3.Cursor], None]]
+
+SCHEMA_VERSION_TABLE = """CREATE TABLE IF NOT EXISTS schema_version (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+    )"""
+
+
+def add_column(table: str, column: str, definition: str) -> Callable[[sqlite3.Cursor], None]:
+    """
+    Step that adds a column unless it exists, e.g. in databases created before
+    migrations were versioned, whose tables may already have it.
+    """
+    def step(cursor: sqlite3.Cursor) -> None:
+        cursor.execute(f"PRAGMA table_info({table})")
+        if column not in {row[1] for row in cursor.fetchall()}:
+            cursor.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+    return step
+
+
+CONTENT_VERSION_TABLE = """CREATE TABLE IF NOT EXISTS content_version (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0
+    )"""
+
+
+def version_triggers(
+    table: str, events: Sequence[str] = ("INSERT", "UPDATE", "DELETE")
+) -> Callable[[sqlite3.Cursor], None]:
+    """
+    Step that bumps the content version of `table` after every write to it, or
+    only after the given kinds of write.
+    """
+    def step(cursor: sqlite3.Cursor) -> None:
+        cursor.execute(CONTENT_VERSION_TABLE)
+        cursor.execute("INSERT OR IGNORE INTO content_version (name) VALUES (?)", (table,))
+        for event in events:
+            cursor.execute(
+                f"""CREATE TRIGGER IF NOT EXISTS {table}_{event.lower()}_version AFTER {event} ON {table}
+                BEGIN
+                    UPDATE content_version SET version = version + 1 WHERE name = '{table}';
+                END"""
+            )
+    return step
+
+
+def apply_migrations(conn: sqlite3.Connection, name: str, migrations: Sequence[Migration]) -> int:
+    """
+    Run the steps of schema `name` not yet applied to this database, in one
+    transaction, and return the resulting version.
+    """
+    conn.execute(SCHEMA_VERSION_TABLE)
+    # IMMEDIATE takes the write lock first, so concurrent processes migrate one at a time
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT version FROM schema_version WHERE name = ?", (name,))
+        row = cursor.fetchone()
+        current = row[0] if row else 0
+        for step in migrations[current:]:
+            if isinstance(step, str):
+                cursor.execute(step)
+            else:
+                step(cursor)
+        if len(migrations) > current:
+            cursor.execute(
+                "INSERT OR REPLACE INTO schema_version (name, version) VALUES (?, ?)",
+                (name, len(migrations)),
+            )
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return max(current, len(migrations))
+
+
+def ensure_schema(db_path: str, name: str, migrations: Sequence[Migration]) -> None:
+    """Bring schema `name` in `db_path` up to date, once per database file and process."""
+    pool = get_pool(db_path)
+    if pool is None:
+        # Unpooled (e.g. ":memory:"): every connection is a new database anyway
+        conn = connect(db_path)
+        try:
+            apply_migrations(conn, name, migrations)
+        finally:
+            conn.close()
+        return
+
+    if pool.schema_ready(name):
+        return
+    conn = pool.acquire()
+    try:
+        apply_migrations(conn, name, migrations)
+    finally:
+        pool.release(conn)
+    pool.mark_schema_ready(name)
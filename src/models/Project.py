@@ -1,6 +1,6 @@
 from __future__ import annotations
-from dataclasses import dataclass, asdict, field
-from typing import List, Literal, Optional, Dict, Any
+from dataclasses import dataclass, asdict, field, fields
+from typing import Iterable, List, Literal, Optional, Dict, Any, Set
 from datetime import datetime
 import json
 from src.models.ReportProject import PortfolioDetails
@@ -45,6 +45,10 @@ class Project:
         "individual_contributions",
     ]
 
+    # Columns stored as JSON text. Their stored text is kept after a load/save so
+    # in-place edits (e.g. skills_selected.append) are detected as changes too.
+    JSON_FIELDS = LIST_FIELDS + DICT_FIELDS
+
     id: Optional[int] = None
     name: str = ""
     file_path: str = ""
@@ -111,6 +115,8 @@ class Project:
 
     # Scoring
     resume_score: float = 0.0
+    # resume_score without its time-dependent recency part; None until ranked
+    base_score: Optional[float] = None
 
     # Timestamps
     date_created: Optional[datetime] = None
@@ -137,26 +143,8 @@ class Project:
     @classmethod
     def from_dict(cls, proj_dict: dict) -> "Project":
         proj_dict_copy = proj_dict.copy()
-        for field_name in Project.LIST_FIELDS:
-            value = proj_dict_copy.get(field_name)
-            if isinstance(value, str):
-                try:
-                    proj_dict_copy[field_name] = json.loads(value)
-                except json.JSONDecodeError:
-                    proj_dict_copy[field_name] = []
-            elif value is None:
-                proj_dict_copy[field_name] = []
-        for field_name in Project.DICT_FIELDS:
-            value = proj_dict_copy.get(field_name)
-            if isinstance(value, str):
-                proj_dict_copy[field_name] = json.loads(value)
-            elif value is None:
-                proj_dict_copy[field_name] = {}
-
-        if isinstance(proj_dict_copy.get("portfolio_details"), dict):
-            proj_dict_copy["portfolio_details"] = PortfolioDetails.from_dict(proj_dict_copy["portfolio_details"])
-        else:
-            proj_dict_copy["portfolio_details"] = PortfolioDetails()
+        for field_name in Project.JSON_FIELDS:
+            proj_dict_copy[field_name] = _decode_json_field(field_name, proj_dict_copy.get(field_name))
 
         for field_name in ["date_created", "last_modified", "last_accessed"]:
             value = proj_dict_copy.get(field_name)
@@ -174,6 +162,120 @@ class Project:
         project.update_author_count()
         return project
 
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> "Project":
+        """
+        Build a Project from a stored row without decoding its JSON_FIELDS;
+        each is decoded from its JSON text the first time it is accessed.
+
+        Fields missing from `row` (a projected query) keep their defaults and
+        are never written back unless assigned.
+        """
+        lazy = {name: row[name] for name in Project.JSON_FIELDS if name in row}
+        project = cls.from_dict({k: v for k, v in row.items() if k not in lazy})
+        for name in lazy:
+            del project.__dict__[name]
+        object.__setattr__(project, "_lazy", lazy)
+        object.__setattr__(project, "_unloaded", _FIELD_NAMES.difference(row))
+        # from_dict counted the (not yet decoded) authors; the stored count is kept in sync
+        object.__setattr__(project, "author_count", row.get("author_count") or 0)
+        return project
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes missing from __dict__, i.e. lazy JSON fields
+        lazy = self.__dict__.get("_lazy")
+        if not lazy or name not in lazy:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        value = _decode_json_field(name, lazy.pop(name))
+        object.__setattr__(self, name, value)
+        return value
+
+    def hydrate(self) -> "Project":
+        """Decode every lazily loaded field now (e.g. before reading __dict__)."""
+        for name in list(self.__dict__.get("_lazy") or ()):
+            getattr(self, name)
+        return self
+
+    def to_columns(self, field_names: Iterable[str]) -> Dict[str, Any]:
+        """Encode only the given fields, the same way to_dict() does."""
+        columns: Dict[str, Any] = {}
+        for name in field_names:
+            if name == "author_count":
+                columns[name] = len(self.authors)
+            elif name in Project.JSON_FIELDS:
+                columns[name] = json.dumps(self._json_value(name))
+            elif name in ("date_created", "last_modified", "last_accessed"):
+                value = getattr(self, name)
+                columns[name] = value.isoformat() if value else None
+            else:
+                columns[name] = getattr(self, name)
+        return columns
+
+    def _json_value(self, name: str) -> Any:
+        value = getattr(self, name)
+        return value.to_dict() if isinstance(value, PortfolioDetails) else value
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        lazy = self.__dict__.get("_lazy")
+        if lazy:
+            lazy.pop(name, None)
+        dirty = self.__dict__.get("_dirty")
+        if dirty is not None:
+            dirty.add(name)
+
+    def mark_clean(self, stored: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record that this project matches its database row.
+
+        `stored` maps columns to the values read or written (JSON_FIELDS as
+        JSON text); it may cover only some columns after a partial update.
+        """
+        snapshot = dict(self.__dict__.get("_stored") or {})
+        if stored:
+            snapshot.update((k, stored[k]) for k in Project.JSON_FIELDS if k in stored)
+            unloaded = self.__dict__.get("_unloaded")
+            if unloaded:
+                object.__setattr__(self, "_unloaded", unloaded.difference(stored))
+        object.__setattr__(self, "_stored", snapshot)
+        object.__setattr__(self, "_dirty", set())
+
+    def mark_dirty(self, *field_names: str) -> None:
+        """Force fields to be written on the next save."""
+        dirty = self.__dict__.get("_dirty")
+        if dirty is not None:
+            dirty.update(field_names)
+
+    def dirty_fields(self) -> Optional[Set[str]]:
+        """
+        Fields changed since mark_clean(), or None if the project was never
+        loaded or saved (every field must then be written). Fields that were
+        not loaded only count once assigned.
+        """
+        dirty = self.__dict__.get("_dirty")
+        if dirty is None:
+            return None
+        changed = dirty & _FIELD_NAMES
+        stored = self.__dict__["_stored"]
+        skip = changed.union(self.__dict__.get("_lazy") or (), self.__dict__.get("_unloaded") or ())
+        for name in Project.JSON_FIELDS:
+            if name in skip:
+                continue
+            if name not in stored or self._json_value(name) != _decode_json(stored[name]):
+                changed.add(name)
+        if "authors" in changed:
+            changed.add("author_count")
+        return changed
+
+    def name_changed(self) -> bool:
+        """Whether name was assigned since mark_clean(); True if it was never called."""
+        dirty = self.__dict__.get("_dirty")
+        return dirty is None or "name" in dirty
+
     def update_author_count(self):
         self.author_count = len(self.authors)
 
@@ -308,3 +410,37 @@ class Project:
             print(f"\n  Portfolio entry:\n    {self.portfolio_entry}")
 
         print()
+
+
+_FIELD_NAMES = frozenset(f.name for f in fields(Project))
+
+# Never equal to a decoded value, so unreadable stored JSON counts as changed
+_UNDECODABLE = object()
+
+
+def _decode_json(text: Any) -> Any:
+    if not isinstance(text, str):
+        return text
+    try:
+        return json.loads(text)
+    except ValueError:
+        return _UNDECODABLE
+
+
+def _decode_json_field(name: str, value: Any) -> Any:
+    """Decode a stored JSON_FIELDS value; missing or unreadable lists become empty."""
+    if name in Project.LIST_FIELDS:
+        if isinstance(value, str):
+            try:
+                return json.loads(value)
+            except json.JSONDecodeError:
+                return []
+        return [] if value is None else value
+
+    if isinstance(value, str):
+        value = json.loads(value)
+    elif value is None:
+        value = {}
+    if name == "portfolio_details":
+        return PortfolioDetails.from_dict(value) if isinstance(value, dict) else PortfolioDetails()
+    return value
@@ -0,0 +1,282 @@
+"""
+File: rule_bundle.py
+
+Compiled, read-only classification rules shared by FileCategorizer and
+RoleSignals.
+
+Parsing categories.yml, languages.yml, markup_languages.yml and
+role_signals.yml dominates the cost of constructing those classes, and they
+are constructed often (per analyzer, per request). The rules are therefore
+compiled once per process by `get_rule_bundle()` and every instance shares
+the same immutable lookup tables.
+
+Optionally, the parsed YAML documents are also cached on disk, keyed by a
+SHA-256 fingerprint of the YAML files, so new processes (API workers,
+ProcessPool workers) skip YAML parsing too. Set RULE_BUNDLE_CACHE_DIR to a
+writable directory to enable it. Any cache error falls back to parsing.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import yaml
+
+from src.pattern_automaton import PatternAutomaton
+
+CONFIG_DIR = Path(__file__).parent / "config"
+LANG_FILE = CONFIG_DIR / "languages.yml"
+MARKUP_FILE = CONFIG_DIR / "markup_languages.yml"
+CATEGORIES_FILE = CONFIG_DIR / "categories.yml"
+ROLE_SIGNALS_FILE = CONFIG_DIR / "role_signals.yml"
+
+# File names, relative to the config directory, that feed the bundle
+RULE_FILES: Tuple[str, ...] = (
+    CATEGORIES_FILE.name,
+    LANG_FILE.name,
+    MARKUP_FILE.name,
+    ROLE_SIGNALS_FILE.name,
+)
+
+CACHE_DIR_ENV = "RULE_BUNDLE_CACHE_DIR"
+
+# Bump when the cached document layout changes
+_CACHE_VERSION = 1
+
+_bundle: Optional["RuleBundle"] = None
+_bundle_lock = threading.Lock()
+
+
+def load_yaml(path: Path) -> dict:
+    """Helper function for safely loading yaml."""
+    with open(path, "r", encoding="utf-8") as f:
+        return yaml.safe_load(f)
+
+
+# ---------------------------------------------------------------------------
+# Compiled rules
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class CategoryRules:
+    """Lookup tables used by FileCategorizer.classify_file."""
+    languages: Mapping[str, dict]           # languages.yml "languages"
+    markup_languages: Mapping[str, dict]    # markup_languages.yml "markup_languages"
+    raw_categories: Mapping[str, dict]      # categories.yml "categories", as written
+    categories: Mapping[str, dict]          # with 'language_source' expanded
+    no_extension_rules: Mapping[str, dict]
+    language_map: Mapping[str, str]         # extension -> language
+    markup_map: Mapping[str, str]           # extension -> markup language
+    ext_to_category: Mapping[str, str]
+    lang_to_category: Mapping[str, str]
+    path_patterns: Tuple[Tuple[str, Tuple[str, ...]], ...]  # (category, lowercased patterns)
+    category_names: Tuple[str, ...]         # every category classify_file can return
+    path_automaton: PatternAutomaton        # all path patterns, in category order
+    path_pattern_categories: Tuple[str, ...]  # pattern id -> category
+
+
+@dataclass(frozen=True)
+class RoleRules:
+    """Lookup tables used by RoleSignals.infer_role_bucket."""
+    roles: Mapping[str, dict]
+    lang_to_roles: Mapping[str, Tuple[str, ...]]
+    cat_to_roles: Mapping[str, Tuple[str, ...]]
+    path_patterns: Tuple[Tuple[str, str], ...]  # (pattern_lower, role)
+    path_automaton: PatternAutomaton        # pattern id i is path_patterns[i]
+
+
+@dataclass(frozen=True)
+class RuleBundle:
+    fingerprint: str
+    categories: CategoryRules
+    roles: RoleRules
+
+
+def build_language_map(lang_dict: Mapping[str, dict]) -> Dict[str, str]:
+    """Converts language -> extensions dict into extension -> language."""
+    mapping: Dict[str, str] = {}
+    for lang, conf in lang_dict.items():
+        for ext in conf.get("extensions", []):
+            mapping[ext.lower()] = lang
+    return mapping
+
+
+def expand_category_sources(
+    categories: Mapping[str, dict],
+    languages: Mapping[str, dict],
+    markup: Mapping[str, dict],
+) -> Dict[str, dict]:
+    """Resolves any 'language_source' references (e.g. 'languages', 'markup_languages', 'all')."""
+    expanded: Dict[str, dict] = {}
+    for cat, conf in categories.items():
+        conf = conf.copy()
+        src = conf.get("language_source")
+
+        if src == "languages":
+            conf["languages"] = list(languages.keys())
+        elif src == "markup_languages":
+            conf["languages"] = list(markup.keys())
+        elif src == "all":
+            conf["languages"] = list(languages.keys()) + list(markup.keys())
+
+        expanded[cat] = conf
+    return expanded
+
+
+def compile_category_rules(
+    categories_doc: Mapping[str, Any],
+    languages: Mapping[str, dict],
+    markup: Mapping[str, dict],
+) -> CategoryRules:
+    """Build CategoryRules from the parsed categories/languages/markup documents."""
+    raw_categories = categories_doc.get("categories") or {}
+    categories = expand_category_sources(raw_categories, languages, markup)
+
+    ext_to_category: Dict[str, str] = {}
+    lang_to_category: Dict[str, str] = {}
+    path_patterns: List[Tuple[str, Tuple[str, ...]]] = []
+    for category, conf in categories.items():
+        for ext in conf.get("extensions", []):
+            ext_to_category.setdefault(ext.lower(), category)
+        for lang in conf.get("languages", []):
+            lang_to_category.setdefault(lang, category)
+        if "path_patterns" in conf:
+            path_patterns.append(
+                (category, tuple(p.lower() for p in conf["path_patterns"]))
+            )
+
+    # Built-in results first, so their codes do not depend on the YAML
+    no_ext_rules = categories_doc.get("no_extension_rules") or {}
+    category_names = tuple(dict.fromkeys(
+        ["other", "ignored", "test", "docs", "config", *categories, *no_ext_rules]
+    ))
+
+    return CategoryRules(
+        languages=MappingProxyType(dict(languages)),
+        markup_languages=MappingProxyType(dict(markup)),
+        raw_categories=MappingProxyType(dict(raw_categories)),
+        categories=MappingProxyType(categories),
+        no_extension_rules=MappingProxyType(dict(no_ext_rules)),
+        language_map=MappingProxyType(build_language_map(languages)),
+        markup_map=MappingProxyType(build_language_map(markup)),
+        ext_to_category=MappingProxyType(ext_to_category),
+        lang_to_category=MappingProxyType(lang_to_category),
+        path_patterns=tuple(path_patterns),
+        category_names=category_names,
+        # Lower ids belong to earlier categories, so the lowest match wins
+        path_automaton=PatternAutomaton(p for _, patterns in path_patterns for p in patterns),
+        path_pattern_categories=tuple(c for c, patterns in path_patterns for _ in patterns),
+    )
+
+
+def compile_role_rules(roles: Mapping[str, dict]) -> RoleRules:
+    """Build RoleRules from role_signals.yml "roles"."""
+    lang_to_roles: Dict[str, List[str]] = {}
+    cat_to_roles: Dict[str, List[str]] = {}
+    path_patterns: List[Tuple[str, str]] = []
+
+    for role, rules in roles.items():
+        for lang in rules.get("languages", []):
+            lang_to_roles.setdefault(lang, []).append(role)
+        for cat in rules.get("categories", []):
+            cat_to_roles.setdefault(cat, []).append(role)
+        for p in rules.get("path_patterns", []):
+            path_patterns.append((p.lower(), role))
+
+    return RoleRules(
+        roles=MappingProxyType(dict(roles)),
+        lang_to_roles=MappingProxyType({k: tuple(v) for k, v in lang_to_roles.items()}),
+        cat_to_roles=MappingProxyType({k: tuple(v) for k, v in cat_to_roles.items()}),
+        path_patterns=tuple(path_patterns),
+        path_automaton=PatternAutomaton(p for p, _ in path_patterns),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+def _fingerprint(sources: Dict[str, bytes]) -> str:
+    digest = hashlib.sha256(f"v{_CACHE_VERSION}".encode())
+    for name in RULE_FILES:
+        digest.update(name.encode("utf-8") + b"\0")
+        digest.update(hashlib.sha256(sources[name]).digest())
+    return digest.hexdigest()
+
+
+def _read_cached_documents(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as f:
+            docs = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+    return docs if isinstance(docs, dict) and set(docs) == set(RULE_FILES) else None
+
+
+def _write_cached_documents(path: Path, docs: Dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(docs, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+    except OSError:
+        pass  # the disk cache is best-effort
+
+
+def load_rule_bundle(
+    config_dir: Path = CONFIG_DIR, cache_dir: Optional[Path] = None
+) -> RuleBundle:
+    """
+    Read and compile the rule YAML files in `config_dir`.
+
+    When `cache_dir` is given, parsed documents are reused from (or saved
+    to) a pickle named after the files' fingerprint.
+    """
+    sources = {name: (Path(config_dir) / name).read_bytes() for name in RULE_FILES}
+    fingerprint = _fingerprint(sources)
+
+    cache_path = Path(cache_dir) / f"rules-{fingerprint[:32]}.pickle" if cache_dir else None
+    docs = _read_cached_documents(cache_path) if cache_path else None
+    if docs is None:
+        docs = {name: yaml.safe_load(data.decode("utf-8")) or {} for name, data in sources.items()}
+        if cache_path:
+            _write_cached_documents(cache_path, docs)
+
+    categories = compile_category_rules(
+        docs[CATEGORIES_FILE.name],
+        docs[LANG_FILE.name].get("languages") or {},
+        docs[MARKUP_FILE.name].get("markup_languages") or {},
+    )
+    roles = compile_role_rules(docs[ROLE_SIGNALS_FILE.name].get("roles") or {})
+    return RuleBundle(fingerprint=fingerprint, categories=categories, roles=roles)
+
+
+def get_rule_bundle() -> RuleBundle:
+    """Return the process-wide bundle, loading it on first use."""
+    global _bundle
+    if _bundle is None:
+        with _bundle_lock:
+            if _bundle is None:
+                cache_dir = os.environ.get(CACHE_DIR_ENV)
+                _bundle = load_rule_bundle(cache_dir=Path(cache_dir) if cache_dir else None)
+    return _bundle
+
+
+def clear_rule_bundle() -> None:
+    """Forget the process-wide bundle; the next get_rule_bundle() reloads the YAML."""
+    global _bundle
+    with _bundle_lock:
+        _bundle = None
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+from src.managers.ImportBatchManager import ImportBatchManager
+from src.managers.ReportManager import ReportManager
+from src.managers.StorageManager import StorageManager
+
+
+@dataclass
+class RetentionPolicy:
+    # Extracted workspaces of the newest batches are kept; None disables the limit
+    keep_batches: Optional[int] = 5
+    # Workspaces and exported files older than this are removed; None disables the limit
+    max_age_days: Optional[float] = 30
+    # Directories whose files expire with max_age_days, e.g. ("resumes", "portfolios").
+    # Empty by default: exports stay downloadable from the /resume and /portfolio
+    # export routes until the user deletes them.
+    artifact_dirs: Tuple[str, ...] = ()
+    # Free pages given back per database and run, bounding how long the write lock is held
+    vacuum_pages: int = 1024
+
+
+# Minimum time between background runs started by maybe_apply_retention()
+RETENTION_INTERVAL = timedelta(hours=1)
+
+_last_run: Optional[datetime] = None
+_run_lock = threading.Lock()
+
+
+def _tree_size(path: Path) -> int:
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += (Path(root) / name).stat().st_size
+            except OSError:
+                continue
+    return total
+
+
+def expire_workspaces(
+    policy: RetentionPolicy,
+    batches: ImportBatchManager,
+    now: Optional[datetime] = None,
+) -> Tuple[int, int]:
+    """Remove the extracted workspaces of expired batches; returns (count, bytes)."""
+    expired = batches.get_expirable(policy.keep_batches, policy.max_age_days, now)
+    freed = 0
+    for batch in expired:
+        workspace = Path(batch["workspace"]) if batch["workspace"] else None
+        if workspace and workspace.is_dir():
+            freed += _tree_size(workspace)
+            shutil.rmtree(workspace, ignore_errors=True)
+    batches.mark_expired([batch["batch_id"] for batch in expired], now)
+    return len(expired), freed
+
+
+def expire_artifacts(policy: RetentionPolicy, now: Optional[datetime] = None) -> Tuple[int, int]:
+    """Remove exported files older than policy.max_age_days; returns (count, bytes)."""
+    if policy.max_age_days is None:
+        return 0, 0
+    cutoff = ((now or datetime.now()) - timedelta(days=policy.max_age_days)).timestamp()
+    count = freed = 0
+    for directory in policy.artifact_dirs:
+        out_dir = Path(directory)
+        if not out_dir.is_dir():
+            continue
+        for path in out_dir.iterdir():
+            try:
+                stat = path.stat()
+                if not path.is_file() or stat.st_mtime >= cutoff:
+                    continue
+                path.unlink()
+            except OSError:
+                continue
+            count += 1
+            freed += stat.st_size
+    return count, freed
+
+
+def apply_retention(
+    policy: Optional[RetentionPolicy] = None,
+    batches: Optional[ImportBatchManager] = None,
+    databases: Optional[Sequence[StorageManager]] = None,
+    now: Optional[datetime] = None,
+) -> Dict[str, int]:
+    """
+    Expire old workspaces and exports, then incrementally vacuum and analyze the
+    databases (projects.db and reports.db by default).
+
+    Returns what was reclaimed:
+    {"workspaces": int, "artifacts": int, "workspace_bytes": int, "artifact_bytes": int, "database_bytes": int}
+    """
+    policy = policy or RetentionPolicy()
+    batches = batches or ImportBatchManager()
+    if databases is None:
+        databases = [batches, ReportManager()]
+
+    workspaces, workspace_bytes = expire_workspaces(policy, batches, now)
+    artifacts, artifact_bytes = expire_artifacts(policy, now)
+    database_bytes = sum(db.reclaim(policy.vacuum_pages) for db in databases)
+    return {
+        "workspaces": workspaces,
+        "artifacts": artifacts,
+        "workspace_bytes": workspace_bytes,
+        "artifact_bytes": artifact_bytes,
+        "database_bytes": database_bytes,
+    }
+
+
+def maybe_apply_retention(policy: Optional[RetentionPolicy] = None) -> Optional[Dict[str, int]]:
+    """
+    Run apply_retention() unless it ran in this process within RETENTION_INTERVAL
+    or is already running. Meant to be scheduled off the request path, e.g. as a
+    FastAPI background task after an upload.
+    """
+    global _last_run
+    if not _run_lock.acquire(blocking=False):
+        return None
+    try:
+        now = datetime.now()
+        if _last_run is not None and now - _last_run < RETENTION_INTERVAL:
+            return None
+        _last_run = now
+        report = apply_retention(policy, now=now)
+    finally:
+        _run_lock.release()
+
+    reclaimed = report["workspace_bytes"] + report["artifact_bytes"] + report["database_bytes"]
+    print(
+        f"Retention: removed {report['workspaces']} workspace(s) and {report['artifacts']} export(s), "
+        f"reclaimed {reclaimed / 1024:.1f} KB"
+    )
+    return report
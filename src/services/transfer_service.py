@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Union
+
+from src.managers.ConfigManager import ConfigManager
+from src.managers.FileHashManager import FileHashManager
+from src.managers.ProjectManager import ProjectManager
+from src.managers.ReportManager import ReportManager
+from src.managers.ReportProjectManager import ReportProjectManager
+
+# Export format: a header line, then one {"table": ..., "row": ...} line per stored
+# row, with JSON columns kept as their stored text. Tables come in TABLES order, so
+# everything a row refers to (its project or report) is imported before it.
+FORMAT = "analysis-store"
+FORMAT_VERSION = 1
+TABLES = ("configs", "projects", "file_hashes", "project_file_hashes", "reports", "report_projects")
+
+# Rows written per transaction on import
+BATCH_SIZE = 1000
+
+# Given by the user of each installation, so never carried over
+EXCLUDED_CONFIG_KEYS = frozenset({"user_consent"})
+
+
+@dataclass
+class AnalysisStore:
+    """The managers of everything exported, on the usual database files by default."""
+    configs: ConfigManager = field(default_factory=ConfigManager)
+    projects: ProjectManager = field(default_factory=ProjectManager)
+    file_hashes: FileHashManager = field(default_factory=FileHashManager)
+    reports: ReportManager = field(default_factory=ReportManager)
+    report_projects: ReportProjectManager = field(default_factory=ReportProjectManager)
+
+
+def _line(record: Dict[str, Any]) -> str:
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def export_ndjson(store: Optional[AnalysisStore] = None) -> Generator[str, None, None]:
+    """Yield the store as NDJSON lines, reading one row at a time."""
+    store = store or AnalysisStore()
+    sources = {
+        "configs": (row for row in store.configs.export_rows() if row["key"] not in EXCLUDED_CONFIG_KEYS),
+        "projects": store.projects.export_rows(),
+        "file_hashes": store.file_hashes.export_rows(),
+        "project_file_hashes": store.file_hashes.export_links(),
+        "reports": store.reports.export_rows(),
+        "report_projects": store.report_projects.export_rows(),
+    }
+    yield _line({"format": FORMAT, "version": FORMAT_VERSION})
+    for table in TABLES:
+        for row in sources[table]:
+            yield _line({"table": table, "row": row})
+
+
+def import_ndjson(
+    lines: Iterable[Union[str, bytes]],
+    store: Optional[AnalysisStore] = None,
+    batch_size: int = BATCH_SIZE,
+) -> Dict[str, int]:
+    """
+    Import an export_ndjson() stream, writing `batch_size` rows per transaction.
+
+    Projects are upserted by name, config keys and file hashes are overwritten,
+    and reports are added with their projects (see ReportManager.import_reports).
+    Batches written before an invalid line stay imported.
+
+    Returns the number of rows written per table, plus "skipped" rows.
+    Raises ValueError if the stream is not an export or a line cannot be read.
+    """
+    store = store or AnalysisStore()
+    counts = dict.fromkeys((*TABLES, "skipped"), 0)
+    report_ids: Dict[int, Optional[int]] = {}
+
+    def write_configs(rows: List[Dict[str, Any]]) -> int:
+        kept = [row for row in rows if row.get("key") not in EXCLUDED_CONFIG_KEYS]
+        counts["skipped"] += len(rows) - len(kept)
+        return store.configs.import_rows(kept)
+
+    def write_reports(rows: List[Dict[str, Any]]) -> int:
+        ids = store.reports.import_reports(rows)
+        report_ids.update(ids)
+        skipped = sum(1 for new_id in ids.values() if new_id is None)
+        counts["skipped"] += skipped
+        return len(rows) - skipped
+
+    def write_report_projects(rows: List[Dict[str, Any]]) -> int:
+        # Attached to the imported copy of their report, as new rows
+        kept = [
+            {**{k: v for k, v in row.items() if k != "id"}, "report_id": report_ids[row.get("report_id")]}
+            for row in rows
+            if report_ids.get(row.get("report_id")) is not None
+        ]
+        counts["skipped"] += len(rows) - len(kept)
+        return store.report_projects.import_rows(kept)
+
+    writers: Dict[str, Callable[[List[Dict[str, Any]]], int]] = {
+        "configs": write_configs,
+        "projects": store.projects.import_rows,
+        "file_hashes": store.file_hashes.import_rows,
+        "project_file_hashes": store.file_hashes.import_links,
+        "reports": write_reports,
+        "report_projects": write_report_projects,
+    }
+
+    def flush(table: str, batch: List[Dict[str, Any]], number: int) -> None:
+        try:
+            counts[table] += writers[table](batch)
+        except (sqlite3.Error, KeyError, TypeError) as e:
+            raise ValueError(f"Line {number}: could not import {table} rows ({e})") from e
+
+    table: Optional[str] = None
+    batch: List[Dict[str, Any]] = []
+    last = 0
+    header_seen = False
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Line {number}: invalid JSON ({e.msg})") from e
+
+        if not header_seen:
+            if not isinstance(record, dict) or record.get("format") != FORMAT:
+                raise ValueError(f"Line {number}: not an {FORMAT} export")
+            if not isinstance(record.get("version"), int) or record["version"] > FORMAT_VERSION:
+                raise ValueError(f"Line {number}: unsupported {FORMAT} version {record.get('version')!r}")
+            header_seen = True
+            continue
+
+        if not isinstance(record, dict) or record.get("table") not in writers or not isinstance(record.get("row"), dict):
+            raise ValueError(f"Line {number}: expected a row of one of {', '.join(TABLES)}")
+        if record["table"] != table or len(batch) >= batch_size:
+            if batch:
+                flush(table, batch, last)
+            table, batch = record["table"], []
+        batch.append(record["row"])
+        last = number
+
+    if not header_seen:
+        raise ValueError(f"Empty stream, not an {FORMAT} export")
+    if batch:
+        flush(table, batch, last)
+    return counts
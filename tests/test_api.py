@@ -135,7 +135,7 @@ def test_get_privacy_consent_independent_of_post(client, monkeypatch):
 # /projects (list) test. testing GET /project
 def test_get_projects_list(client, monkeypatch):
     class FakeProjectManager:
-        def get_project_groups(self):
+        def get_project_groups(self, columns=None):
             return {
                 "current": [FakeProject(2, "B")],
                 "previous": [FakeProject(1, "A")],
@@ -155,6 +155,22 @@ def test_get_projects_list(client, monkeypatch):
     assert data["previous_projects"] == [{"id": 1, "name": "A"}]
     assert data["current_projects"] == [{"id": 2, "name": "B"}]
 
+
+def test_get_top_projects(client, monkeypatch, tmp_path):
+    db_path = str(tmp_path / "projects.db")
+    monkeypatch.setattr(routes, "ProjectManager", lambda: ProjectManager(db_path=db_path))
+    ProjectManager(db_path=db_path).set_many([
+        Project(name="Low", file_path="/low", base_score=20.0, resume_score=20.0),
+        Project(name="High", file_path="/high", base_score=40.0, resume_score=40.0),
+        Project(name="Unscored", file_path="/unscored"),
+    ])
+
+    res = client.get("/projects/top", params={"k": 1})
+    assert res.status_code == 200
+    assert res.json()["projects"] == [{"id": 2, "name": "High", "resume_score": 40.0}]
+
+    assert client.get("/projects/top", params={"k": 0}).status_code == 422
+
 #/projects/{id} test. GET /projects/5 test.
 def test_get_project_found(client, monkeypatch):
     class FakeProjectManager:
@@ -189,12 +205,8 @@ def test_get_project_not_found(client, monkeypatch):
 # testing GET /skills returns 200
 def test_skills_counts_and_sorts(client, monkeypatch):
     class FakeProjectManager:
-        def get_all(self):
-            return [
-                FakeProject(1, "P1", skills_used=["Python", "SQL", "Python"]),
-                FakeProject(2, "P2", skills_used=["SQL", "C#"]),
-                FakeProject(3, "P3", skills_used=[None, "  Python  "]),
-            ]
+        def get_skill_counts(self):
+            return {"SQL": 2, "C#": 1, "Python": 3}
 
     monkeypatch.setattr(routes, "ProjectManager", FakeProjectManager)
 
@@ -211,12 +223,8 @@ def test_skills_counts_and_sorts(client, monkeypatch):
 
 def test_skills_usage_returns_projects(client, monkeypatch):
     class FakeProjectManager:
-        def get_all(self):
-            return [
-                FakeProject(1, "P1", skills_used=["Python", "SQL", "Python"]),
-                FakeProject(2, "P2", skills_used=["SQL", "C#"]),
-                FakeProject(3, "P3", skills_used=[None, "  Python  "]),
-            ]
+        def get_skill_usage(self):
+            return {"C#": ["P2"], "Python": ["P1", " P3 "], "SQL": ["P1", "P2"]}
 
     monkeypatch.setattr(routes, "ProjectManager", FakeProjectManager)
 
@@ -308,6 +316,27 @@ def test_upload_project_triggers_analyses(client, monkeypatch):
     ]
 
 
+def test_upload_project_schedules_retention(client, monkeypatch):
+    monkeypatch.setattr(routes, "parse_zip_to_project_folders", lambda _: ["root1"])
+
+    class FakeAnalyzer:
+        def __init__(self, config, root_folders, tmp_path):
+            self.changed_project_names = []
+
+        def initialize_projects(self):
+            return [FakeProject(1, "Proj1")]
+
+    runs = []
+    monkeypatch.setattr(routes, "ProjectAnalyzer", FakeAnalyzer)
+    monkeypatch.setattr(routes, "maybe_apply_retention", lambda: runs.append(True))
+
+    files = {"zip_file": ("test.zip", io.BytesIO(b"fake zip bytes"), "application/zip")}
+    res = client.post("/projects/upload", files=files)
+
+    assert res.status_code == 201
+    assert runs == [True]
+
+
 def test_upload_project_invalid_zip_returns_400(client, monkeypatch):
     # Simulate invalid zip (no root folders)
     monkeypatch.setattr(routes, "parse_zip_to_project_folders", lambda _: [])
@@ -318,6 +347,95 @@ def test_upload_project_invalid_zip_returns_400(client, monkeypatch):
     assert res.status_code == 400
     assert "Zip parsed no projects" in res.json()["detail"]
 
+def test_preview_project_returns_estimate_from_zip_listing(client, monkeypatch):
+    import zipfile
+
+    def fail(*args, **kwargs):
+        raise AssertionError("preview must not run the full analysis")
+    monkeypatch.setattr(routes, "ProjectAnalyzer", fail)
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("proj/main.py", "x" * 300)
+        z.writestr("proj/web/app.js", "x" * 100)
+    buf.seek(0)
+
+    files = {"zip_file": ("test.zip", buf, "application/zip")}
+    res = client.post("/projects/preview", files=files)
+
+    assert res.status_code == 200
+    data = res.json()
+    assert data["ok"] is True
+    assert data["estimate"] is True
+    [project] = data["projects"]
+    assert project["name"] == "proj"
+    assert project["file_count"] == 2
+    assert project["total_bytes"] == 400
+    assert project["language_share"] == {"Python": 75.0, "JavaScript": 25.0}
+
+
+def test_preview_project_invalid_zip_returns_400(client):
+    files = {"zip_file": ("bad.zip", io.BytesIO(b"bad"), "application/zip")}
+    res = client.post("/projects/preview", files=files)
+
+    assert res.status_code == 400
+    assert "Zip parsed no projects" in res.json()["detail"]
+
+def test_list_projects_during_upload_is_not_blocked(client, monkeypatch, tmp_path):
+    import threading
+    import time
+
+    db_path = str(tmp_path / "projects.db")
+    monkeypatch.setattr(routes, "ProjectManager", lambda: ProjectManager(db_path=db_path))
+    monkeypatch.setattr(routes, "parse_zip_to_project_folders", lambda _: ["root1"])
+    ProjectManager(db_path=db_path).set(Project(name="Existing", file_path="/tmp/existing"))
+
+    writing = threading.Event()
+    reads_done = threading.Event()
+
+    class SlowWritingAnalyzer:
+        def __init__(self, config, root_folders, tmp_path):
+            self.changed_project_names = []
+
+        def initialize_projects(self):
+            # Hold a write transaction open, like a long analysis stage would
+            pm = ProjectManager(db_path=db_path)
+            with pm._get_connection() as conn:
+                conn.execute("BEGIN EXCLUSIVE")
+                conn.execute("INSERT INTO projects (name, file_path) VALUES ('New', '/tmp/new')")
+                writing.set()
+                reads_done.wait(5)
+            return [FakeProject(2, "New")]
+
+        def analyze_git_and_contributions(self, projects, interactive=False):
+            return ([], [])
+
+    monkeypatch.setattr(routes, "ProjectAnalyzer", SlowWritingAnalyzer)
+
+    upload_result = {}
+
+    def upload():
+        files = {"zip_file": ("test.zip", io.BytesIO(b"fake zip bytes"), "application/zip")}
+        upload_result["res"] = client.post("/projects/upload", files=files)
+
+    uploader = threading.Thread(target=upload)
+    uploader.start()
+    try:
+        assert writing.wait(5)
+        start = time.perf_counter()
+        for _ in range(3):
+            res = client.get("/projects")
+            assert res.status_code == 200
+            assert [p["name"] for p in res.json()["projects"]] == ["Existing"]
+        assert time.perf_counter() - start < 2
+    finally:
+        reads_done.set()
+        uploader.join()
+
+    assert upload_result["res"].status_code == 201
+    names = {p["name"] for p in client.get("/projects").json()["projects"]}
+    assert names == {"Existing", "New"}
+
 def test_get_portfolio_report_found(client, monkeypatch):
     class FakeConsentManager:
         def has_user_consented(self):
@@ -532,7 +650,12 @@ def test_get_config_returns_empty_when_nothing_stored(client, monkeypatch):
         def get_all(self):
             return {}
 
+    class FakeAuthorManager:
+        def get_seen_authors(self):
+            return {}
+
     monkeypatch.setattr(routes, "ConfigManager", FakeConfigManager)
+    monkeypatch.setattr(routes, "AuthorManager", FakeAuthorManager)
 
     res = client.get("/config")
     assert res.status_code == 200
@@ -541,6 +664,22 @@ def test_get_config_returns_empty_when_nothing_stored(client, monkeypatch):
     assert data["config"] == {}
 
 
+def test_get_config_includes_seen_authors(client, monkeypatch):
+    class FakeConfigManager:
+        def get_all(self):
+            return {"usernames": ["ada@test.com"]}
+
+    class FakeAuthorManager:
+        def get_seen_authors(self):
+            return {"ada@test.com": "Ada"}
+
+    monkeypatch.setattr(routes, "ConfigManager", FakeConfigManager)
+    monkeypatch.setattr(routes, "AuthorManager", FakeAuthorManager)
+
+    res = client.get("/config")
+    assert res.json()["config"] == {"usernames": ["ada@test.com"], "seen_authors": {"ada@test.com": "Ada"}}
+
+
 def test_save_config_persists_all_fields(client, monkeypatch):
     stored = {}
 
@@ -783,7 +922,7 @@ def test_list_reports_success(client, monkeypatch):
             self.report_kind = "resume"
 
     class FakeReportManager:
-        def list_reports(self):
+        def list_reports(self, include_projects=True):
             return [
                 FakeSavedReport(1, "Report A", 2),
                 FakeSavedReport(2, "Report B", 1),
@@ -1274,7 +1413,7 @@ def test_publish_and_unpublish_portfolio(client, monkeypatch):
     class FakeReportManager:
         def get_report(self, id): return report if id == 14 else None
         def update_report(self, updated): return True
-        def list_reports(self): return []
+        def list_reports(self, include_projects=True): return []
 
     monkeypatch.setattr(routes, "ConsentManager", FakeConsentManager)
     monkeypatch.setattr(routes, "ReportManager", FakeReportManager)
@@ -1305,7 +1444,7 @@ def test_publish_generates_slug_token(client, monkeypatch):
     class FakeReportManager:
         def get_report(self, id): return report if id == 20 else None
         def update_report(self, updated): return True
-        def list_reports(self): return []
+        def list_reports(self, include_projects=True): return []
 
     monkeypatch.setattr(routes, "ConsentManager", FakeConsentManager)
     monkeypatch.setattr(routes, "ReportManager", FakeReportManager)
@@ -1329,7 +1468,7 @@ def test_publish_token_stable_on_republish(client, monkeypatch):
     class FakeReportManager:
         def get_report(self, id): return report if id == 21 else None
         def update_report(self, updated): return True
-        def list_reports(self): return []
+        def list_reports(self, include_projects=True): return []
 
     monkeypatch.setattr(routes, "ConsentManager", FakeConsentManager)
     monkeypatch.setattr(routes, "ReportManager", FakeReportManager)
@@ -1371,11 +1510,14 @@ def test_public_portfolio_page_returns_html(client, monkeypatch):
     report.public_token = "public-port"
 
     class FakeReportManager:
-        def list_reports(self): return [report]
+        def get_by_public_token(self, token, include_projects=True): return report if token == report.public_token else None
+        def get_report(self, id): return report if id == report.id else None
+        def content_version(self): return 0
 
     class FakeProjectManager:
         def get_by_name(self, name): return None
         def get_all(self): return iter([])
+        def content_version(self): return 0
 
     monkeypatch.setattr(routes, "ReportManager", FakeReportManager)
     monkeypatch.setattr(routes, "ProjectManager", FakeProjectManager)
@@ -1396,7 +1538,7 @@ def test_public_portfolio_page_404_when_private(client, monkeypatch):
     report.public_token = "private-token"
 
     class FakeReportManager:
-        def list_reports(self): return [report]
+        def get_by_public_token(self, token, include_projects=True): return report if token == report.public_token else None
 
     monkeypatch.setattr(routes, "ReportManager", FakeReportManager)
 
@@ -1407,7 +1549,7 @@ def test_public_portfolio_page_404_when_private(client, monkeypatch):
 def test_public_portfolio_page_404_unknown_token(client, monkeypatch):
     """GET /public/portfolio/{token} returns 404 for an unrecognised token."""
     class FakeReportManager:
-        def list_reports(self): return []
+        def get_by_public_token(self, token, include_projects=True): return None
 
     monkeypatch.setattr(routes, "ReportManager", FakeReportManager)
 
@@ -1418,7 +1560,7 @@ def test_public_portfolio_page_404_unknown_token(client, monkeypatch):
 def test_generate_portfolio_slug_basic():
     """Slug is lowercased and special characters become hyphens."""
     class FakeRM:
-        def list_reports(self): return []
+        def list_reports(self, include_projects=True): return []
 
     slug = routes._generate_portfolio_slug("My SWE Portfolio!", FakeRM())
     assert slug == "my-swe-portfolio"
@@ -1431,7 +1573,7 @@ def test_generate_portfolio_slug_collision():
     existing.public_token = "my-portfolio"
 
     class FakeRM:
-        def list_reports(self): return [existing]
+        def list_reports(self, include_projects=True): return [existing]
 
     slug = routes._generate_portfolio_slug("My Portfolio", FakeRM(), exclude_id=99)
     assert slug.startswith("my-portfolio-")
@@ -1453,11 +1595,14 @@ def test_public_portfolio_page_hides_hidden_projects(client, monkeypatch):
     report.public_token = "hide-test"
 
     class FakeReportManager:
-        def list_reports(self): return [report]
+        def get_by_public_token(self, token, include_projects=True): return report if token == report.public_token else None
+        def get_report(self, id): return report if id == report.id else None
+        def content_version(self): return 0
 
     class FakeProjectManager:
         def get_by_name(self, name): return None
         def get_all(self): return iter([])
+        def content_version(self): return 0
 
     monkeypatch.setattr(routes, "ReportManager", FakeReportManager)
     monkeypatch.setattr(routes, "ProjectManager", FakeProjectManager)
@@ -1488,11 +1633,14 @@ def test_public_portfolio_page_renders_heatmap(client, monkeypatch):
     ]
 
     class FakeReportManager:
-        def list_reports(self): return [report]
+        def get_by_public_token(self, token, include_projects=True): return report if token == report.public_token else None
+        def get_report(self, id): return report if id == report.id else None
+        def content_version(self): return 0
 
     class FakeProjectManager:
         def get_by_name(self, name): return project if name == "MyProject" else None
         def get_all(self): return iter([])
+        def content_version(self): return 0
 
     class FakeConfigManager:
         def get(self, key): return ["dev@example.com"] if key == "usernames" else None
@@ -1509,6 +1657,46 @@ def test_public_portfolio_page_renders_heatmap(client, monkeypatch):
     assert "dev@example.com" in res.text
 
 
+def test_public_portfolio_page_is_cached_until_content_changes(client, monkeypatch):
+    """Repeat views are served from the page cache; a content version change re-renders."""
+    report = Report(id=31, title="Cached Port", date_created=datetime(2025, 1, 1),
+                    sort_by="resume_score", projects=[], notes=None, report_kind="portfolio")
+    report.portfolio_mode = "public"
+    report.public_token = "cached-port"
+    versions = {"reports": 1}
+    renders = []
+
+    class FakeReportManager:
+        def get_by_public_token(self, token, include_projects=True): return report if token == report.public_token else None
+        def get_report(self, id): return report if id == report.id else None
+        def content_version(self): return versions["reports"]
+
+    class FakeProjectManager:
+        def get_by_name(self, name): return None
+        def get_all(self): return iter([])
+        def content_version(self): return 0
+
+    def fake_badges(projects):
+        renders.append(1)
+        return {"badges": []}
+
+    monkeypatch.setattr(routes, "ReportManager", FakeReportManager)
+    monkeypatch.setattr(routes, "ProjectManager", FakeProjectManager)
+    monkeypatch.setattr(routes, "build_badge_progress", fake_badges)
+    monkeypatch.setattr(routes, "_PUBLIC_PAGE_CACHE", routes.OrderedDict())
+
+    first = client.get("/public/portfolio/cached-port")
+    second = client.get("/public/portfolio/cached-port")
+    assert first.text == second.text
+    assert len(renders) == 1
+
+    versions["reports"] = 2
+    report.title = "Renamed Port"
+    res = client.get("/public/portfolio/cached-port")
+    assert "Renamed Port" in res.text
+    assert len(renders) == 2
+
+
 def test_build_heatmap_data_aggregates_commits():
     """_build_heatmap_data sums daily commits across projects and authors."""
     from datetime import date, timedelta
@@ -2185,3 +2373,32 @@ def test_portfolio_activity_heatmap_requires_consent(client, monkeypatch):
 
     assert res.status_code == 403
     assert "consent" in res.json()["detail"].lower()
+
+
+def test_store_export_streams_ndjson(client, monkeypatch):
+    class FakeConsentManager:
+        def has_user_consented(self):
+            return True
+
+    monkeypatch.setattr(routes, "ConsentManager", FakeConsentManager)
+    monkeypatch.setattr(routes, "export_ndjson", lambda: iter(['{"format":"analysis-store","version":1}\n']))
+
+    res = client.get("/store/export")
+
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    assert res.text == '{"format":"analysis-store","version":1}\n'
+
+
+def test_store_import_rejects_invalid_stream(client, monkeypatch):
+    class FakeConsentManager:
+        def has_user_consented(self):
+            return True
+
+    monkeypatch.setattr(routes, "ConsentManager", FakeConsentManager)
+
+    files = {"file": ("store.ndjson", io.BytesIO(b'{"table": "projects", "row": {}}\n'), "application/x-ndjson")}
+    res = client.post("/store/import", files=files)
+
+    assert res.status_code == 400
+    assert "not an analysis-store export" in res.json()["detail"]
@@ -0,0 +1,74 @@
+import pytest
+
+from src.managers.AuthorManager import AuthorManager
+from src.managers.ConnectionPool import get_pool
+from src.managers.ProjectManager import ProjectManager
+from src.models.Project import Project
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "projects.db")
+    yield path
+    get_pool(path).close_all()
+
+
+@pytest.fixture
+def authors(db_path):
+    return AuthorManager(db_path)
+
+
+def _ref_counts(authors):
+    with authors._get_connection() as conn:
+        return dict(conn.execute("SELECT email, ref_count FROM authors"))
+
+
+def test_record_project_authors_keeps_existing_names(authors):
+    authors.record_project_authors(1, {"alice@example.com": "Alice"})
+    authors.record_project_authors(2, {"alice@example.com": "Alice New", "bob@example.com": "Bob"})
+
+    assert authors.get_seen_authors() == {"alice@example.com": "Alice", "bob@example.com": "Bob"}
+    assert _ref_counts(authors) == {"alice@example.com": 2, "bob@example.com": 1}
+
+
+def test_rerecording_a_project_replaces_its_links(authors):
+    authors.record_project_authors(1, {"alice@example.com": "Alice", "bob@example.com": "Bob"})
+    authors.record_project_authors(1, {"alice@example.com": "Alice"})
+
+    assert authors.get_project_authors(1) == ["alice@example.com"]
+    # Bob is no longer seen in any project
+    assert authors.get_seen_authors() == {"alice@example.com": "Alice"}
+
+
+def test_deleting_a_project_drops_only_its_authors(db_path):
+    pm = ProjectManager(db_path)
+    first, second = Project(name="first", file_path="/a"), Project(name="second", file_path="/b")
+    pm.set_many([first, second])
+    authors = AuthorManager(db_path)
+    authors.record_project_authors(first.id, {"alice@example.com": "Alice", "bob@example.com": "Bob"})
+    authors.record_project_authors(second.id, {"alice@example.com": "Alice"})
+
+    # A full rewrite of the project row keeps its links
+    pm.set_many([Project(name="first", file_path="/a", id=first.id)])
+    assert authors.get_project_authors(first.id) == ["alice@example.com", "bob@example.com"]
+
+    pm.delete(first.id)
+
+    assert authors.get_seen_authors() == {"alice@example.com": "Alice"}
+    assert _ref_counts(authors) == {"alice@example.com": 1}
+
+
+def test_merge_moves_links_to_canonical(authors):
+    authors.record_project_authors(1, {"old@example.com": "Old Name"})
+    authors.record_project_authors(2, {"new@example.com": "New Name", "old@example.com": "Old Name"})
+
+    authors.merge("new@example.com", ["old@example.com", "new@example.com"])
+
+    assert authors.get_seen_authors() == {"new@example.com": "Old Name"}
+    assert authors.get_project_authors(1) == ["new@example.com"]
+    assert _ref_counts(authors)["new@example.com"] == 2
+
+    # The merged email keeps resolving to its canonical identity
+    authors.record_project_authors(3, {"old@example.com": "Old Name"})
+    assert authors.get_project_authors(3) == ["new@example.com"]
+    assert authors.get_seen_authors() == {"new@example.com": "Old Name"}
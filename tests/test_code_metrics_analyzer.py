@@ -193,3 +193,209 @@ def test_ignored_directories_are_pruned(tmp_path: Path):
     assert "src/main.py" in rel_paths
     assert not any("node_modules" in p for p in rel_paths)
     assert not any(".venv" in p for p in rel_paths)
+
+
+def test_block_comments_and_strings_are_lexed_per_language(tmp_path: Path):
+    """
+    Block comments spanning lines count as comments, while comment markers
+    inside string literals (including URLs) do not.
+    """
+    file_path = tmp_path / "app.js"
+    _write_file(
+        file_path,
+        """/*
+ * Module header
+ */
+const url = "http://example.com";
+const marker = '# not a comment';
+let x = 1; /* trailing */
+""",
+    )
+
+    analyzer = CodeMetricsAnalyzer(tmp_path)
+    analyses = analyzer.analyze()
+
+    assert len(analyses) == 1
+    analysis = analyses[0]
+
+    assert analysis.total_lines == 6
+    # 3 header lines + 1 trailing block comment
+    assert analysis.comment_lines == 4
+    assert analysis.code_lines == 3
+    assert analysis.blank_lines == 0
+
+
+def test_python_docstrings_do_not_start_functions(tmp_path: Path):
+    """
+    A 'def' inside a docstring is not a function, and a function ends at
+    the last line of its body rather than at the next function.
+    """
+    file_path = tmp_path / "module.py"
+    _write_file(
+        file_path,
+        '''def documented():
+    """
+    Example:
+        def not_a_function():
+            pass
+    """
+    return 1
+
+
+value = documented()
+''',
+    )
+
+    analyzer = CodeMetricsAnalyzer(tmp_path)
+    analyses = analyzer.analyze()
+
+    assert len(analyses) == 1
+    analysis = analyses[0]
+
+    assert analysis.function_count == 1
+    assert analysis.max_function_length == 7
+    assert analysis.comment_lines == 0
+
+
+def test_python_signature_closed_at_def_indent(tmp_path: Path):
+    """
+    A bracket closed at the def's own indentation does not end the
+    function, and a '#' inside a string is not a comment.
+    """
+    file_path = tmp_path / "module.py"
+    _write_file(
+        file_path,
+        '''def build(
+    name,
+):
+    label = "#" + name
+    return label
+
+built = build("x")
+''',
+    )
+
+    analyzer = CodeMetricsAnalyzer(tmp_path)
+    analyses = analyzer.analyze()
+
+    assert len(analyses) == 1
+    analysis = analyses[0]
+
+    assert analysis.function_count == 1
+    assert analysis.max_function_length == 5
+    assert analysis.comment_lines == 0
+
+
+def test_multiline_strings_do_not_start_functions(tmp_path: Path):
+    """
+    A function signature inside a multi-line string is not a function, and
+    braces inside it do not end the enclosing one.
+    """
+    file_path = tmp_path / "Example.cs"
+    _write_file(
+        file_path,
+        '''string Documented() {
+    return """
+        void NotAFunction() {
+        }
+        """;
+}
+
+var value = Documented();
+''',
+    )
+
+    analyzer = CodeMetricsAnalyzer(tmp_path)
+    analyses = analyzer.analyze()
+
+    assert len(analyses) == 1
+    analysis = analyses[0]
+
+    assert analysis.function_count == 1
+    assert analysis.max_function_length == 6
+    assert analysis.comment_lines == 0
+
+
+def test_brace_function_length_ends_at_closing_brace(tmp_path: Path):
+    """
+    For brace languages, a function ends where its braces balance, and
+    braces inside strings or comments are ignored.
+    """
+    file_path = tmp_path / "Main.java"
+    _write_file(
+        file_path,
+        """public class Main {
+    public int first(int a) {
+        String s = "}";
+        // }
+        return a;
+    }
+
+    public int second() {
+        return 2;
+    }
+}
+""",
+    )
+
+    analyzer = CodeMetricsAnalyzer(tmp_path)
+    analyses = analyzer.analyze()
+
+    assert len(analyses) == 1
+    analysis = analyses[0]
+
+    assert analysis.function_count == 2
+    assert analysis.max_function_length == 5
+    assert analysis.total_function_lines == 8
+
+
+def test_python_files_carry_ast_stats(tmp_path: Path):
+    """
+    Python files get AST counters and a content hash from the same read
+    used for line metrics; other languages do not.
+    """
+    _write_file(
+        tmp_path / "app.py",
+        '''class Service:
+    """Doc."""
+
+    async def run(self, n: int) -> int:
+        with open("x") as fh:
+            return n
+''',
+    )
+    _write_file(tmp_path / "app.js", "function run() {\n  return 1;\n}\n")
+
+    analyses = {a.path.name: a for a in CodeMetricsAnalyzer(tmp_path).analyze()}
+
+    py = analyses["app.py"]
+    assert py.content_hash is not None
+    assert py.python_stats["classes"] == 1
+    assert py.python_stats["async_defs"] == 1
+    assert py.python_stats["with_blocks"] == 1
+    assert py.python_stats["type_params"] == 1
+
+    js = analyses["app.js"]
+    assert js.content_hash is None
+    assert js.python_stats == {}
+
+
+def test_worker_processes_match_inline_results(tmp_path: Path, monkeypatch):
+    """
+    Fanning out to worker processes must produce the same analyses, in the
+    same order, as the in-process path.
+    """
+    import analyzers.code_metrics_analyzer as cma  # type: ignore
+
+    for i in range(6):
+        _write_file(
+            tmp_path / f"mod_{i}.py",
+            f"def f{i}(x: int) -> int:\n" + "    x += 1\n" * i + "    return x\n",
+        )
+
+    inline = CodeMetricsAnalyzer(tmp_path, workers=1).analyze()
+
+    monkeypatch.setattr(cma, "PARALLEL_MIN_FILES", 1)
+    parallel = CodeMetricsAnalyzer(tmp_path, workers=2).analyze()
+
+    assert parallel == inline
@@ -0,0 +1,79 @@
+from pathlib import Path
+import re
+import sys
+
+# Ensure src/ is on sys.path (same pattern as your other tests)
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from analyzers.config_hints import CONFIG_HINT_MATCHER, ConfigHintMatcher  # type: ignore
+from analyzers.skill_patterns import KNOWN_CONFIG_HINTS  # type: ignore
+
+
+def _regex_matches(name):
+    """Reference behaviour: test every hint regex against the name."""
+    return [(skill, kind) for pattern, skill, kind in KNOWN_CONFIG_HINTS if pattern.search(name)]
+
+
+def test_matcher_agrees_with_hint_regexes():
+    names = [
+        "next.config.js",
+        "next.config.ts",
+        "next.config.mjs",
+        "angular.json",
+        "Dockerfile",
+        "dockerfile",
+        "Dockerfile.dev",
+        "docker-compose.yml",
+        "CMakeLists.txt",
+        "cmakelists.txt",
+        "ProjectSettings",
+        "projectsettings",
+        "Main.unity",
+        "Main.UNITY",
+        "Game.uproject",
+        "webpack.config.cjs",
+        "vite.config.js.bak",
+        "main.py",
+        "README",
+    ]
+
+    for name in names:
+        assert CONFIG_HINT_MATCHER.match(name) == _regex_matches(name), name
+
+
+def test_literal_hints_compile_into_lookup_buckets():
+    matcher = ConfigHintMatcher(
+        [
+            (re.compile(r"^vite\.config\.(js|ts)$"), "Vite", "build_tool"),
+            (re.compile(r"\.uproject$", re.I), "Unreal Engine", "framework_convention"),
+            (re.compile(r"^docker-compose\..*"), "Docker", "build_tool"),
+        ]
+    )
+
+    assert set(matcher._exact) == {"vite.config.js", "vite.config.ts"}
+    assert set(matcher._suffix_ci) == {".uproject"}
+    assert len(matcher._checks) == 1
+
+
+def test_matcher_supports_string_dict_and_object_hints():
+    class Hint:
+        skill = "Custom"
+        source_kind = "custom_kind"
+
+        def matches(self, name):
+            return name.endswith(".custom")
+
+    matcher = ConfigHintMatcher(
+        [
+            ("Makefile", "Make", "build_tool"),
+            {"pattern": re.compile(r"^pom\.xml$"), "skill": "Maven"},
+            Hint(),
+        ]
+    )
+
+    assert matcher.match("GNUmakefile") == [("Make", "build_tool")]
+    assert matcher.match("pom.xml") == [("Maven", "config_hint")]
+    assert matcher.match("app.custom") == [("Custom", "custom_kind")]
@@ -145,3 +145,37 @@ def test_delete_usernames_key(config_manager):
     config_manager.set("usernames", ["Alice", "Bob"])
     config_manager.delete("usernames")
     assert config_manager.get("usernames") is None
+
+
+# Tests for the process-wide cache
+def test_reads_are_cached_and_writes_go_through(config_manager, monkeypatch):
+    config_manager.set("usernames", ["Alice"])
+    assert config_manager.get("usernames") == ["Alice"]
+
+    loads = []
+    original = ConfigManager._iter_raw
+    monkeypatch.setattr(ConfigManager, "_iter_raw", lambda self, *a: loads.append(1) or original(self, *a))
+
+    config_manager.set("usernames", ["Alice", "Bob"])
+    assert ConfigManager(db_path=config_manager.db_path).get("usernames") == ["Alice", "Bob"]
+    assert config_manager.get("missing", "fallback") == "fallback"
+    assert loads == []
+
+
+def test_cache_sees_writes_from_other_connections(config_manager):
+    import sqlite3
+
+    config_manager.set("theme", "dark")
+    assert config_manager.get("theme") == "dark"
+
+    # e.g. another process
+    with sqlite3.connect(config_manager.db_path) as conn:
+        conn.execute("UPDATE configs SET value = 'light' WHERE key = 'theme'")
+
+    assert config_manager.get("theme") == "light"
+
+
+def test_cached_values_cannot_be_mutated(config_manager):
+    config_manager.set("usernames", ["Alice"])
+    config_manager.get("usernames").append("Mallory")
+    assert config_manager.get("usernames") == ["Alice"]
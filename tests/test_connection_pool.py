@@ -0,0 +1,107 @@
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from src.managers.ConfigManager import ConfigManager
+from src.managers.ConnectionPool import ConnectionPool, get_pool
+from src.managers.ProjectManager import ProjectManager
+from src.models.Project import Project
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "pool.db")
+    yield path
+    pool = get_pool(path)
+    pool.close_all()
+
+
+def test_connections_use_wal_and_pragmas(db_path):
+    cm = ConfigManager(db_path=db_path)
+    with cm._get_connection() as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+
+def test_connections_are_reused_and_reset(db_path):
+    cm = ConfigManager(db_path=db_path)
+    with cm._get_connection() as first:
+        first.row_factory = sqlite3.Row
+    with cm._get_connection() as second:
+        assert second is first
+        assert second.row_factory is None
+
+
+def test_failed_block_is_rolled_back(db_path):
+    cm = ConfigManager(db_path=db_path)
+    with pytest.raises(RuntimeError):
+        with cm._get_connection() as conn:
+            conn.execute("INSERT INTO configs (key, value) VALUES ('k', '1')")
+            raise RuntimeError("boom")
+    assert cm.get("k") is None
+
+
+def test_nested_blocks_get_separate_connections(db_path):
+    cm = ConfigManager(db_path=db_path)
+    with cm._get_connection() as outer:
+        with cm._get_connection() as inner:
+            assert inner is not outer
+
+
+def test_deleted_database_is_not_served_from_stale_connections(db_path):
+    cm = ConfigManager(db_path=db_path)
+    cm.set("theme", "dark")
+    os.remove(db_path)
+
+    fresh = ConfigManager(db_path=db_path)
+    assert fresh.get("theme") is None
+    fresh.set("theme", "light")
+    assert ConfigManager(db_path=db_path).get("theme") == "light"
+
+
+def test_memory_databases_are_not_pooled():
+    assert get_pool(":memory:") is None
+
+
+def test_pool_keeps_at_most_size_idle_connections(db_path):
+    pool = ConnectionPool(db_path, size=2)
+    conns = [pool.acquire() for _ in range(4)]
+    for conn in conns:
+        pool.release(conn)
+    assert len(pool._idle) == 2
+    pool.close_all()
+
+
+def test_readers_are_not_blocked_by_a_writer(db_path):
+    pm = ProjectManager(db_path=db_path)
+    pm.set(Project(name="existing", file_path="/tmp/existing"))
+
+    writing = threading.Event()
+    release = threading.Event()
+
+    def long_write():
+        with pm._get_connection() as conn:
+            conn.execute("BEGIN EXCLUSIVE")
+            conn.execute(
+                "INSERT INTO projects (name, file_path) VALUES ('in-progress', '/tmp/x')"
+            )
+            writing.set()
+            release.wait(5)
+
+    writer = threading.Thread(target=long_write)
+    writer.start()
+    try:
+        assert writing.wait(5)
+        start = time.perf_counter()
+        names = [p.name for p in pm.get_all()]
+        assert time.perf_counter() - start < 2
+        assert names == ["existing"]
+    finally:
+        release.set()
+        writer.join()
+
+    assert sorted(p.name for p in pm.get_all()) == ["existing", "in-progress"]
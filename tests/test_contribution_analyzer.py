@@ -8,7 +8,7 @@ from src.analyzers.contribution_analyzer import ContributionAnalyzer, Contributi
 @pytest.fixture
 def analyzer():
     a = ContributionAnalyzer()
-    a.file_categorizer.classify_file = MagicMock(return_value="code")
+    a.file_categorizer.classify_many = fake_classify_many(a, lambda path: "code")
     a.file_categorizer.language_map = {
         "py": "Python",
         "md": "Markdown",
@@ -21,6 +21,14 @@ def analyzer():
 PATCH = "src.analyzers.contribution_analyzer.subprocess.run"
 
 
+def fake_classify_many(analyzer, classify):
+    """A classify_many mock returning classify(path) for each path."""
+    names = analyzer.file_categorizer.category_names
+    return MagicMock(
+        side_effect=lambda paths, languages=None: [names.index(classify(p)) for p in paths]
+    )
+
+
 def make_numstat_output(*commits):
     """
     Build a fake `git log --numstat` output string from a list of dicts:
@@ -210,8 +218,7 @@ def test_categorize_file_path_case_insensitive(analyzer):
 
 
 def test_analyze_categorizes_contributions(analyzer, tmp_path):
-    def smart_classify(file_info):
-        path = file_info.get("path", "")
+    def smart_classify(path):
         if "test" in path:
             return "test"
         if "docs" in path or path.endswith(".md"):
@@ -220,7 +227,7 @@ def test_analyze_categorizes_contributions(analyzer, tmp_path):
             return "other"
         return "code"
 
-    analyzer.file_categorizer.classify_file = smart_classify
+    analyzer.file_categorizer.classify_many = fake_classify_many(analyzer, smart_classify)
 
     output = make_numstat_output({
         "hash": "aaa", "email": "alice@example.com", "name": "Alice",
@@ -241,6 +248,26 @@ def test_analyze_categorizes_contributions(analyzer, tmp_path):
     assert alice.contribution_by_type["other"] == 2
 
 
+def test_analyze_classifies_each_commit_as_one_batch(analyzer, tmp_path):
+    output = make_numstat_output(
+        {"hash": "aaa", "email": "alice@example.com", "name": "Alice",
+         "files": {"src/a.py": (1, 0), "src/b.py": (1, 0)}},
+        {"hash": "bbb", "email": "alice@example.com", "name": "Alice",
+         "files": {"src/b.py": (1, 0), "docs/c.md": (1, 0)}},
+    )
+    analyzer.file_categorizer.classify_file = MagicMock()
+    with patch(PATCH, return_value=mock_subprocess(output)):
+        analyzer.analyze(str(tmp_path))
+
+    batches = [c.args for c in analyzer.file_categorizer.classify_many.call_args_list]
+    # Paths already classified by an earlier commit are not sent again
+    assert batches == [
+        (["src/a.py", "src/b.py"], ["Python", "Python"]),
+        (["docs/c.md"], ["Markdown"]),
+    ]
+    analyzer.file_categorizer.classify_file.assert_not_called()
+
+
 # -------------------------
 # Tests for _names_are_similar
 # -------------------------
@@ -0,0 +1,131 @@
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path (same pattern as your other tests)
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from analyzers import dependency_manifests  # type: ignore
+from analyzers.dependency_manifests import (  # type: ignore
+    parse_manifest,
+    parse_manifest_text,
+    resolve_skills,
+)
+
+
+def test_package_json_reads_dependency_sections_only():
+    text = """{
+      "name": "express-demo",
+      "scripts": {"test": "jest"},
+      "dependencies": {"react": "^18.0.0", "@angular/core": "17"},
+      "devDependencies": {"@playwright/test": "1.40"}
+    }"""
+    path = Path("package.json")
+
+    names = parse_manifest_text(path, text)
+    skills = resolve_skills(path, names)
+
+    assert names == {"react", "@angular/core", "@playwright/test"}
+    # "express" and "jest" appear in the file but are not dependencies
+    assert set(skills) == {"React", "Angular", "Playwright"}
+    assert skills["Playwright"] == "@playwright/test"
+
+
+def test_requirements_and_pyproject_names():
+    reqs = "Django>=4.2  # web\n-r base.txt\npytest-cov==4.1\nscikit-learn\n"
+    pyproject = """
+[project]
+dependencies = ["fastapi[all]>=0.100", "redis"]
+
+[build-system]
+requires = ["poetry-core"]
+"""
+    req_path = Path("requirements.txt")
+    py_path = Path("pyproject.toml")
+
+    assert parse_manifest_text(req_path, reqs) == {"django", "pytest-cov", "scikit-learn"}
+    assert set(resolve_skills(req_path, parse_manifest_text(req_path, reqs))) == {
+        "Django",
+        "PyTest",
+        "scikit-learn",
+    }
+    assert set(resolve_skills(py_path, parse_manifest_text(py_path, pyproject))) == {
+        "FastAPI",
+        "Redis",
+        "Poetry",
+    }
+
+
+def test_pom_go_mod_and_csproj():
+    pom = """<project xmlns="http://maven.apache.org/POM/4.0.0">
+  <parent>
+    <groupId>org.springframework.boot</groupId>
+    <artifactId>spring-boot-starter-parent</artifactId>
+  </parent>
+  <dependencies>
+    <dependency>
+      <groupId>org.junit.jupiter</groupId>
+      <artifactId>junit-jupiter</artifactId>
+    </dependency>
+  </dependencies>
+</project>"""
+    go_mod = "module example.com/app\n\nrequire (\n\tgithub.com/redis/go-redis/v9 v9.0.0\n)\n"
+    csproj = """<Project Sdk="Microsoft.NET.Sdk.Web">
+  <ItemGroup>
+    <PackageReference Include="Microsoft.EntityFrameworkCore" Version="8.0.0" />
+  </ItemGroup>
+</Project>"""
+
+    pom_path = Path("pom.xml")
+    assert set(resolve_skills(pom_path, parse_manifest_text(pom_path, pom))) == {
+        "Spring",
+        "JUnit",
+    }
+
+    go_path = Path("go.mod")
+    assert parse_manifest_text(go_path, go_mod) == {"github.com/redis/go-redis/v9"}
+    assert set(resolve_skills(go_path, parse_manifest_text(go_path, go_mod))) == {"Redis"}
+
+    cs_path = Path("App.csproj")
+    assert set(resolve_skills(cs_path, parse_manifest_text(cs_path, csproj))) == {
+        ".NET",
+        "ASP.NET",
+    }
+
+
+def test_rules_respect_allowed_files():
+    # JS framework rules only apply to package.json, not lock files
+    names = parse_manifest_text(
+        Path("package-lock.json"),
+        '{"packages": {"": {}, "node_modules/react": {}, "node_modules/redis": {}}}',
+    )
+
+    assert names == {"react", "redis"}
+    assert set(resolve_skills(Path("package-lock.json"), names)) == {"Redis"}
+
+
+def test_malformed_manifest_falls_back_to_token_scan():
+    names = parse_manifest_text(Path("package.json"), '{"dependencies": {"redis": ')
+
+    assert "redis" in names
+
+
+def test_parse_manifest_caches_by_content_hash(tmp_path: Path, monkeypatch):
+    dependency_manifests.clear_cache()
+    path = tmp_path / "requirements.txt"
+    path.write_text("flask\n", encoding="utf-8")
+
+    first = parse_manifest(path)
+
+    def fail(_path, _text):
+        raise AssertionError("cache miss: manifest was parsed again")
+
+    monkeypatch.setattr(dependency_manifests, "parse_manifest_text", fail)
+    assert parse_manifest(path) == first == {"flask"}
+
+    # Changed contents produce a new hash and a fresh parse
+    monkeypatch.undo()
+    path.write_text("flask\nnumpy\n", encoding="utf-8")
+    assert parse_manifest(path) == {"flask", "numpy"}
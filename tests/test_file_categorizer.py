@@ -1,8 +1,9 @@
 import pytest
 from src.FileCategorizer import FileCategorizer
+from src.rule_bundle import compile_category_rules
 
 @pytest.fixture
-def mock_categorizer(monkeypatch):
+def mock_categorizer():
     """Loads fake yaml so that we dont have to call our real yaml. if using the real yaml, changes to it could cause these tests to fail"""
     fake_langs = {"Python": {"extensions": ["py"]}, "C++": {"extensions": ["cpp"]}}
     fake_markup = {"HTML": {"extensions": ["html"]}}
@@ -13,15 +14,8 @@ def mock_categorizer(monkeypatch):
         "tests": {"path_patterns": ["test/", "tests/"], "extensions": ["spec.js"]},
     }
 
-    def fake_load_yaml(path):
-        return {
-            "languages": fake_langs,
-            "markup_languages": fake_markup,
-            "categories": fake_categories
-        }
-    # patch load_yaml everywhere in this test run
-    monkeypatch.setattr("src.FileCategorizer.load_yaml", fake_load_yaml)
-    return FileCategorizer()
+    rules = compile_category_rules({"categories": fake_categories}, fake_langs, fake_markup)
+    return FileCategorizer(rules)
 
 
 def test_classify_python_file_returns_code(mock_categorizer):
@@ -86,3 +80,34 @@ def test_compute_metrics_counts_and_percentages(mock_categorizer):
 
     assert set(counts.keys()) == {"code", "docs", "design", "test"}
     assert sum(percentages.values()) == pytest.approx(100.0, rel=1e-2)
+
+def test_classify_many_returns_compact_codes(mock_categorizer):
+    paths = ["main.py", "docs/readme.md", "ui/index.html", "tests/unit/sample.spec.js"]
+    codes = mock_categorizer.classify_many(paths, ["Python", "Markdown", "HTML", "JavaScript"])
+
+    assert codes.typecode == "B"
+    assert [mock_categorizer.category_names[c] for c in codes] == ["code", "docs", "design", "test"]
+
+def test_classify_many_matches_classify_file():
+    categorizer = FileCategorizer()
+    paths = [
+        "src/app.py", "src/app_test.py", "src/test-utils.py", "pkg/__tests__/App.jsx",
+        "a/tests/helpers.js", "tests/conftest.py", "web/Button.spec.tsx", "data/x.fixture.json",
+        "node_modules/react/index.js", "proj/.DS_Store", "proj/Makefile", "proj/Dockerfile",
+        "docs/guide.md", "docs/notes.unknownext", "assets/logo.png", "ci/.github/workflows/ci.yml",
+        "latest.py", "contest/solution.cpp", "a\\b\\test_win.py", "",
+    ]
+    languages = ["Python", "Python", "Python", "JavaScript", "JavaScript", "Python", "TypeScript",
+                 None, "JavaScript", None, None, None, "Markdown", None, None, "YAML",
+                 "Python", "C++", "Python", None]
+
+    codes = categorizer.classify_many(paths, languages)
+    expected = [
+        categorizer.classify_file({"path": p, "language": lang})
+        for p, lang in zip(paths, languages)
+    ]
+    assert [categorizer.category_names[c] for c in codes] == expected
+
+def test_classify_many_rejects_mismatched_languages(mock_categorizer):
+    with pytest.raises(ValueError):
+        mock_categorizer.classify_many(["a.py", "b.py"], ["Python"])
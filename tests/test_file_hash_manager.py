@@ -0,0 +1,86 @@
+import pytest
+
+from src.managers.ConnectionPool import get_pool
+from src.managers.FileHashManager import FileHashManager
+from src.managers.ProjectManager import ProjectManager
+from src.models.Project import Project
+from utils.compact_db import run_compaction
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "projects.db")
+    yield path
+    get_pool(path).close_all()
+
+
+def _stored_hashes(hashes):
+    return sorted(row["file_hash"] for row in hashes.get_all())
+
+
+def test_deleting_a_project_drops_hashes_only_it_had(db_path):
+    pm = ProjectManager(db_path)
+    first, second = Project(name="first", file_path="/a"), Project(name="second", file_path="/b")
+    pm.set_many([first, second])
+    hashes = FileHashManager(db_path)
+    hashes.register_project_hashes("first", [("shared", "/a/x"), ("only-first", "/a/y")])
+    hashes.register_project_hashes("second", [("shared", "/b/x")])
+
+    # Rewriting the project row keeps its links
+    pm.set(Project(name="first", file_path="/a", id=first.id))
+    assert hashes.get_project_hashes("first") == ["only-first", "shared"]
+
+    pm.delete(first.id)
+
+    assert _stored_hashes(hashes) == ["shared"]
+    # Managers created earlier forget the dropped hashes once refreshed
+    assert hashes.has_hash("only-first")
+    hashes.refresh()
+    assert not hashes.has_hash("only-first")
+    assert hashes.has_hash("shared")
+
+
+def test_reregistering_a_project_replaces_its_hashes(db_path):
+    hashes = FileHashManager(db_path)
+    hashes.register_project_hashes("first", [("old", "/a/x"), ("kept", "/a/y")])
+    hashes.register_project_hashes("second", [("kept", "/b/y")])
+
+    result = hashes.register_project_hashes("first", [("kept", "/a/y"), ("new", "/a/z")])
+
+    assert result == {"new": 1, "duplicate": 1}
+    assert hashes.get_project_hashes("first") == ["kept", "new"]
+    assert _stored_hashes(hashes) == ["kept", "new"]
+    assert not hashes.has_hash("old")
+
+
+def test_compact_drops_hashes_of_missing_projects(db_path):
+    pm = ProjectManager(db_path)
+    pm.set(Project(name="kept", file_path="/a"))
+    hashes = FileHashManager(db_path)
+    hashes.register_project_hashes("kept", [("h1", "/a/x")])
+    # Left behind by a project that was never saved, or deleted before links existed
+    hashes.register_project_hashes("gone", [(f"h{i}", f"/b/{i}") for i in range(2, 500)])
+
+    freed = run_compaction(db_path)
+
+    assert freed["links"] == 498
+    assert freed["hashes"] == 498
+    assert freed["bytes"] > 0
+    assert _stored_hashes(hashes) == ["h1"]
+    hashes.refresh()
+    assert not hashes.has_hash("h2")
+
+
+def test_legacy_hashes_are_linked_to_their_project(db_path):
+    conn = get_pool(db_path).acquire()
+    conn.execute(
+        "CREATE TABLE file_hashes (file_hash TEXT PRIMARY KEY, file_path TEXT, project_name TEXT, last_seen TEXT)"
+    )
+    conn.execute("INSERT INTO file_hashes VALUES ('h1', '/a/x', 'legacy', '2024-01-01T00:00:00')")
+    conn.commit()
+    get_pool(db_path).release(conn)
+
+    hashes = FileHashManager(db_path)
+
+    assert hashes.get_project_hashes("legacy") == ["h1"]
+    assert hashes.has_hash("h1")
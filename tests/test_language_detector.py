@@ -107,6 +107,28 @@ class TestFilterFiles:
         result = filter_files(tmp_path)
         assert result == []
 
+    def test_ignored_directories_are_not_descended(self, tmp_path):
+        (tmp_path / "main.py").touch()
+        deep = tmp_path / "node_modules" / "pkg" / "lib"
+        deep.mkdir(parents=True)
+        (deep / "index.js").touch()
+        (tmp_path / ".git" / "objects").mkdir(parents=True)
+
+        import utils.tree_walk as tree_walk
+        scanned = []
+        real_scandir = tree_walk.os.scandir
+
+        def recording_scandir(path):
+            scanned.append(Path(path).name)
+            return real_scandir(path)
+
+        with patch.object(tree_walk.os, "scandir", recording_scandir):
+            result = filter_files(tmp_path)
+
+        assert [f.name for f in result] == ["main.py"]
+        assert "node_modules" not in scanned
+        assert ".git" not in scanned
+
 
 class TestAggregateLOCByLanguage:
     """Tests for the aggregate_loc_by_language function."""
@@ -0,0 +1,102 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+# Ensure src/ is on sys.path (same pattern as your other tests)
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from analyzers.code_metrics_analyzer import CodeFileAnalysis, CodeMetricsAnalyzer  # type: ignore
+from analyzers.metrics_table import MetricsTable  # type: ignore
+
+
+def _analysis(language, is_test=False, code=10, comments=0, functions=1, max_len=5):
+    return CodeFileAnalysis(
+        path=Path("f"),
+        language=language,
+        is_test=is_test,
+        total_lines=code + comments,
+        code_lines=code,
+        comment_lines=comments,
+        function_count=functions,
+        max_function_length=max_len,
+        total_function_lines=functions * max_len,
+    )
+
+
+def test_rows_are_grouped_by_language_in_first_appearance_order():
+    table = MetricsTable.from_analyses(
+        [
+            _analysis("Python", code=1),
+            _analysis("JavaScript", code=2),
+            _analysis(None, code=3),
+            _analysis("Python", code=4),
+        ]
+    )
+
+    assert table.languages == ["Python", "JavaScript", "Unknown"]
+    assert list(table.offsets) == [0, 2, 3, 4]
+    assert list(table.columns["code_lines"]) == [1, 4, 2, 3]
+    assert len(table) == 4
+
+
+def test_summarize_overall_and_per_language():
+    summary = MetricsTable.from_analyses(
+        [
+            _analysis("Python", code=30, comments=10, functions=2, max_len=8),
+            _analysis("Python", is_test=True, code=10, functions=1, max_len=4),
+            _analysis("Go", code=60, functions=3, max_len=12),
+        ]
+    ).summarize()
+
+    overall = summary["overall"]
+    assert overall["total_files"] == 3
+    assert overall["num_code_files"] == 2
+    assert overall["num_test_files"] == 1
+    assert overall["test_file_ratio"] == pytest.approx(0.5)
+    assert overall["total_lines_of_code"] == 100
+    assert overall["comment_ratio"] == pytest.approx(10 / 110)
+    assert overall["avg_function_length"] == pytest.approx((16 + 4 + 36) / 6)
+    assert overall["max_function_length"] == 12
+    assert overall["avg_functions_per_file"] == pytest.approx(2.0)
+
+    python = summary["per_language"]["Python"]
+    assert python["file_count"] == 2
+    assert python["loc"] == 40
+    assert python["functions"] == 3
+    assert python["test_file_count"] == 1
+    assert python["max_function_length"] == 8
+    assert python["comment_ratio"] == pytest.approx(0.2)
+    assert python["avg_functions_per_file"] == pytest.approx(1.5)
+
+
+def test_empty_table_summarizes_to_zeros():
+    summary = MetricsTable.from_analyses([]).summarize()
+
+    assert summary["overall"]["total_files"] == 0
+    assert summary["overall"]["max_function_length"] == 0
+    assert summary["per_language"] == {}
+
+
+def test_analyzer_summarizes_a_prebuilt_table():
+    analyses = [_analysis("Python", code=i, functions=i % 3) for i in range(50)]
+    analyses += [_analysis("Rust", is_test=True, code=7)]
+    table = MetricsTable.from_analyses(analyses)
+
+    analyzer = CodeMetricsAnalyzer(Path("."))
+    assert analyzer.summarize(table) == analyzer.summarize(analyses)
+
+
+def test_language_totals_sum_a_column_per_language():
+    table = MetricsTable.from_analyses(
+        [
+            _analysis("Python", code=3, comments=1),
+            _analysis(None, code=5),
+            _analysis("Python", code=2),
+        ]
+    )
+
+    assert table.language_totals("total_lines") == {"Python": 6, "Unknown": 5}
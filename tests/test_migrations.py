@@ -0,0 +1,135 @@
+import os
+import sqlite3
+
+import pytest
+
+from src.managers import migrations
+from src.managers.ConfigManager import ConfigManager
+from src.managers.ConnectionPool import get_pool
+from src.managers.ReportManager import ReportManager
+from src.managers.migrations import add_column, apply_migrations, version_triggers
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "schema.db")
+    yield path
+    get_pool(path).close_all()
+
+
+def _columns(db_path, table):
+    with sqlite3.connect(db_path) as conn:
+        return [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+
+
+def _version(db_path, name):
+    with sqlite3.connect(db_path) as conn:
+        row = conn.execute("SELECT version FROM schema_version WHERE name = ?", (name,)).fetchone()
+    return row[0] if row else None
+
+
+def test_steps_run_once_and_version_is_recorded(db_path):
+    calls = []
+    steps = ["CREATE TABLE t (a TEXT)", lambda cursor: calls.append("step2")]
+
+    with sqlite3.connect(db_path) as conn:
+        assert apply_migrations(conn, "t", steps) == 2
+        assert apply_migrations(conn, "t", steps) == 2
+
+    assert calls == ["step2"]
+    assert _version(db_path, "t") == 2
+
+
+def test_appended_steps_are_applied(db_path):
+    steps = ["CREATE TABLE t (a TEXT)"]
+    with sqlite3.connect(db_path) as conn:
+        apply_migrations(conn, "t", steps)
+        apply_migrations(conn, "t", steps + [add_column("t", "b", "INTEGER")])
+
+    assert _columns(db_path, "t") == ["a", "b"]
+    assert _version(db_path, "t") == 2
+
+
+def test_failed_migration_is_rolled_back(db_path):
+    def broken(cursor):
+        raise RuntimeError("bad migration")
+
+    with sqlite3.connect(db_path) as conn:
+        with pytest.raises(RuntimeError):
+            apply_migrations(conn, "t", ["CREATE TABLE t (a TEXT)", broken])
+
+    assert _columns(db_path, "t") == []
+    assert _version(db_path, "t") is None
+
+
+def test_add_column_skips_existing_columns(db_path):
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE t (a TEXT, b TEXT)")
+        add_column("t", "b", "TEXT")(conn.cursor())
+
+    assert _columns(db_path, "t") == ["a", "b"]
+
+
+def test_version_triggers_count_writes(db_path):
+    with sqlite3.connect(db_path) as conn:
+        apply_migrations(conn, "t", ["CREATE TABLE t (a TEXT)", version_triggers("t")])
+        conn.execute("INSERT INTO t VALUES ('x')")
+        conn.execute("UPDATE t SET a = 'y'")
+        conn.execute("DELETE FROM t")
+        version = conn.execute("SELECT version FROM content_version WHERE name = 't'").fetchone()[0]
+
+    assert version == 3
+
+
+def test_managers_do_no_schema_work_once_migrated(db_path, monkeypatch):
+    ConfigManager(db_path=db_path)
+
+    calls = []
+    monkeypatch.setattr(migrations, "apply_migrations", lambda *args: calls.append(args))
+    ConfigManager(db_path=db_path)
+    assert calls == []
+
+    # A deleted database is migrated again
+    os.remove(db_path)
+    ConfigManager(db_path=db_path)
+    assert len(calls) == 1
+
+
+def test_unversioned_database_is_upgraded(tmp_path):
+    db_path = str(tmp_path / "reports.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE reports (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+            "date_created TEXT NOT NULL, sort_by TEXT DEFAULT 'resume_score', notes TEXT)"
+        )
+
+    ReportManager(db_path=db_path)
+
+    assert _columns(db_path, "reports")[-4:] == [
+        "report_kind", "portfolio_mode", "portfolio_published_at", "public_token",
+    ]
+    assert _version(db_path, "reports") == 8
+    get_pool(db_path).close_all()
+
+
+def test_duplicate_public_tokens_are_cleared_before_indexing(tmp_path):
+    db_path = str(tmp_path / "reports.db")
+    with sqlite3.connect(db_path) as conn:
+        conn.execute(
+            "CREATE TABLE reports (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+            "date_created TEXT NOT NULL, sort_by TEXT DEFAULT 'resume_score', notes TEXT, public_token TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO reports (title, date_created, public_token) VALUES (?, '2025-01-01', ?)",
+            [("A", "slug"), ("B", "slug"), ("C", None), ("D", None)],
+        )
+
+    rm = ReportManager(db_path=db_path)
+
+    assert rm.get_by_public_token("slug", include_projects=False).title == "A"
+    with sqlite3.connect(db_path) as conn:
+        tokens = [row[0] for row in conn.execute("SELECT public_token FROM reports ORDER BY id")]
+        assert tokens == ["slug", None, None, None]
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute("UPDATE reports SET public_token = 'slug' WHERE id = 3")
+    get_pool(db_path).close_all()
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from src.FileCategorizer import FileCategorizer
+from src.pattern_automaton import PatternAutomaton, first_id, iter_ids
+from src.rule_bundle import compile_category_rules, compile_role_rules
+
+
+@pytest.mark.parametrize("linear_scan_max", [0, 1000])
+def test_scan_finds_every_occurring_pattern(linear_scan_max):
+    patterns = ["he", "she", "his", "hers", "e", "xyz"]
+    automaton = PatternAutomaton(patterns, linear_scan_max=linear_scan_max)
+
+    assert automaton.matches("ushers") == [0, 1, 3, 4]
+    assert automaton.matches("this") == [2]
+    assert automaton.matches("") == []
+
+
+@pytest.mark.parametrize("linear_scan_max", [0, 1000])
+def test_scan_agrees_with_substring_checks(linear_scan_max):
+    rng = random.Random(7)
+    for _ in range(300):
+        patterns = ["".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+                    for _ in range(rng.randint(1, 8))]
+        automaton = PatternAutomaton(patterns, linear_scan_max=linear_scan_max)
+        for _ in range(5):
+            text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 12)))
+            expected = [i for i, p in enumerate(patterns) if p in text]
+            assert automaton.matches(text) == expected
+
+
+def test_duplicate_patterns_each_get_an_id():
+    automaton = PatternAutomaton(["ui", "api", "ui"], linear_scan_max=0)
+    assert automaton.matches("src/ui/api.js") == [0, 1, 2]
+
+
+def test_bit_helpers():
+    assert list(iter_ids(0b10110)) == [1, 2, 4]
+    assert first_id(0b10100) == 2
+    assert first_id(0) == -1
+
+
+def test_path_category_follows_yaml_order():
+    categories = {
+        "docs": {"path_patterns": ["docs"]},
+        "design": {"path_patterns": ["ui", "docs/ui"]},
+    }
+    categorizer = FileCategorizer(compile_category_rules({"categories": categories}, {}, {}))
+
+    assert categorizer.classify_file({"path": "docs/ui/a.unknownext"}) == "docs"
+    assert categorizer.classify_file({"path": "app/UI/a.unknownext"}) == "design"
+    assert categorizer.classify_file({"path": "app/a.unknownext"}) == "other"
+
+
+def test_role_path_patterns_are_scored_once_each():
+    from src.analyzers.contribution_analyzer import RoleSignals
+
+    rules = compile_role_rules({
+        "frontend": {"path_patterns": ["web", "ui"]},
+        "backend": {"path_patterns": ["api"]},
+    })
+    signals = RoleSignals(rules)
+    # Two frontend patterns reach the threshold; one backend pattern does not
+    assert signals.infer_role_bucket("web/ui/api.ts", "", "") == "frontend"
+    assert signals.infer_role_bucket("api/api.py", "", "") == "none"
@@ -141,3 +141,31 @@ def test_project_display_shows_resume_score(sample_project, capsys):
     captured = capsys.readouterr()
 
     assert "(Resume Score: 88.12)" in captured.out
+
+def test_dirty_fields_untracked_until_marked_clean(sample_project):
+    assert sample_project.dirty_fields() is None
+
+    sample_project.mark_clean(sample_project.to_dict())
+    assert sample_project.dirty_fields() == set()
+
+    sample_project.summary = "Updated"
+    sample_project.skills_used.append("Docker")
+    sample_project.authors = ["Alice"]
+    assert sample_project.dirty_fields() == {"summary", "skills_used", "authors", "author_count"}
+
+def test_to_columns_matches_to_dict(sample_project):
+    d = sample_project.to_dict()
+    cols = sample_project.to_columns(["authors", "author_count", "date_created", "portfolio_details", "name"])
+
+    assert cols == {k: d[k] for k in cols}
+
+def test_from_row_decodes_json_fields_on_first_access(sample_project):
+    row = sample_project.to_dict()
+    project = Project.from_row(row)
+
+    assert "authors" not in project.__dict__
+    assert project.author_count == 2
+    assert project.authors == ["Alice", "Bob"]
+    assert "authors" in project.__dict__
+    assert project.hydrate().__dict__["languages"] == ["Python", "R"]
+    assert project == Project.from_dict(row)
@@ -2,6 +2,7 @@ from datetime import datetime
 from unittest.mock import patch, MagicMock
 from src.analyzers.ProjectAnalyzer import ProjectAnalyzer
 from src.analyzers.contribution_analyzer import ContributionStats
+from src.managers.AuthorManager import AuthorManager
 from src.managers.ConfigManager import ConfigManager
 from src.managers.ProjectManager import ProjectManager
 from src.managers.FileHashManager import FileHashManager
@@ -162,6 +163,32 @@ def test_initialize_projects_does_not_duplicate_projects(tmp_path, mock_config_m
     projects = list(analyzer.project_manager.get_all())
     assert len(projects) == 1
 
+def test_initialize_projects_writes_once_per_stage(tmp_path, mock_config_manager):
+    zip_location = tmp_path / "batch.zip"
+    with zipfile.ZipFile(zip_location, 'w') as zf:
+        for i in range(5):
+            zf.writestr(f"project-{i}/file.txt", "content")
+
+    analyzer = ProjectAnalyzer(mock_config_manager, parse_zip_to_project_folders(str(zip_location)), zip_location)
+    analyzer.project_manager = ProjectManager(db_path=str(tmp_path / "projects.db"))
+    analyzer.file_hash_manager = FileHashManager(db_path=str(tmp_path / "files.db"))
+    batches = []
+    set_many = analyzer.project_manager.set_many
+    analyzer.project_manager.set_many = lambda projects: batches.append(len(list(projects))) or set_many(projects)
+
+    def scan(_):
+        return [Project(name=f"project-{i}", file_path=f"/path/{i}", root_folder=f"project-{i}") for i in range(5)]
+
+    with patch.object(analyzer, "ensure_cached_dir", return_value=tmp_path), \
+         patch("src.analyzers.ProjectAnalyzer.RepoProjectBuilder.scan", side_effect=scan), \
+         patch.object(analyzer, "_register_project_files"), \
+         patch.object(analyzer, "_has_project_changed", return_value=False):
+        analyzer.initialize_projects()  # all new
+        analyzer.initialize_projects()  # all existing
+
+    assert batches == [5, 5]
+    assert len(list(analyzer.project_manager.get_all())) == 5
+
 def test_register_project_files_dedupes_across_uploads(tmp_path, mock_config_manager):
     project_a_dir = tmp_path / "project-a"
     project_b_dir = tmp_path / "project-b"
@@ -600,56 +627,18 @@ def test_initialize_projects_refreshes_batch_for_unchanged_project(tmp_path, moc
     assert updated.last_accessed is not None
 
 
-# ── _update_seen_authors ───────────────────────────────────────────────────────
+# ── authors table ──────────────────────────────────────────────────────────────
 
-def test_update_seen_authors_merges_new_authors(analyzer, mock_config_manager):
-    """New email→name pairs are merged in; existing names win on conflict."""
+def test_legacy_seen_authors_are_moved_to_authors_table(mock_config_manager, tmp_path):
+    """A seen_authors dict left in config is imported once and removed from config."""
     mock_config_manager.get.side_effect = lambda key, default=None: (
-        {"alice@example.com": "Alice Existing"} if key == "seen_authors" else default
+        {"alice@example.com": "Alice"} if key == "seen_authors" else default
     )
-    analyzer._update_seen_authors({
-        "alice@example.com": "Alice New",   # conflict — existing name should win
-        "bob@example.com":   "Bob",
-    })
-    call_args = mock_config_manager.set.call_args
-    key, value = call_args[0]
-    assert key == "seen_authors"
-    assert value["alice@example.com"] == "Alice Existing"
-    assert value["bob@example.com"] == "Bob"
-
-
-def test_update_seen_authors_no_op_when_unchanged(analyzer, mock_config_manager):
-    """_update_seen_authors does NOT call set when nothing changed."""
-    existing = {"alice@example.com": "Alice"}
-    mock_config_manager.get.side_effect = lambda key, default=None: (
-        existing if key == "seen_authors" else default
-    )
-    analyzer._update_seen_authors({"alice@example.com": "Alice"})
-    mock_config_manager.set.assert_not_called()
-
-
-# ── rebuild_seen_authors ───────────────────────────────────────────────────────
-
-def test_rebuild_seen_authors_rescans_all_projects(analyzer, mock_config_manager):
-    """rebuild_seen_authors aggregates authors across all projects."""
-    project_a = Project(name="a", file_path="/fake/a")
-    project_b = Project(name="b", file_path="/fake/b")
-
-    with patch.object(analyzer, "_get_projects", return_value=[project_a, project_b]), \
-         patch("pathlib.Path.exists", return_value=True), \
-         patch.object(
-             analyzer.contribution_analyzer,
-             "get_name_map",
-             side_effect=[
-                 {"alice@example.com": "Alice"},
-                 {"bob@example.com": "Bob"},
-             ],
-         ):
-        analyzer.rebuild_seen_authors()
+    with patch("src.analyzers.ProjectAnalyzer.AuthorManager", lambda: AuthorManager(str(tmp_path / "authors.db"))):
+        analyzer = ProjectAnalyzer(config_manager=mock_config_manager, root_folders=[], zip_path=None)
 
-    key, value = mock_config_manager.set.call_args[0]
-    assert key == "seen_authors"
-    assert value == {"alice@example.com": "Alice", "bob@example.com": "Bob"}
+    assert analyzer.author_manager.get_seen_authors() == {"alice@example.com": "Alice"}
+    mock_config_manager.delete.assert_called_once_with("seen_authors")
 
 
 # ── No usernames → contributor not identified ──────────────────────────────────
@@ -2,7 +2,8 @@ import pytest
 import os
 import sqlite3
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+from src.managers.ConnectionPool import get_pool
 from src.managers.ProjectManager import ProjectManager
 from src.models.Project import Project
 
@@ -164,4 +165,295 @@ def test_get_project_groups_partitions_current_and_previous(cleanup_db, sample_p
     grouped = manager.get_project_groups()
 
     assert [p.name for p in grouped["current"]] == ["AnotherProj"]
-    assert [p.name for p in grouped["previous"]] == ["SampleProj"]
\ No newline at end of file
+    assert [p.name for p in grouped["previous"]] == ["SampleProj"]
+
+
+def _count_rows():
+    with sqlite3.connect(DB_PATH) as conn:
+        return conn.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+
+def test_set_many_assigns_ids(cleanup_db, sample_project, another_project):
+    manager = ProjectManager(DB_PATH)
+
+    manager.set_many([sample_project, another_project])
+
+    assert sample_project.id is not None and another_project.id is not None
+    assert sample_project.id != another_project.id
+    assert manager.get(another_project.id).name == "AnotherProj"
+
+def test_unit_of_work_defers_writes_until_exit(cleanup_db, sample_project, another_project):
+    manager = ProjectManager(DB_PATH)
+
+    with manager.unit_of_work():
+        manager.set(sample_project)
+        manager.set(another_project)
+        sample_project.num_files = 42
+        manager.set(sample_project)
+        assert _count_rows() == 0
+        assert sample_project.id is None
+
+    assert _count_rows() == 2
+    assert manager.get(sample_project.id).num_files == 42
+
+def test_unit_of_work_reads_see_buffered_writes(cleanup_db, sample_project, another_project):
+    manager = ProjectManager(DB_PATH)
+
+    with manager.unit_of_work():
+        manager.set(sample_project)
+        manager.set(another_project)
+        assert manager.get_by_name("SampleProj") is not None
+        assert {p.name for p in manager.get_all()} == {"SampleProj", "AnotherProj"}
+
+def test_unit_of_work_lookups_of_buffered_projects_do_not_flush(cleanup_db, sample_project, another_project):
+    manager = ProjectManager(DB_PATH)
+    manager.set(another_project)
+
+    with manager.unit_of_work():
+        stored = manager.get_by_name("AnotherProj")
+        stored.summary = "edited"
+        manager.set(stored)
+        manager.set(sample_project)
+        assert manager.get_by_name("SampleProj") is sample_project
+        assert manager.get_by_name("AnotherProj") is stored
+        assert manager.get(stored.id) is stored
+        assert manager.get_by_name("Missing") is None
+        assert _count_rows() == 1
+
+    assert _count_rows() == 2
+
+def test_unit_of_work_lookup_after_buffered_rename_flushes(cleanup_db, another_project):
+    manager = ProjectManager(DB_PATH)
+    manager.set(another_project)
+
+    with manager.unit_of_work():
+        stored = manager.get_by_name("AnotherProj")
+        stored.name = "RenamedProj"
+        manager.set(stored)
+        assert manager.get_by_name("AnotherProj") is None
+        assert manager.get_by_name("RenamedProj").id == stored.id
+
+        # The flush wrote the rename, so later lookups stay in the buffer
+        stored.summary = "edited"
+        manager.set(stored)
+        assert manager.get_by_name("Missing") is None
+        with sqlite3.connect(DB_PATH) as conn:
+            assert conn.execute("SELECT summary FROM projects").fetchone()[0] != "edited"
+
+def test_unit_of_work_nested_joins_outer(cleanup_db, sample_project):
+    manager = ProjectManager(DB_PATH)
+
+    with manager.unit_of_work():
+        with manager.unit_of_work():
+            manager.set(sample_project)
+        assert _count_rows() == 0
+
+    assert _count_rows() == 1
+
+def test_unit_of_work_flushes_on_error(cleanup_db, sample_project):
+    manager = ProjectManager(DB_PATH)
+
+    with pytest.raises(RuntimeError):
+        with manager.unit_of_work():
+            manager.set(sample_project)
+            raise RuntimeError("analysis failed")
+
+    assert manager.get_by_name("SampleProj") is not None
+
+def test_set_updates_only_changed_columns(cleanup_db, sample_project):
+    manager = ProjectManager(DB_PATH)
+    manager.set(sample_project)
+    loaded = manager.get(sample_project.id)
+
+    # Written behind the loaded project's back; a full-row write would revert it
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.execute("UPDATE projects SET summary = 'external' WHERE id = ?", (loaded.id,))
+
+    loaded.categories = {"code": 3}
+    manager.set(loaded)
+
+    reloaded = manager.get(loaded.id)
+    assert reloaded.categories == {"code": 3}
+    assert reloaded.summary == "external"
+    assert reloaded.authors == ["Alice", "Bob"]
+
+def test_set_detects_in_place_list_changes(cleanup_db, sample_project):
+    manager = ProjectManager(DB_PATH)
+    manager.set(sample_project)
+
+    loaded = manager.get_by_name("SampleProj")
+    loaded.skills_selected.append("Docker")
+    manager.set(loaded)
+
+    assert manager.get(loaded.id).skills_selected == ["Docker"]
+
+def test_set_unchanged_project_writes_nothing(cleanup_db, sample_project):
+    manager = ProjectManager(DB_PATH)
+    manager.set(sample_project)
+
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.execute("UPDATE projects SET summary = 'external' WHERE id = ?", (sample_project.id,))
+
+    manager.set(sample_project)
+
+    assert manager.get(sample_project.id).summary == "external"
+
+def test_set_reinserts_deleted_row(cleanup_db, sample_project):
+    manager = ProjectManager(DB_PATH)
+    manager.set(sample_project)
+    manager.delete(sample_project.id)
+
+    sample_project.summary = "back"
+    manager.set(sample_project)
+
+    assert manager.get(sample_project.id).summary == "back"
+
+def test_get_all_with_columns_reads_only_those(cleanup_db, sample_project, another_project):
+    manager = ProjectManager(DB_PATH)
+    manager.set_many([sample_project, another_project])
+
+    projects = {p.name: p for p in manager.get_all(columns=["name"])}
+
+    assert projects["SampleProj"].id == sample_project.id
+    assert projects["SampleProj"].authors == []
+    assert projects["SampleProj"].file_path == ""
+
+    with pytest.raises(ValueError):
+        list(manager.get_all(columns=["name; DROP TABLE projects"]))
+
+def test_projected_project_save_keeps_unloaded_columns(cleanup_db, sample_project):
+    manager = ProjectManager(DB_PATH)
+    manager.set(sample_project)
+
+    summary = next(manager.get_summaries())
+    summary.resume_score = 12.5
+    manager.set(summary)
+
+    reloaded = manager.get(sample_project.id)
+    assert reloaded.resume_score == 12.5
+    assert reloaded.authors == ["Alice", "Bob"]
+    assert reloaded.file_path == "/proj/path/main.py"
+
+def test_get_project_groups_with_columns(cleanup_db, sample_project, another_project):
+    manager = ProjectManager(DB_PATH)
+    sample_project.import_batch_id = "batch-old"
+    another_project.import_batch_id = "batch-new"
+    manager.set(sample_project)
+    manager.set(another_project)
+
+    grouped = manager.get_project_groups(columns=["name"])
+
+    assert [p.name for p in grouped["current"]] == ["AnotherProj"]
+    assert [p.name for p in grouped["previous"]] == ["SampleProj"]
+
+
+def _skill_projects(manager):
+    for name, skills in [("P1", ["Python", "SQL", "Python"]), ("P2", ["SQL", "C#"]), ("P3", [None, "  Python  "])]:
+        manager.set(Project(name=name, file_path=f"/{name}", skills_used=skills))
+
+
+def test_skill_counts_and_usage_from_value_tables(cleanup_db):
+    manager = ProjectManager(DB_PATH)
+    _skill_projects(manager)
+
+    assert manager.get_skill_counts() == {"Python": 3, "SQL": 2, "C#": 1}
+    assert manager.get_skill_usage() == {"C#": ["P2"], "Python": ["P1", "P3"], "SQL": ["P1", "P2"]}
+
+def test_value_tables_follow_updates_and_deletes(cleanup_db, sample_project):
+    manager = ProjectManager(DB_PATH)
+    sample_project.language_share = {"Python": 75.0, "R": 25.0}
+    manager.set(sample_project)
+
+    loaded = manager.get(sample_project.id)
+    loaded.skills_used = ["Go"]
+    loaded.frameworks.append("Gin")
+    manager.set(loaded)
+
+    assert manager.get_skill_counts() == {"Go": 1}
+    assert manager.get_framework_counts() == {"PyTorch": 1, "Gin": 1}
+    assert manager.get_language_rollup() == {
+        "Python": {"project_count": 1, "avg_share": 75.0},
+        "R": {"project_count": 1, "avg_share": 25.0},
+    }
+
+    manager.delete(sample_project.id)
+    assert manager.get_skill_counts() == {}
+    assert manager.get_language_rollup() == {}
+
+def test_value_tables_backfilled_for_existing_database(cleanup_db):
+    # A database written before value tables (and schema versions) existed
+    get_pool(DB_PATH).close_all()
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.execute(
+            "CREATE TABLE projects (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE, "
+            "file_path TEXT NOT NULL, languages TEXT, language_share TEXT, frameworks TEXT, skills_used TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO projects (name, file_path, frameworks, skills_used) VALUES (?, ?, ?, ?)",
+            ("Legacy", "/legacy", '["PyTorch"]', '["ML", "Data Analysis"]'),
+        )
+
+    manager = ProjectManager(DB_PATH)
+
+    assert manager.get_skill_counts() == {"ML": 1, "Data Analysis": 1}
+    assert manager.get_framework_counts() == {"PyTorch": 1}
+
+
+def _scored(name, base_score, last_modified):
+    return Project(name=name, file_path=f"/{name}", base_score=base_score, resume_score=base_score,
+                   last_modified=last_modified)
+
+
+def test_get_ranked_adds_recency_at_query_time(cleanup_db):
+    manager = ProjectManager(DB_PATH)
+    now = datetime(2025, 6, 1)
+    manager.set_many([
+        _scored("old", 45.0, datetime(2020, 1, 1)),             # 45 + 0
+        _scored("recent", 40.0, datetime(2025, 6, 1)),          # 40 + 10
+        _scored("aging", 42.0, datetime(2024, 6, 20)),          # 42 + 7 (346 days)
+        Project(name="unscored", file_path="/unscored"),
+    ])
+
+    ranked = manager.get_ranked(now=now)
+
+    assert [p.name for p in ranked] == ["recent", "aging", "old"]
+    assert [p.resume_score for p in ranked] == pytest.approx([50.0, 42 + 10 - 346 / 109.5, 45.0])
+    # Two years later the old project comes first
+    assert manager.get_ranked(now=datetime(2027, 6, 1))[0].name == "old"
+
+def test_get_ranked_limit_matches_full_ranking(cleanup_db):
+    manager = ProjectManager(DB_PATH)
+    now = datetime(2025, 6, 1)
+    manager.set_many(
+        _scored(f"p{i}", float(i % 17) * 3, datetime(2025, 6, 1) - timedelta(days=37 * i)) for i in range(60)
+    )
+
+    full = [p.name for p in manager.get_ranked(now=now)]
+
+    for limit in (1, 5, 20, 100):
+        assert [p.name for p in manager.get_ranked(limit=limit, now=now, columns=("name",))] == full[:limit]
+
+def test_base_scores_backfilled_for_existing_database(cleanup_db):
+    # Scored before base_score existed, with recency included in resume_score
+    get_pool(DB_PATH).close_all()
+    with sqlite3.connect(DB_PATH) as conn:
+        conn.execute(
+            "CREATE TABLE projects (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL UNIQUE, "
+            "file_path TEXT NOT NULL, collaboration_status TEXT, total_loc INTEGER, comment_ratio REAL, "
+            "test_file_ratio REAL, testing_discipline_score REAL, documentation_habits_score REAL, "
+            "modularity_score REAL, language_depth_score REAL, resume_score REAL, last_modified TEXT, "
+            "languages TEXT, language_share TEXT, frameworks TEXT, skills_used TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO projects (name, file_path, collaboration_status, total_loc, resume_score, last_modified) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            ("Legacy", "/legacy", "collaborative", 1000, 36.0, "2025-06-01T00:00:00"),
+        )
+        conn.execute("INSERT INTO projects (name, file_path, resume_score) VALUES ('Unscored', '/unscored', 0)")
+
+    manager = ProjectManager(DB_PATH)
+
+    [ranked] = manager.get_ranked(now=datetime(2025, 6, 1), columns=("name", "base_score"))
+    assert ranked.name == "Legacy"
+    assert ranked.base_score == pytest.approx(25.0)  # log10(1000) * 5 + 10
+    assert ranked.resume_score == pytest.approx(35.0)
@@ -74,3 +74,20 @@ def test_ranker_handles_edge_cases(base_project):
     # LOC score should be 0, recency score should be 0.
     # Expected = 30 (quality) + 0 (LOC) + 10 (collab) + 0 (recency) + 10 (ratios) = 50
     assert score == pytest.approx(50, abs=1)
+
+def test_base_score_leaves_out_recency(base_project):
+    """
+    Tests that the stored base score is the resume score without recency,
+    which is added back from the modification date at any later time.
+    """
+    now = datetime(2025, 6, 1)
+    base_project.last_modified = now - timedelta(days=219)
+    ranker = ProjectRanker(base_project)
+
+    score = ranker.calculate_resume_score()
+
+    # 219 days = 2 recency points lost
+    assert base_project.base_score == pytest.approx(score - ProjectRanker.recency_score(base_project.last_modified), abs=1e-9)
+    assert ProjectRanker.recency_score(base_project.last_modified, now) == pytest.approx(8)
+    assert ProjectRanker.recency_score(now + timedelta(days=30), now) == 10
+    assert ProjectRanker.recency_score(now - timedelta(days=4 * 365), now) == 0
@@ -0,0 +1,77 @@
+from pathlib import Path
+import sys
+
+# Ensure src/ is on sys.path (same pattern as your other tests)
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from analyzers import python_stats  # type: ignore
+from analyzers.python_stats import (  # type: ignore
+    collect_python_stats,
+    content_hash,
+    python_stats_for,
+)
+
+
+SAMPLE = '''"""Module docstring."""
+import asyncio
+
+
+class Greeter:
+    """Says hello."""
+
+    def greet(self, name: str) -> str:
+        """Return a greeting."""
+        with open("log.txt", "a") as fh:
+            fh.write(name)
+        return f"hello {name}"
+
+
+async def main(*names: str, **opts) -> None:
+    async with asyncio.timeout(1):
+        pass
+
+
+def helper(x, y=1):
+    return x + y
+'''
+
+
+def test_collect_python_stats_counts_structure():
+    stats = collect_python_stats(SAMPLE)
+
+    assert stats == {
+        "defs": 3,
+        "async_defs": 1,
+        "classes": 1,
+        "with_blocks": 2,
+        "doc_quotes": 3,
+        "type_arrows": 2,
+        "type_params": 2,
+    }
+
+
+def test_collect_python_stats_returns_zeros_on_syntax_error():
+    stats = collect_python_stats("def broken(:\n    pass\n")
+
+    assert set(stats) == set(python_stats.PYTHON_STAT_KEYS)
+    assert all(value == 0 for value in stats.values())
+
+
+def test_python_stats_for_reuses_cached_result(monkeypatch):
+    python_stats.clear_cache()
+    digest = content_hash(SAMPLE.encode("utf-8"))
+    first = python_stats_for(SAMPLE, digest)
+
+    def fail(_source):
+        raise AssertionError("cache miss: source was parsed again")
+
+    monkeypatch.setattr(python_stats, "collect_python_stats", fail)
+    second = python_stats_for(SAMPLE, digest)
+
+    assert second == first
+    # Callers get copies, so mutating a result does not poison the cache
+    second["defs"] = 99
+    assert python_stats_for(SAMPLE, digest)["defs"] == 3
@@ -0,0 +1,57 @@
+from pathlib import Path
+import sys
+import zipfile
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.ZipParser import parse_zip_to_project_folders
+from src.analyzers.quick_preview import estimate_project_folder, estimate_zip_projects
+
+
+def _make_zip(tmp_path: Path, entries: dict) -> Path:
+    zip_path = tmp_path / "upload.zip"
+    with zipfile.ZipFile(zip_path, "w") as z:
+        for name, size in entries.items():
+            z.writestr(name, "x" * size)
+    return zip_path
+
+
+def test_estimate_counts_bytes_and_weights_languages_by_size(tmp_path):
+    zip_path = _make_zip(tmp_path, {
+        "proj/main.py": 300,
+        "proj/tests/test_main.py": 100,
+        "proj/web/app.js": 100,
+        "proj/README.md": 50,
+        "proj/.env": 50,
+    })
+    [root] = parse_zip_to_project_folders(str(zip_path))
+
+    result = estimate_project_folder(root)
+
+    assert result["name"] == "proj"
+    assert result["file_count"] == 5
+    assert result["total_bytes"] == 600
+    assert result["categories"]["test"] == 1
+    assert result["categories"]["docs"] == 1
+    # Languages are detected from the paths, so source files count as code
+    assert result["categories"]["code"] == 2
+    assert sum(result["categories"].values()) == 5
+    # .env and README.md carry no language; share is by uncompressed bytes
+    assert result["language_share"] == {"Python": 80.0, "JavaScript": 20.0}
+    assert list(result["language_share"]) == ["Python", "JavaScript"]
+
+
+def test_estimate_zip_projects_returns_one_entry_per_root(tmp_path):
+    zip_path = _make_zip(tmp_path, {
+        "a/one.py": 10,
+        "b/README.md": 10,
+    })
+    results = estimate_zip_projects(parse_zip_to_project_folders(str(zip_path)))
+
+    by_name = {r["name"]: r for r in results}
+    assert set(by_name) == {"a", "b"}
+    assert by_name["a"]["language_share"] == {"Python": 100.0}
+    assert by_name["b"]["language_share"] == {}
+    assert by_name["b"]["file_count"] == 1
@@ -54,3 +54,19 @@ def test_repo_finder_handles_no_repos(tmp_path: Path):
 
     # Assert
     assert len(repo_paths) == 0
+
+def test_repo_finder_skips_macosx_metadata(tmp_path: Path):
+    """
+    Verifies that __MACOSX archive metadata is never searched for repositories.
+    """
+    # Arrange
+    (tmp_path / "__MACOSX" / "project" / ".git").mkdir(parents=True)
+    real_repo = tmp_path / "project"
+    (real_repo / ".git").mkdir(parents=True)
+
+    # Act
+    finder = RepoFinder()
+    repo_paths = finder.find_repos(tmp_path)
+
+    # Assert
+    assert repo_paths == [real_repo]
@@ -20,7 +20,7 @@ def mock_storage(monkeypatch):
 @pytest.fixture
 def mock_project_manager(monkeypatch):
     mock = MagicMock()
-    monkeypatch.setattr("src.managers.ReportManager.ReportProjectManager", lambda: mock)
+    monkeypatch.setattr("src.managers.ReportManager.ReportProjectManager", lambda db_path=None: mock)
     return mock
 
 
@@ -199,10 +199,10 @@ def test_list_reports(rm, mock_project_manager, monkeypatch):
         ])
     )
 
-    mock_project_manager.get_all_for_report.side_effect = [
-        [make_project("A")],
-        [make_project("B"), make_project("C")]
-    ]
+    mock_project_manager.get_all_by_report.return_value = {
+        1: [make_project("A")],
+        2: [make_project("B"), make_project("C")],
+    }
 
     reports = rm.list_reports()
 
@@ -210,6 +210,26 @@ def test_list_reports(rm, mock_project_manager, monkeypatch):
     assert len(reports[0].projects) == 1
     assert len(reports[1].projects) == 2
     assert reports[1].projects[0].portfolio_details.project_name == "B"
+    # Projects are bulk loaded, not queried per report
+    mock_project_manager.get_all_by_report.assert_called_once()
+    mock_project_manager.get_all_for_report.assert_not_called()
+
+
+def test_list_reports_without_projects(rm, mock_project_manager, monkeypatch):
+    now = datetime.now().isoformat()
+
+    monkeypatch.setattr(
+        "src.managers.ReportManager.StorageManager.get_all",
+        MagicMock(return_value=[
+            {"id": 1, "title": "R1", "date_created": now, "sort_by": "resume_score", "notes": None, "public_token": "r1"},
+        ])
+    )
+
+    reports = rm.list_reports(include_projects=False)
+
+    assert reports[0].public_token == "r1"
+    assert reports[0].projects == []
+    mock_project_manager.get_all_by_report.assert_not_called()
 
 
 def test_list_reports_summary(rm):
@@ -244,3 +264,78 @@ def test_get_all_generator(rm):
     assert len(results) == 2
     assert results[0].id == 1
     assert results[1].id == 2
+
+
+@pytest.fixture
+def db_rm(tmp_path, monkeypatch):
+    # The default databases are opened in the working directory
+    from src.managers.ConnectionPool import get_pool
+
+    monkeypatch.chdir(tmp_path)
+    yield ReportManager()
+    get_pool("reports.db").close_all()
+
+
+def _stored_project_ids(rm, report_id):
+    with rm._get_connection() as conn:
+        rows = conn.execute(
+            "SELECT project_name, id FROM report_projects WHERE report_id = ? ORDER BY id", (report_id,)
+        ).fetchall()
+    return dict(rows)
+
+
+def test_update_report_writes_only_changed_projects(db_rm):
+    rid = db_rm.create_report(make_report(projects=[make_project("A"), make_project("B"), make_project("C")]))
+    ids_before = _stored_project_ids(db_rm, rid)
+
+    report = db_rm.get_report(rid)
+    next(p for p in report.projects if p.project_name == "B").bullets = ["Renamed bullet"]
+    version = db_rm.report_project_manager.content_version()
+    assert db_rm.update_report(report) is True
+
+    assert db_rm.report_project_manager.content_version() == version + 1
+    assert _stored_project_ids(db_rm, rid) == ids_before
+    reloaded = db_rm.get_report(rid)
+    assert next(p for p in reloaded.projects if p.project_name == "B").bullets == ["Renamed bullet"]
+
+    # Report-only edits leave report_projects alone
+    reloaded.portfolio_mode = "public"
+    db_rm.update_report(reloaded)
+    assert db_rm.report_project_manager.content_version() == version + 1
+    assert db_rm.get_report(rid).portfolio_mode == "public"
+
+
+def test_update_report_inserts_and_deletes_projects(db_rm):
+    rid = db_rm.create_report(make_report(projects=[make_project("A"), make_project("B")]))
+
+    report = db_rm.get_report(rid)
+    report.remove_project("A")
+    report.add_project(make_project("D"))
+    db_rm.update_report(report)
+
+    assert sorted(p.project_name for p in db_rm.get_report(rid).projects) == ["B", "D"]
+
+
+def test_update_report_rename_keeps_project_order(db_rm):
+    rid = db_rm.create_report(make_report(projects=[make_project("A"), make_project("B"), make_project("C")]))
+    ids_before = list(_stored_project_ids(db_rm, rid).values())
+
+    report = db_rm.get_report(rid)
+    report.projects[0].project_name = "A2"
+    version = db_rm.report_project_manager.content_version()
+    db_rm.update_report(report)
+
+    assert [p.project_name for p in db_rm.get_report(rid).projects] == ["A2", "B", "C"]
+    assert list(_stored_project_ids(db_rm, rid).values()) == ids_before
+    assert db_rm.report_project_manager.content_version() == version + 1
+
+
+def test_update_report_restores_deleted_row(db_rm):
+    rid = db_rm.create_report(make_report(projects=[make_project("A")]))
+    report = db_rm.get_report(rid)
+    db_rm.delete_report(rid)
+
+    assert db_rm.update_report(report) is True
+
+    restored = db_rm.get_report(rid)
+    assert [p.project_name for p in restored.projects] == ["A"]
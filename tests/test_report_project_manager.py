@@ -113,6 +113,40 @@ def test_get_all_for_report(rpm, monkeypatch):
     assert projects[1].project_name == "B"
 
 
+
+def test_get_all_by_report_groups_rows(rpm, monkeypatch):
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+
+    rows = [
+        (1, 10, "A", 1.0, "[]", "sum", "{}", "[]", "{}", "[]", None, None, "individual"),
+        (2, 10, "B", 2.0, "[]", "sum2", "{}", "[]", "{}", "[]", None, None, "team"),
+        (3, 11, "C", 3.0, "[]", "sum3", "{}", "[]", "{}", "[]", None, None, "team"),
+    ]
+
+    mock_cursor.fetchall.return_value = rows
+    mock_conn.cursor.return_value = mock_cursor
+    rpm._get_connection.return_value.__enter__.return_value = mock_conn
+
+    monkeypatch.setattr(
+        rpm.__class__,
+        "columns_list",
+        property(lambda self: rpm.columns.split(", "))
+    )
+
+    grouped = rpm.get_all_by_report([10, 11])
+
+    assert [p.project_name for p in grouped[10]] == ["A", "B"]
+    assert [p.project_name for p in grouped[11]] == ["C"]
+    query, params = mock_cursor.execute.call_args[0]
+    assert "report_id IN (?, ?)" in query
+    assert params == [10, 11]
+
+
+def test_get_all_by_report_empty_ids_skips_query(rpm):
+    assert rpm.get_all_by_report([]) == {}
+    rpm._get_connection.assert_not_called()
+
 def test_delete_by_name(rpm):
     mock_conn = MagicMock()
     mock_cursor = MagicMock()
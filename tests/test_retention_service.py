@@ -0,0 +1,137 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.managers.ConnectionPool import get_pool
+from src.managers.ImportBatchManager import ImportBatchManager
+from src.managers.ProjectManager import ProjectManager
+from src.models.Project import Project
+from src.services import retention_service
+from src.services.retention_service import RetentionPolicy, apply_retention
+
+NOW = datetime(2025, 6, 1, 12, 0)
+
+
+@pytest.fixture
+def batches(tmp_path):
+    path = str(tmp_path / "projects.db")
+    yield ImportBatchManager(path)
+    get_pool(path).close_all()
+
+
+def _workspace(tmp_path, name, size=1000):
+    workspace = tmp_path / name
+    (workspace / "repo").mkdir(parents=True)
+    (workspace / "repo" / "file.txt").write_bytes(b"x" * size)
+    return workspace
+
+
+def test_expires_workspaces_beyond_newest_batches(tmp_path, batches):
+    workspaces = [_workspace(tmp_path, f"ws{i}") for i in range(4)]
+    for i, workspace in enumerate(workspaces):
+        batches.record(f"batch{i}", str(workspace), created_at=NOW - timedelta(hours=4 - i))
+
+    report = apply_retention(
+        RetentionPolicy(keep_batches=2, max_age_days=None, artifact_dirs=()), batches, databases=[], now=NOW
+    )
+
+    assert report["workspaces"] == 2
+    assert report["workspace_bytes"] == 2000
+    assert [w.exists() for w in workspaces] == [False, False, True, True]
+    # Expired batches are not reported again
+    assert batches.get_expirable(2, None, NOW) == []
+
+
+def test_keeps_workspaces_that_projects_still_point_into(tmp_path, batches):
+    referenced, superseded = _workspace(tmp_path, "referenced"), _workspace(tmp_path, "superseded")
+    batches.record("referenced", str(referenced), created_at=NOW - timedelta(days=60))
+    batches.record("superseded", str(superseded), created_at=NOW - timedelta(days=50))
+    pm = ProjectManager(batches.db_path)
+    pm.set(Project(name="repo", file_path=str(referenced / "repo")))
+    # Shares a name prefix with the superseded workspace without being inside it
+    pm.set(Project(name="other", file_path=str(superseded) + "-other/repo"))
+
+    report = apply_retention(
+        RetentionPolicy(keep_batches=0, max_age_days=30, artifact_dirs=()), batches, databases=[], now=NOW
+    )
+
+    assert report["workspaces"] == 1
+    assert referenced.exists() and not superseded.exists()
+    # Expirable once the project is re-imported elsewhere
+    pm.set(Project(name="repo", file_path=str(tmp_path / "new" / "repo")))
+    assert [b["batch_id"] for b in batches.get_expirable(0, 30, NOW)] == ["referenced"]
+
+
+def test_expires_old_workspaces_and_exports(tmp_path, batches, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    old, recent = _workspace(tmp_path, "old"), _workspace(tmp_path, "recent")
+    batches.record("old", str(old), created_at=NOW - timedelta(days=40))
+    batches.record("recent", str(recent), created_at=NOW - timedelta(days=1))
+    (tmp_path / "resumes").mkdir()
+    stale, fresh = tmp_path / "resumes" / "a-old.pdf", tmp_path / "resumes" / "b-new.pdf"
+    stale.write_bytes(b"x" * 300)
+    fresh.write_bytes(b"x" * 300)
+    old_time = (NOW - timedelta(days=31)).timestamp()
+    os.utime(stale, (old_time, old_time))
+    os.utime(fresh, (NOW.timestamp(), NOW.timestamp()))
+
+    # Exports are kept unless their directory is opted in
+    report = apply_retention(RetentionPolicy(keep_batches=None, max_age_days=30), batches, databases=[], now=NOW)
+
+    assert report["workspaces"] == 1 and not old.exists() and recent.exists()
+    assert report["artifacts"] == 0 and stale.exists()
+
+    policy = RetentionPolicy(keep_batches=None, max_age_days=30, artifact_dirs=("resumes",))
+    report = apply_retention(policy, batches, databases=[], now=NOW)
+
+    assert report["artifacts"] == 1 and report["artifact_bytes"] == 300
+    assert not stale.exists() and fresh.exists()
+
+
+def test_reclaims_database_space_incrementally(tmp_path, batches):
+    pm = ProjectManager(batches.db_path)
+    pm.set_many([Project(name=f"p{i}", file_path="/x", summary="s" * 2000) for i in range(200)])
+    pm.clear()
+
+    first = batches.reclaim(max_pages=10)
+    rest = batches.reclaim(max_pages=100000)
+
+    assert first == 10 * 4096
+    assert rest > 0
+    assert batches.reclaim() == 0
+
+
+def test_reclaim_switches_existing_databases_to_incremental_vacuum(tmp_path):
+    # Written before incremental vacuuming was enabled for new files
+    path = str(tmp_path / "legacy.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE filler (data TEXT)")
+    batches = ImportBatchManager(path)
+    try:
+        pm = ProjectManager(path)
+        pm.set_many([Project(name=f"p{i}", file_path="/x", summary="s" * 2000) for i in range(200)])
+        pm.clear()
+
+        assert batches.reclaim() > 0  # full rebuild
+        with batches._get_connection() as conn:
+            assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+        pm.set_many([Project(name=f"p{i}", file_path="/x", summary="s" * 2000) for i in range(200)])
+        pm.clear()
+        assert batches.reclaim(max_pages=10) == 10 * 4096
+    finally:
+        get_pool(path).close_all()
+
+
+def test_background_runs_are_throttled(monkeypatch):
+    calls = []
+    monkeypatch.setattr(retention_service, "_last_run", None)
+    monkeypatch.setattr(retention_service, "apply_retention", lambda policy, now: calls.append(now) or {
+        "workspaces": 0, "artifacts": 0, "workspace_bytes": 0, "artifact_bytes": 0, "database_bytes": 0,
+    })
+
+    assert retention_service.maybe_apply_retention() is not None
+    assert retention_service.maybe_apply_retention() is None
+    assert len(calls) == 1
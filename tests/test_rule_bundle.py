@@ -0,0 +1,92 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+import src.rule_bundle as rule_bundle
+from src.FileCategorizer import FileCategorizer
+from src.analyzers.contribution_analyzer import RoleSignals
+from src.rule_bundle import (
+    CONFIG_DIR,
+    RULE_FILES,
+    compile_role_rules,
+    get_rule_bundle,
+    load_rule_bundle,
+)
+
+
+@pytest.fixture
+def config_copy(tmp_path):
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    for name in RULE_FILES:
+        shutil.copy(CONFIG_DIR / name, config_dir / name)
+    return config_dir
+
+
+def test_bundle_is_loaded_once_and_shared():
+    assert get_rule_bundle() is get_rule_bundle()
+    a, b = FileCategorizer(), FileCategorizer()
+    assert a.rules is b.rules
+    assert RoleSignals()._path_patterns is RoleSignals()._path_patterns
+
+
+def test_compiled_tables_are_read_only():
+    rules = get_rule_bundle().categories
+    with pytest.raises(TypeError):
+        rules.ext_to_category["py"] = "docs"
+    with pytest.raises(AttributeError):
+        rules.path_patterns.append(("x", ("y",)))
+
+
+def test_disk_cache_skips_yaml_parsing(config_copy, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    first = load_rule_bundle(config_copy, cache_dir)
+    assert len(list(cache_dir.glob("rules-*.pickle"))) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML should come from the disk cache")
+    monkeypatch.setattr(rule_bundle.yaml, "safe_load", fail)
+
+    second = load_rule_bundle(config_copy, cache_dir)
+    assert second.fingerprint == first.fingerprint
+    assert dict(second.categories.ext_to_category) == dict(first.categories.ext_to_category)
+    assert second.roles.path_patterns == first.roles.path_patterns
+
+
+def test_changed_yaml_changes_fingerprint(config_copy, tmp_path):
+    cache_dir = tmp_path / "cache"
+    before = load_rule_bundle(config_copy, cache_dir)
+
+    roles_file = config_copy / "role_signals.yml"
+    roles_file.write_text(
+        roles_file.read_text(encoding="utf-8")
+        + '\n  data:\n    path_patterns: ["notebooks"]\n',
+        encoding="utf-8",
+    )
+    after = load_rule_bundle(config_copy, cache_dir)
+
+    assert after.fingerprint != before.fingerprint
+    assert ("notebooks", "data") in after.roles.path_patterns
+    assert len(list(cache_dir.glob("rules-*.pickle"))) == 2
+
+
+def test_corrupt_cache_falls_back_to_yaml(config_copy, tmp_path):
+    cache_dir = tmp_path / "cache"
+    bundle = load_rule_bundle(config_copy, cache_dir)
+    [cache_file] = cache_dir.glob("rules-*.pickle")
+    cache_file.write_bytes(b"not a pickle")
+
+    reloaded = load_rule_bundle(config_copy, cache_dir)
+    assert dict(reloaded.categories.language_map) == dict(bundle.categories.language_map)
+
+
+def test_role_signals_accepts_explicit_rules():
+    rules = compile_role_rules({
+        "backend": {"languages": ["Python"], "path_patterns": ["api"]},
+        "qa": {"categories": ["test"]},
+    })
+    signals = RoleSignals(rules)
+    assert signals.infer_role_bucket("api/views.py", "Python", "code") == "backend"
+    assert signals.infer_role_bucket("tests/test_x.py", "", "test") == "qa"
+    assert signals.infer_role_bucket("README.md", "", "docs") == "none"
@@ -166,3 +166,57 @@ def test_tech_profile_detects_dockerfile(tmp_path: Path) -> None:
     tech = result["tech_profile"]
 
     assert tech["has_dockerfile"] is True
+
+
+def test_python_stats_include_ast_counters(tmp_path: Path) -> None:
+    """
+    stats["python"] carries the AST counters ProficiencyEstimator reads,
+    summed over all Python files.
+    """
+    _write_file(
+        tmp_path / "src" / "app.py",
+        '"""App module."""\n'
+        "class App:\n"
+        "    async def run(self, n: int) -> int:\n"
+        "        with open('x') as fh:\n"
+        "            return n\n",
+    )
+    _write_file(
+        tmp_path / "tests" / "test_app.py",
+        "def test_run() -> None:\n"
+        "    assert True\n",
+    )
+
+    result = SkillAnalyzer(tmp_path).analyze()
+    py = result["stats"]["python"]
+
+    assert py["files"] == 2
+    assert py["test_files"] == 1
+    assert py["lines"] == 7
+    assert py["defs"] == 2
+    assert py["async_defs"] == 1
+    assert py["classes"] == 1
+    assert py["with_blocks"] == 1
+    assert py["doc_quotes"] == 1
+    assert py["type_arrows"] == 2
+    assert py["type_params"] == 1
+
+
+def test_dependency_evidence_uses_parsed_manifests(tmp_path: Path) -> None:
+    """
+    Dependency evidence comes from declared dependencies, and the tech
+    profile lists dependency names rather than regex sources.
+    """
+    _write_file(
+        tmp_path / "package.json",
+        '{"name": "web", "dependencies": {"react-dom": "18", "vite": "5"}}',
+    )
+    _write_file(tmp_path / "requirements.txt", "flask==3.0\n")
+
+    result = SkillAnalyzer(tmp_path).analyze()
+    skill_names = {s.skill for s in result["skills"]}
+    tech = result["tech_profile"]
+
+    assert {"React", "Vite", "Flask"} <= skill_names
+    assert tech["dependencies_list"] == ["flask", "react-dom", "vite"]
+    assert tech["dependency_files_list"] == ["package.json", "requirements.txt"]
@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+from src.managers.ConfigManager import ConfigManager
+from src.managers.ConnectionPool import get_pool
+from src.managers.FileHashManager import FileHashManager
+from src.managers.ProjectManager import ProjectManager
+from src.managers.ReportManager import ReportManager
+from src.managers.ReportProjectManager import ReportProjectManager
+from src.models.Project import Project
+from src.models.Report import Report
+from src.models.ReportProject import ReportProject
+from src.services.transfer_service import AnalysisStore, export_ndjson, import_ndjson
+
+
+def _store(directory):
+    directory.mkdir()
+    paths = [str(directory / name) for name in ("config.db", "projects.db", "reports.db")]
+    store = AnalysisStore(
+        configs=ConfigManager(paths[0]),
+        projects=ProjectManager(paths[1]),
+        file_hashes=FileHashManager(paths[1]),
+        reports=ReportManager(paths[2]),
+        report_projects=ReportProjectManager(paths[2]),
+    )
+    return store, paths
+
+
+@pytest.fixture
+def stores(tmp_path):
+    source, source_paths = _store(tmp_path / "source")
+    target, target_paths = _store(tmp_path / "target")
+    yield source, target
+    for path in [*source_paths, *target_paths]:
+        get_pool(path).close_all()
+
+
+def _fill(store):
+    store.configs.set("selected_users", ["alice@example.com"])
+    store.configs.set("user_consent", True)
+    store.projects.set_many([
+        Project(name="alpha", file_path="/a", skills_used=["Python", "SQL"], languages=["Python"]),
+        Project(name="beta", file_path="/b", skills_used=["Go"]),
+    ])
+    store.file_hashes.register_project_hashes("alpha", [("h1", "/a/x"), ("h2", "/a/y")])
+    report = Report(title="Resume", projects=[ReportProject(project_name="alpha", bullets=["Built it"])])
+    report_id = store.reports.create_report(report)
+    store.report_projects.set_from_report_project(report_id, ReportProject(project_name="beta"))
+
+
+def test_round_trip_moves_every_table(stores):
+    source, target = stores
+    _fill(source)
+
+    counts = import_ndjson(export_ndjson(source), target, batch_size=1)
+
+    assert counts == {
+        "configs": 1, "projects": 2, "file_hashes": 2, "project_file_hashes": 2,
+        "reports": 1, "report_projects": 2, "skipped": 0,
+    }
+    assert target.configs.get("selected_users") == ["alice@example.com"]
+    assert target.configs.get("user_consent") is None
+    alpha = target.projects.get_by_name("alpha")
+    assert alpha.skills_used == ["Python", "SQL"]
+    assert target.projects.get_skill_counts() == {"Python": 1, "SQL": 1, "Go": 1}
+    assert target.file_hashes.get_project_hashes("alpha") == ["h1", "h2"]
+    [report] = target.reports.list_reports()
+    assert report.title == "Resume"
+    assert sorted(p.project_name for p in report.projects) == ["alpha", "beta"]
+
+
+def test_reimport_upserts_projects_by_name(stores):
+    source, target = stores
+    _fill(source)
+    target.projects.set(Project(name="alpha", file_path="/old", skills_used=["Rust"]))
+    existing_id = target.projects.get_by_name("alpha").id
+
+    import_ndjson(export_ndjson(source), target)
+
+    alpha = target.projects.get_by_name("alpha")
+    assert alpha.id == existing_id
+    assert alpha.file_path == "/a"
+    assert target.projects.get_skill_counts() == {"Python": 1, "SQL": 1, "Go": 1}
+    assert len(list(target.projects.get_all())) == 2
+
+
+def test_reports_with_a_known_public_token_are_skipped(stores):
+    source, target = stores
+    _fill(source)
+    with source.reports._get_connection() as conn:
+        conn.execute("UPDATE reports SET portfolio_mode = 'public', public_token = 'tok'")
+    lines = list(export_ndjson(source))
+
+    import_ndjson(lines, target)
+    counts = import_ndjson(lines, target)
+
+    assert counts["reports"] == 0
+    assert counts["skipped"] == 1 + 2  # the report and its projects
+    assert len(target.reports.list_reports()) == 1
+
+
+def test_reimport_skips_private_reports_already_present(stores):
+    source, target = stores
+    _fill(source)
+    lines = list(export_ndjson(source))
+
+    import_ndjson(lines, target)
+    counts = import_ndjson(lines, target)
+
+    assert counts["reports"] == counts["report_projects"] == 0
+    assert counts["skipped"] == 1 + 2
+    [report] = target.reports.list_reports()
+    assert sorted(p.project_name for p in report.projects) == ["alpha", "beta"]
+
+
+def test_rejects_streams_that_are_not_exports(stores):
+    _, target = stores
+    with pytest.raises(ValueError, match="Line 1: not an analysis-store export"):
+        import_ndjson([json.dumps({"table": "projects", "row": {}})], target)
+
+    header = json.dumps({"format": "analysis-store", "version": 1})
+    with pytest.raises(ValueError, match="Line 2: expected a row"):
+        import_ndjson([header, json.dumps({"table": "secrets", "row": {}})], target)
+    with pytest.raises(ValueError, match="Line 2: could not import projects rows"):
+        import_ndjson([header, json.dumps({"table": "projects", "row": {"name": "no path"}})], target)
@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+
+from utils.tree_walk import walk_tree
+
+
+def test_walk_tree_yields_dirs_and_files_top_down(tmp_path: Path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "deep.txt").touch()
+    (tmp_path / "top.txt").touch()
+
+    seen = {
+        Path(root).relative_to(tmp_path).as_posix(): (
+            sorted(d.name for d in dirs),
+            sorted(f.name for f in files),
+        )
+        for root, dirs, files in walk_tree(tmp_path)
+    }
+
+    assert seen == {
+        ".": (["a"], ["top.txt"]),
+        "a": (["b"], []),
+        "a/b": ([], ["deep.txt"]),
+    }
+
+
+def test_walk_tree_prunes_removed_dirs(tmp_path: Path):
+    (tmp_path / "keep").mkdir()
+    (tmp_path / "skip" / "inner").mkdir(parents=True)
+
+    visited = []
+    for root, dirs, _ in walk_tree(tmp_path):
+        visited.append(Path(root).name)
+        dirs[:] = [d for d in dirs if d.name != "skip"]
+
+    assert "keep" in visited
+    assert "skip" not in visited
+    assert "inner" not in visited
+
+
+def test_walk_tree_does_not_follow_directory_symlinks(tmp_path: Path):
+    target = tmp_path / "real"
+    target.mkdir()
+    (target / "file.txt").touch()
+    os.symlink(target, tmp_path / "link", target_is_directory=True)
+
+    roots = [Path(root).name for root, _, _ in walk_tree(tmp_path)]
+
+    assert roots.count("real") == 1
+    assert "link" not in roots
+
+
+def test_walk_tree_missing_root_yields_nothing(tmp_path: Path):
+    assert list(walk_tree(tmp_path / "missing")) == []
@@ -1,7 +1,8 @@
-import os
 from pathlib import Path
 from typing import List
 
+from utils.tree_walk import walk_tree
+
 class RepoFinder:
     """
     A utility class to discover Git repositories within a given directory structure.
@@ -16,8 +17,9 @@ class RepoFinder:
         it records the path to its parent directory (the repository root). The traversal
         is then pruned to prevent descending into submodules.
 
-        Ref: `os.walk` allows for in-place modification of the `dirs` list to control
-        the traversal path. See: https://docs.python.org/3/library/os.html#os.walk
+        The walk uses `utils.tree_walk.walk_tree`, which (like `os.walk`) allows
+        in-place modification of the `dirs` list to control the traversal path,
+        and reuses scandir's cached entry types instead of re-statting.
 
         Args:
             base_dir: The starting directory for the repository search.
@@ -32,11 +34,11 @@ class RepoFinder:
             print(f"Error: Provided path '{base_dir}' is not a directory.")
             return repo_paths
 
-        for root, dirs, _ in os.walk(base_dir):
-            if "__MACOSX" in root:
-                continue
+        for root, dirs, _ in walk_tree(base_dir):
+            # Skip macOS archive metadata without walking it.
+            dirs[:] = [d for d in dirs if d.name != "__MACOSX"]
 
-            if ".git" in dirs:
+            if any(d.name == ".git" for d in dirs):
                 repo_path = Path(root)
                 print(f"Found Git repository at: {repo_path}")
                 repo_paths.append(repo_path)
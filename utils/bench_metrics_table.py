@@ -0,0 +1,87 @@
+"""
+Times how SkillAnalyzer aggregates per-file code metrics: the per-object loops
+it ran before metrics_table.py against one MetricsTable and its slice
+reductions. The files under a directory (this repository by default) are
+analyzed once up front, so only aggregation is timed:
+
+    python3 -m utils.bench_metrics_table [path/to/project]
+"""
+
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from src.analyzers.code_metrics_analyzer import CodeFileAnalysis, CodeMetricsAnalyzer
+from src.analyzers.metrics_table import MetricsTable
+from utils.bench_code_lexer import best_of
+
+
+def legacy_aggregate(analyses: List[CodeFileAnalysis]) -> None:
+    """The summary, per-language LOC and Python line count, one object at a time."""
+    sum(a.code_lines for a in analyses)
+    sum(a.function_count for a in analyses)
+    sum(a.total_function_lines for a in analyses)
+    max((a.max_function_length for a in analyses), default=0)
+    sum(1 for a in analyses if not a.is_test)
+    sum(1 for a in analyses if a.is_test)
+    sum(a.comment_lines for a in analyses)
+    sum(a.code_lines for a in analyses)
+
+    per_language: Dict[str, Dict[str, Any]] = {}
+    for a in analyses:
+        stats = per_language.setdefault(
+            a.language or "Unknown",
+            {"file_count": 0, "loc": 0, "functions": 0, "comment_lines": 0,
+             "test_file_count": 0, "max_function_length": 0},
+        )
+        stats["file_count"] += 1
+        stats["loc"] += a.code_lines
+        stats["functions"] += a.function_count
+        stats["comment_lines"] += a.comment_lines
+        if a.is_test:
+            stats["test_file_count"] += 1
+        stats["max_function_length"] = max(stats["max_function_length"], a.max_function_length)
+
+    loc_per_lang: Dict[str, int] = {}
+    for a in analyses:
+        if a.language:
+            loc_per_lang[a.language] = loc_per_lang.get(a.language, 0) + a.total_lines
+    sum(a.total_lines for a in analyses if a.language == "Python")
+
+
+def table_aggregate(analyses: List[CodeFileAnalysis]) -> None:
+    """What SkillAnalyzer does now: build the table once, then reduce it."""
+    table = MetricsTable.from_analyses(analyses)
+    table.summarize()
+    table.language_totals("total_lines")
+
+
+def run_benchmark(root: str = ".") -> Dict[str, float]:
+    """Time both aggregations, plus re-summarizing an already built table."""
+    analyses = CodeMetricsAnalyzer(Path(root), workers=1).analyze()
+    table = MetricsTable.from_analyses(analyses)
+    results = {
+        "files": len(analyses),
+        "legacy_ms": best_of(legacy_aggregate, [analyses]),
+        "table_ms": best_of(table_aggregate, [analyses]),
+        "resummarize_ms": best_of(lambda t: t.summarize(), [table]),
+    }
+    print_summary(results)
+    return results
+
+
+def print_summary(results: Dict[str, float]) -> None:
+    """Print a formatted table of benchmark results."""
+    print(f"{'='*50}")
+    print(f"{'files':<22}{results['files']:>10}")
+    for key, label in (
+        ("legacy_ms", "per-object loops ms"),
+        ("table_ms", "metrics table ms"),
+        ("resummarize_ms", "re-summarize ms"),
+    ):
+        print(f"{label:<22}{results[key]:>10.3f}")
+    print(f"{'='*50}\n")
+
+
+if __name__ == '__main__':
+    run_benchmark(sys.argv[1] if len(sys.argv) > 1 else ".")
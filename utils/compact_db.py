@@ -0,0 +1,40 @@
+"""
+Compacts the analysis database offline: drops file hashes that no remaining
+project references and rebuilds the file to give the space back.
+
+Deleting a project already drops its file hashes; this cleans up what was left
+by older versions or interrupted uploads. Run it while the API is stopped:
+
+    python3 -m utils.compact_db [path/to/projects.db]
+"""
+
+import sys
+from pathlib import Path
+from typing import Dict
+
+from src.managers.FileHashManager import FileHashManager
+
+
+def run_compaction(db_path: str = "projects.db") -> Dict[str, int]:
+    """Compact `db_path` and return what was freed (see FileHashManager.compact)."""
+    if not Path(db_path).exists():
+        print(f"Nothing to compact - {db_path} doesn't exist")
+        return {"links": 0, "hashes": 0, "bytes": 0}
+
+    print(f"\nCompacting {db_path}...\n")
+    freed = FileHashManager(db_path).compact()
+    print_summary(db_path, freed)
+    return freed
+
+
+def print_summary(db_path: str, freed: Dict[str, int]) -> None:
+    """Print a formatted summary of compaction results."""
+    print(f"{'='*50}")
+    print(f"🗑️  Removed {freed['links']} stale project links")
+    print(f"🗑️  Removed {freed['hashes']} unreferenced file hashes")
+    print(f"✨ Reclaimed {freed['bytes'] / 1024:.1f} KB from {db_path}")
+    print(f"{'='*50}\n")
+
+
+if __name__ == '__main__':
+    run_compaction(sys.argv[1] if len(sys.argv) > 1 else "projects.db")
@@ -0,0 +1,48 @@
+"""
+Moves the analysis store (projects, reports, config and file hashes) between
+machines, e.g. to seed a new deployment after 'python3 -m utils.analyze_repos'.
+
+Run from the directory holding the databases:
+
+    python3 -m utils.transfer_store export analysis-store.ndjson
+    python3 -m utils.transfer_store import analysis-store.ndjson
+
+Importing upserts projects by name, so it can be repeated.
+"""
+
+import sys
+from typing import Dict
+
+from src.services.transfer_service import export_ndjson, import_ndjson
+
+
+def export_store(out_path: str) -> int:
+    """Write the store to `out_path` as NDJSON; returns the number of rows written."""
+    count = 0
+    with open(out_path, "w", encoding="utf-8") as out:
+        # The first line is the format header
+        for count, line in enumerate(export_ndjson()):
+            out.write(line)
+    print(f"✅ Exported {count} rows to {out_path}")
+    return count
+
+
+def import_store(in_path: str) -> Dict[str, int]:
+    """Import an export written by export_store(); returns the rows imported per table."""
+    with open(in_path, "rb") as source:
+        counts = import_ndjson(source)
+    print(f"\n{'='*50}")
+    for table, count in counts.items():
+        print(f"  {table}: {count}")
+    print(f"{'='*50}\n")
+    return counts
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3 or sys.argv[1] not in ("export", "import"):
+        print("Usage: python3 -m utils.transfer_store export|import <file.ndjson>")
+        sys.exit(1)
+    if sys.argv[1] == "export":
+        export_store(sys.argv[2])
+    else:
+        import_store(sys.argv[2])
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Iterator, List, Tuple, Union
+
+
+def walk_tree(
+    root: Union[str, Path],
+) -> Iterator[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]:
+    """
+    Top-down directory walk built on os.scandir.
+
+    Yields (dirpath, dir_entries, file_entries) like os.walk, but hands back
+    the DirEntry objects so callers can use their cached type information
+    instead of calling stat again. Removing entries from dir_entries in place
+    prunes them before they are descended into.
+
+    Symlinked directories are not followed; symlinked files are reported
+    with the other files. Unreadable directories are skipped silently,
+    matching os.walk's default.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        top = stack.pop()
+        dirs: List[os.DirEntry] = []
+        files: List[os.DirEntry] = []
+        try:
+            with os.scandir(top) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry)
+                        elif entry.is_file():
+                            files.append(entry)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+        yield top, dirs, files
+
+        # Reverse so subdirectories are visited in listing order
+        stack.extend(entry.path for entry in reversed(dirs))